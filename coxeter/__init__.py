@@ -13,9 +13,47 @@ is especially designed for calculations of interest in physics-based
 applications such as inertia tensors.
 """
 
-from . import families, shapes
-from .shape_getters import from_gsd_type_shapes
+import importlib
 
-__all__ = ["families", "shapes", "from_gsd_type_shapes"]
+__all__ = [
+    "families",
+    "io",
+    "shapes",
+    "from_gsd_type_shapes",
+    "from_gsd_type_shapes_batch",
+]
 
 __version__ = "0.4.0"
+
+
+# The subpackages depend on scipy, which is slow to import, so they are only
+# loaded when first accessed. This keeps "import coxeter" cheap for scripts
+# that only need a small part of the package.
+_LAZY_ATTRIBUTES = {
+    "families": ("coxeter.families", None),
+    "io": ("coxeter.io", None),
+    "shapes": ("coxeter.shapes", None),
+    "from_gsd_type_shapes": ("coxeter.shape_getters", "from_gsd_type_shapes"),
+    "from_gsd_type_shapes_batch": (
+        "coxeter.shape_getters",
+        "from_gsd_type_shapes_batch",
+    ),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        ) from None
+    value = importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,3 @@
+from .batch import is_simple_batch
+
+__all__ = ["is_simple_batch"]
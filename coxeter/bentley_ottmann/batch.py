@@ -0,0 +1,155 @@
+"""Check many polygons for self-intersections at once.
+
+The sweep line implementation in :mod:`~.poly_point_isect` scales well with the
+number of segments, but its setup cost is dominated by pure Python bookkeeping.
+For the small polygons that make up the bulk of most datasets, it is much
+cheaper to test all pairs of nonadjacent edges directly in NumPy. This module
+groups polygons by vertex count and performs those all-pairs tests in a
+vectorized fashion, falling back to the sweep for large polygons.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from . import poly_point_isect
+
+# The maximum number of segment pairs to test in a single vectorized block.
+# This bounds the size of the temporary arrays regardless of the input size.
+_MAX_PAIRS_PER_BLOCK = 2 ** 20
+
+
+@lru_cache(maxsize=None)
+def _nonadjacent_edge_pairs(num_vertices):
+    """Get the indices of all pairs of nonadjacent edges of an n-gon.
+
+    Edge :math:`i` connects vertices :math:`i` and :math:`i+1`. Adjacent edges
+    share a vertex and can never properly intersect, so they are excluded.
+
+    Args:
+        num_vertices (int):
+            The number of vertices (and edges) of the polygon.
+
+    Returns:
+        tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`):
+            The indices of the first and second edge of each pair.
+    """
+    first, second = np.triu_indices(num_vertices, k=2)
+    keep = ~((first == 0) & (second == num_vertices - 1))
+    return first[keep], second[keep]
+
+
+def _cross_2d(a, b):
+    """Compute the z component of the cross product of 2D vectors."""
+    return a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0]
+
+
+def _is_simple_vectorized(vertices):
+    """Check a stack of equally sized polygons for self-intersections.
+
+    The criteria for an intersection mirror those used by
+    :func:`~.poly_point_isect.isect_polygon`: parallel segments never
+    intersect, and intersections located at an endpoint of both segments are
+    ignored.
+
+    Args:
+        vertices (:math:`(N_{polygons}, N_{vertices}, 2)` :class:`numpy.ndarray`):
+            The vertices of the polygons.
+
+    Returns:
+        :math:`(N_{polygons}, )` :class:`numpy.ndarray` of bool:
+            Whether each polygon is simple.
+    """
+    num_polygons, num_vertices = vertices.shape[:2]
+    result = np.ones(num_polygons, dtype=bool)
+    first, second = _nonadjacent_edge_pairs(num_vertices)
+    if len(first) == 0:
+        return result
+
+    block_size = max(1, _MAX_PAIRS_PER_BLOCK // len(first))
+    for start in range(0, num_polygons, block_size):
+        verts = vertices[start : start + block_size]
+        edges = np.roll(verts, shift=-1, axis=1) - verts
+
+        a0, da = verts[:, first], edges[:, first]
+        b0, db = verts[:, second], edges[:, second]
+
+        # Solve a0 + t * da = b0 + u * db for the segment parameters t and u.
+        denominator = _cross_2d(da, db)
+        parallel = denominator == 0
+        denominator[parallel] = 1
+        offsets = b0 - a0
+        t = _cross_2d(offsets, db) / denominator
+        u = _cross_2d(offsets, da) / denominator
+
+        intersects = (~parallel) & (t >= 0) & (t <= 1) & (u >= 0) & (u <= 1)
+
+        # Ignore intersections that are within NUM_EPS of an endpoint of both
+        # segments, consistent with USE_IGNORE_SEGMENT_ENDINGS in the sweep.
+        eps = poly_point_isect.NUM_EPS
+        at_end_a = (
+            np.minimum(np.abs(t), np.abs(1 - t)) * np.linalg.norm(da, axis=-1) < eps
+        )
+        at_end_b = (
+            np.minimum(np.abs(u), np.abs(1 - u)) * np.linalg.norm(db, axis=-1) < eps
+        )
+        intersects &= ~(at_end_a & at_end_b)
+
+        result[start : start + block_size] = ~np.any(intersects, axis=1)
+    return result
+
+
+def is_simple_batch(polygons, max_vectorized_vertices=64):
+    """Check whether each of a collection of polygons is simple.
+
+    A polygon is simple if none of its edges intersect. Polygons are grouped
+    by their number of vertices. Groups of polygons with at most
+    ``max_vectorized_vertices`` vertices are tested with vectorized all-pairs
+    segment intersection tests, while larger polygons are tested individually
+    using the Bentley-Ottmann sweep line algorithm.
+
+    Only the first two coordinates of each vertex are used, so polygons
+    embedded in 3D must first be rotated into the :math:`xy` plane.
+
+    Args:
+        polygons (sequence of :math:`(N_i, 2)` or :math:`(N_i, 3)` array-like):
+            The polygons to check. May also be provided as a single
+            :math:`(N_{polygons}, N_{vertices}, 2)` or
+            :math:`(N_{polygons}, N_{vertices}, 3)` array if all polygons have
+            the same number of vertices.
+        max_vectorized_vertices (int):
+            The largest number of vertices for which the vectorized algorithm
+            is used (Default value: 64).
+
+    Returns:
+        :math:`(N_{polygons}, )` :class:`numpy.ndarray` of bool:
+            Whether each polygon is simple.
+
+    Example:
+        >>> from coxeter.bentley_ottmann import is_simple_batch
+        >>> square = [[0, 0], [1, 0], [1, 1], [0, 1]]
+        >>> bowtie = [[0, 0], [1, 1], [1, 0], [0, 1]]
+        >>> is_simple_batch([square, bowtie])
+        array([ True, False])
+
+    """
+    if isinstance(polygons, np.ndarray) and polygons.ndim == 3:
+        polygons = polygons[..., :2].astype(np.float64)
+        lengths = np.full(len(polygons), polygons.shape[1])
+    else:
+        polygons = [np.asarray(p, dtype=np.float64)[:, :2] for p in polygons]
+        lengths = np.array([len(p) for p in polygons], dtype=int)
+
+    result = np.ones(len(polygons), dtype=bool)
+    for num_vertices in np.unique(lengths):
+        indices = np.flatnonzero(lengths == num_vertices)
+        if num_vertices <= max_vectorized_vertices:
+            if isinstance(polygons, np.ndarray):
+                group = polygons[indices]
+            else:
+                group = np.stack([polygons[i] for i in indices])
+            result[indices] = _is_simple_vectorized(group)
+        else:
+            for i in indices:
+                result[i] = len(poly_point_isect.isect_polygon(polygons[i])) == 0
+    return result
@@ -14,7 +14,8 @@ associated with different scientific publications. This dataset is useful for
 reproducing the exact set of shapes from publications.
 """
 
-from .common import PlatonicFamily, RegularNGonFamily
+from . import common
+from .common import RegularNGonFamily
 from .doi_data_repositories import _doi_shape_collection_factory, _KeyedDefaultDict
 from .plane_shape_families import (
     Family323Plus,
@@ -56,3 +57,15 @@ __all__ = [
     "TabulatedGSDShapeFamily",
     "TruncatedTetrahedronFamily",
 ]
+
+
+def __getattr__(name):
+    # The PlatonicFamily is constructed lazily, see common.py.
+    if name == "PlatonicFamily":
+        family = globals()["PlatonicFamily"] = common.PlatonicFamily
+        return family
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
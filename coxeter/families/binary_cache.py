@@ -0,0 +1,211 @@
+"""Store precomputed convex polyhedra of tabulated datasets in binary files.
+
+Constructing a :class:`~coxeter.shapes.ConvexPolyhedron` requires computing a
+convex hull and merging its facets into faces, which dominates the cost of
+generating shapes from tabulated datasets. Since the shapes in a dataset never
+change, the resulting faces, plane equations, and face neighbors of all shapes
+in a dataset can be computed once and stored on disk in the format of
+:func:`coxeter.io.save_shapes`. Later sessions memory-map these arrays and
+construct shapes without any hull computation.
+
+Cache entries are keyed by a hash of the source data file and the version of
+coxeter, so modifying the source file or upgrading coxeter automatically
+invalidates the cache. The cache is stored in the directory given by the
+``COXETER_CACHE_DIR`` environment variable, defaulting to ``coxeter`` within
+the user's cache directory. If the cache cannot be written, the precomputed
+data is simply kept in memory.
+
+Since the cache writes to disk, it is disabled by default. Tabulated families
+opt in with the ``binary_cache`` argument of
+:meth:`~coxeter.families.TabulatedGSDShapeFamily.from_json_file`, while the
+datasets bundled with coxeter use the cache if the ``COXETER_BINARY_CACHE``
+environment variable is set to a value other than ``0``.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+from .. import __version__
+from ..io import ShapeArchive, _pack_shapes, _write_archive, load_shapes
+from ..shapes import ConvexPolyhedron
+
+# Increment whenever the layout of the stored data changes.
+_FORMAT_VERSION = 2
+
+
+def get_cache_dir():
+    """Get the directory in which binary caches are stored.
+
+    Returns:
+        str: The cache directory.
+    """
+    if "COXETER_CACHE_DIR" in os.environ:
+        return os.environ["COXETER_CACHE_DIR"]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "coxeter")
+
+
+def binary_cache_enabled():
+    """Check whether the bundled datasets should use the binary cache.
+
+    Returns:
+        bool: Whether the ``COXETER_BINARY_CACHE`` environment variable is set
+        to a value other than ``0``.
+    """
+    return os.environ.get("COXETER_BINARY_CACHE", "0") not in ("", "0")
+
+
+def _is_cacheable(params):
+    """Check whether a GSD shape spec produces a convex polyhedron."""
+    return params.get("type") == "ConvexPolyhedron" and "rounding_radius" not in params
+
+
+class PackedShapeTable:
+    """Precomputed convex polyhedra stored as a shape archive.
+
+    The shapes are stored in the format of :func:`coxeter.io.save_shapes`,
+    along with the keys of the shapes in the dataset.
+
+    Args:
+        keys (list(str)):
+            The keys of the shapes in the table, in storage order.
+        shapes (:class:`~coxeter.io.ShapeArchive`):
+            The shapes. The archive must copy the data of each shape it
+            returns, since cached data must never be modified.
+    """
+
+    def __init__(self, keys, shapes):
+        self.keys = list(keys)
+        self.shapes = shapes
+        self._index = {key: i for i, key in enumerate(self.keys)}
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __len__(self):
+        return len(self.keys)
+
+    @classmethod
+    def from_mapping(cls, mapping):
+        """Precompute the convex polyhedra in a mapping of GSD shape specs.
+
+        Entries that do not describe a convex polyhedron are skipped.
+
+        Args:
+            mapping (Mapping):
+                A dict-like object containing valid shape definitions.
+
+        Returns:
+            :class:`PackedShapeTable`: The table of precomputed shapes.
+        """
+        keys = [key for key, params in mapping.items() if _is_cacheable(params)]
+        arrays = _pack_shapes(
+            ConvexPolyhedron(mapping[key]["vertices"]) for key in keys
+        )
+        return cls(keys, ShapeArchive(arrays, copy=True))
+
+    def save(self, directory):
+        """Write the table to a directory.
+
+        Args:
+            directory (str):
+                The directory to write to, which must not exist yet.
+        """
+        os.makedirs(directory)
+        with open(os.path.join(directory, "keys.json"), "w") as f:
+            json.dump(self.keys, f)
+        _write_archive(self.shapes._arrays, directory)
+
+    @classmethod
+    def load(cls, directory):
+        """Memory-map a table written by :meth:`save`.
+
+        Args:
+            directory (str):
+                The directory to read from.
+
+        Returns:
+            :class:`PackedShapeTable`: The table of precomputed shapes.
+        """
+        with open(os.path.join(directory, "keys.json")) as f:
+            keys = json.load(f)
+        return cls(keys, load_shapes(directory, mmap_mode="r", copy=True))
+
+    def get_shape(self, key):
+        """Construct a shape from the precomputed data.
+
+        Args:
+            key (str):
+                The key of the desired shape.
+
+        Returns:
+            :class:`~coxeter.shapes.ConvexPolyhedron`: The requested shape.
+        """
+        return self.shapes[self._index[key]]
+
+
+def _hash_file(filename):
+    """Compute the SHA-256 hash of a file's contents."""
+    digest = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_packed_table(filename, mapping, cache_dir=None):
+    """Get the precomputed shapes of a dataset, using the cache if possible.
+
+    If a cache entry for the current contents of ``filename`` and the current
+    version of coxeter exists, it is
+    memory-mapped. Otherwise the shapes are precomputed from ``mapping`` and
+    written to the cache for subsequent sessions.
+
+    Args:
+        filename (str):
+            The JSON file that ``mapping`` was read from, used to version the
+            cache entry.
+        mapping (Mapping):
+            The parsed contents of ``filename``.
+        cache_dir (str, optional):
+            The cache directory. If None, :func:`get_cache_dir` is used
+            (Default value: None).
+
+    Returns:
+        :class:`PackedShapeTable`: The table of precomputed shapes.
+    """
+    if cache_dir is None:
+        cache_dir = get_cache_dir()
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    directory = os.path.join(
+        cache_dir,
+        "{}-{}-{}-v{}".format(
+            stem, _hash_file(filename)[:16], __version__, _FORMAT_VERSION
+        ),
+    )
+    if os.path.isdir(directory):
+        try:
+            return PackedShapeTable.load(directory)
+        except (OSError, ValueError):
+            # Fall back to recomputing if the entry is corrupted.
+            pass
+
+    table = PackedShapeTable.from_mapping(mapping)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temporary directory first so that concurrent readers
+        # never observe a partially written entry.
+        staging = tempfile.mkdtemp(dir=cache_dir)
+        try:
+            table.save(os.path.join(staging, "table"))
+            os.replace(os.path.join(staging, "table"), directory)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+    except OSError:
+        pass
+    return table
@@ -5,6 +5,7 @@ import os
 import numpy as np
 
 from ..shapes import ConvexPolygon
+from .binary_cache import binary_cache_enabled
 from .doi_data_repositories import _DATA_FOLDER
 from .shape_family import ShapeFamily
 from .tabulated_shape_family import TabulatedGSDShapeFamily
@@ -69,14 +70,25 @@ class RegularNGonFamily(ShapeFamily):
         return pos
 
 
-PlatonicFamily = TabulatedGSDShapeFamily.from_json_file(
-    os.path.join(_DATA_FOLDER, "platonic.json"),
-    classname="PlatonicFamily",
-    docstring="""The family of Platonic solids.
+def _make_platonic_family():
+    """Read the Platonic solids dataset into a shape family."""
+    return TabulatedGSDShapeFamily.from_json_file(
+        os.path.join(_DATA_FOLDER, "platonic.json"),
+        binary_cache=binary_cache_enabled(),
+        classname="PlatonicFamily",
+        docstring="""The family of Platonic solids.
 
 The following parameters are required by this class:
 
     - name: The name of the Platonic solid. Options are "Cube", "Dodecahedron", \
             "Icosahedron", "Octahedron", and "Tetrahedron".
 """,
-)
+    )
+
+
+def __getattr__(name):
+    # The PlatonicFamily is only read from its data file when first accessed.
+    if name == "PlatonicFamily":
+        family = globals()["PlatonicFamily"] = _make_platonic_family()
+        return family
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -11,6 +11,7 @@ which maps DOIs to a list of associated shape families.
 import os
 from collections import defaultdict
 
+from .binary_cache import binary_cache_enabled
 from .plane_shape_families import (
     Family323Plus,
     Family423,
@@ -46,7 +47,10 @@ def _doi_shape_collection_factory(doi):
     if doi in _DOI_TO_FILE:
         for fn in _DOI_TO_FILE[doi]:
             families.append(
-                TabulatedGSDShapeFamily.from_json_file(os.path.join(_DATA_FOLDER, fn))
+                TabulatedGSDShapeFamily.from_json_file(
+                    os.path.join(_DATA_FOLDER, fn),
+                    binary_cache=binary_cache_enabled(),
+                )
             )
     if doi in _DOI_TO_FAMILY:
         for family_type in _DOI_TO_FAMILY[doi]:
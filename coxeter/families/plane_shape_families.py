@@ -5,12 +5,260 @@ intersection of half spaces defined by a set of planes. The families here are
 generally taken from :cite:`Chen2014` and :cite:`Damasceno2012`.
 """
 
+import itertools
+
 import numpy as np
 from scipy.constants import golden_ratio
 
-from ..shapes import ConvexPolyhedron
+from ..shapes import ConvexPolyhedron, Polyhedron
+from ..shapes.polyhedron import _flatten_faces, _split_faces
 from .shape_family import ShapeFamily
 
+# The tolerance used to identify singular systems and points beyond planes.
+_THRESHOLD = 1e-6
+
+# The number of parameter sets that share a pruned set of plane triples, and
+# the maximum number of vertex-plane comparisons performed at once, when
+# generating vertices for many parameters.
+_PARAMETERS_PER_BLOCK = 64
+_MAX_ENTRIES_PER_BLOCK = 2 ** 22
+
+
+def _broadcast_parameters(a, b, c):
+    """Broadcast the a, b, and c parameters into an :math:`(N, 3)` array."""
+    return np.stack([np.ravel(x) for x in np.broadcast_arrays(a, b, c)], axis=1).astype(
+        np.float64
+    )
+
+
+def _group_parameters(dists):
+    """Order parameters such that consecutive blocks are close together.
+
+    The parameter space is divided into a grid of cells that each contain
+    roughly :data:`_PARAMETERS_PER_BLOCK` parameter sets on average, and the
+    parameters are sorted by cell.
+
+    Args:
+        dists (:math:`(N_{params}, 3)` :class:`numpy.ndarray`):
+            The parameters.
+
+    Returns:
+        :math:`(N_{params}, )` :class:`numpy.ndarray`:
+            The indices that sort the parameters.
+    """
+    lower = dists.min(axis=0)
+    span = dists.max(axis=0) - lower
+    num_varying = max(1, np.count_nonzero(span))
+    num_cells = np.ceil((len(dists) / _PARAMETERS_PER_BLOCK) ** (1 / num_varying))
+    span[span == 0] = 1
+    cells = np.minimum((dists - lower) / span * num_cells, num_cells - 1).astype(int)
+    return np.lexsort(np.concatenate((dists, cells), axis=1).T[::-1])
+
+
+def _make_face_template(shape, on_planes, keys, order):
+    """Express the faces of a shape in terms of its topology.
+
+    Args:
+        shape (:class:`~coxeter.shapes.ConvexPolyhedron`):
+            The shape.
+        on_planes (:math:`(N_{vertices}, N_{planes})` :class:`numpy.ndarray`):
+            Whether each vertex lies on each plane.
+        keys (:math:`(N_{vertices}, N_{bytes})` :class:`numpy.ndarray`):
+            The packed rows of ``on_planes``.
+        order (:math:`(N_{vertices}, )` :class:`numpy.ndarray`):
+            The indices that sort the vertices by ``keys``.
+
+    Returns:
+        tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`) or None:
+            The flattened faces in terms of the rank of each vertex in
+            ``order`` and the offsets of each face, or None if the faces cannot
+            be reused for other shapes with the same topology. This happens
+            when two vertices lie on the same planes or when the vertices of a
+            face do not all lie on a common plane.
+    """
+    sorted_keys = keys[order]
+    if np.any(np.all(sorted_keys[1:] == sorted_keys[:-1], axis=1)):
+        return None
+    indices, _, offsets, _ = _flatten_faces(shape.faces)
+    common_planes = np.logical_and.reduceat(on_planes[indices], offsets[:-1])
+    if not np.all(np.any(common_planes, axis=1)):
+        return None
+    ranks = np.empty_like(order)
+    ranks[order] = np.arange(len(order))
+    return ranks[indices], offsets
+
+
+def _compute_properties(vertices, dists, planes, plane_types):
+    """Compute geometric properties of polyhedra from their half spaces.
+
+    The faces of each polyhedron are the planes containing at least three of
+    its vertices, and the edges are the pairs of faces sharing at least two
+    vertices. Since the normals and distances of the faces are known, no
+    convex hulls need to be computed, and all polyhedra are processed at once.
+
+    Args:
+        vertices (list(:math:`(N_{vertices}, 3)` :class:`numpy.ndarray`)):
+            The vertices of each polyhedron.
+        dists (:math:`(N_{params}, 3)` :class:`numpy.ndarray`):
+            The a, b, and c parameters of each polyhedron.
+        planes (:math:`(N_{planes}, 3)` :class:`numpy.ndarray`):
+            The plane normals.
+        plane_types (:math:`(N_{planes}, )` :class:`numpy.ndarray`):
+            The parameter used by each plane.
+
+    Returns:
+        tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`):
+            The volume, surface area, and mean curvature of each polyhedron.
+    """  # noqa: E501
+    num_shapes, num_planes = len(dists), len(planes)
+    counts = np.array([len(verts) for verts in vertices])
+    vertex_offsets = np.concatenate(([0], np.cumsum(counts)))
+    vertex_shapes = np.repeat(np.arange(num_shapes), counts)
+    points = np.concatenate(vertices)
+    plane_norms = np.linalg.norm(planes, axis=1)
+    unit_normals = planes / plane_norms[:, np.newaxis]
+    plane_dists = dists[:, plane_types]
+
+    # Identify the planes that contain a face of each shape.
+    on_planes = np.abs(points @ planes.T - plane_dists[vertex_shapes]) <= _THRESHOLD
+    is_face = np.add.reduceat(on_planes, vertex_offsets[:-1], axis=0) >= 3
+    on_planes &= is_face[vertex_shapes]
+
+    # Sort the vertices of each face counterclockwise about its normal.
+    entry_vertices, entry_planes = np.nonzero(on_planes)
+    face_keys, entry_faces = np.unique(
+        vertex_shapes[entry_vertices] * num_planes + entry_planes, return_inverse=True
+    )
+    face_shapes, face_planes = np.divmod(face_keys, num_planes)
+    order = np.argsort(entry_faces, kind="stable")
+    entry_vertices, entry_faces = entry_vertices[order], entry_faces[order]
+    face_counts = np.bincount(entry_faces)
+    face_offsets = np.concatenate(([0], np.cumsum(face_counts)))
+    face_normals = unit_normals[face_planes]
+
+    face_points = points[entry_vertices]
+    centers = (
+        np.add.reduceat(face_points, face_offsets[:-1]) / face_counts[:, np.newaxis]
+    )
+    relative = face_points - centers[entry_faces]
+    x_axes = relative[face_offsets[:-1]]
+    x_axes /= np.linalg.norm(x_axes, axis=1)[:, np.newaxis]
+    y_axes = np.cross(face_normals, x_axes)
+    angles = np.arctan2(
+        np.sum(relative * y_axes[entry_faces], axis=1),
+        np.sum(relative * x_axes[entry_faces], axis=1),
+    )
+    order = np.lexsort((angles, entry_faces))
+    relative = relative[order]
+
+    # Compute face areas with the shoelace formula, and the volume as the sum
+    # of the pyramids formed by the faces and the origin.
+    next_positions = np.arange(1, len(relative) + 1)
+    next_positions[face_offsets[1:] - 1] = face_offsets[:-1]
+    face_areas = 0.5 * np.sum(
+        np.add.reduceat(np.cross(relative, relative[next_positions]), face_offsets[:-1])
+        * face_normals,
+        axis=1,
+    )
+    face_heights = plane_dists[face_shapes, face_planes] / plane_norms[face_planes]
+    surface_area = np.bincount(face_shapes, face_areas, minlength=num_shapes)
+    volume = np.bincount(
+        face_shapes, face_areas * face_heights / 3, minlength=num_shapes
+    )
+
+    # Find the edges as pairs of faces sharing at least two vertices by
+    # enumerating all pairs of faces meeting at each vertex.
+    vertex_counts = np.bincount(entry_vertices, minlength=len(points))
+    order = np.argsort(entry_vertices, kind="stable")
+    slots = np.arange(len(order)) - np.repeat(
+        np.cumsum(vertex_counts) - vertex_counts, vertex_counts
+    )
+    vertex_planes = np.full((len(points), max(vertex_counts.max(), 2)), -1)
+    vertex_planes[entry_vertices[order], slots] = face_planes[entry_faces[order]]
+    first_slots, second_slots = np.triu_indices(vertex_planes.shape[1], k=1)
+    first_planes = vertex_planes[:, first_slots].ravel()
+    second_planes = vertex_planes[:, second_slots].ravel()
+    pair_vertices = np.repeat(np.arange(len(points)), len(first_slots))
+    valid = (first_planes >= 0) & (second_planes >= 0)
+    first_planes, second_planes = first_planes[valid], second_planes[valid]
+    pair_vertices = pair_vertices[valid]
+
+    edge_keys, pair_edges = np.unique(
+        (vertex_shapes[pair_vertices] * num_planes + first_planes) * num_planes
+        + second_planes,
+        return_inverse=True,
+    )
+    edge_shapes = edge_keys // num_planes ** 2
+    edge_first = (edge_keys // num_planes) % num_planes
+    edge_second = edge_keys % num_planes
+
+    # The length of each edge is the extent of its vertices along it, and the
+    # exterior angle is the angle between the face normals.
+    directions = np.cross(unit_normals[edge_first], unit_normals[edge_second])
+    directions /= np.linalg.norm(directions, axis=1)[:, np.newaxis]
+    projections = np.sum(points[pair_vertices] * directions[pair_edges], axis=1)
+    order = np.argsort(pair_edges, kind="stable")
+    edge_offsets = np.concatenate(([0], np.cumsum(np.bincount(pair_edges))))
+    lengths = np.maximum.reduceat(
+        projections[order], edge_offsets[:-1]
+    ) - np.minimum.reduceat(projections[order], edge_offsets[:-1])
+    exterior_angles = np.arccos(
+        np.clip(
+            np.sum(unit_normals[edge_first] * unit_normals[edge_second], axis=1), -1, 1
+        )
+    )
+    mean_curvature = np.bincount(
+        edge_shapes, lengths * exterior_angles, minlength=num_shapes
+    ) / (8 * np.pi)
+    return volume, surface_area, mean_curvature
+
+
+def _intersect_planes(dists, matrices, planes, plane_types):
+    """Find the vertices of polyhedra defined by planes at various distances.
+
+    Args:
+        dists (:math:`(N_{params}, 3)` :class:`numpy.ndarray`):
+            The a, b, and c parameters of each polyhedron.
+        matrices (:math:`(N_{triples}, 3, 3)` :class:`numpy.ndarray`):
+            The matrices mapping parameters to plane intersections, see
+            :meth:`TruncationPlaneShapeFamily._get_plane_intersections`.
+        planes (:math:`(N_{planes}, 3)` :class:`numpy.ndarray`):
+            The plane normals.
+        plane_types (:math:`(N_{planes}, )` :class:`numpy.ndarray`):
+            The parameter used by each plane.
+
+    Returns:
+        list(:math:`(N_{vertices}, 3)` :class:`numpy.ndarray`):
+            The vertices of each polyhedron.
+    """
+    # To identify the vertices of the shape, we find the points that
+    # simultaneously satisfy three plane equations, i.e. points of
+    # intersection of the planes at the specified distances.
+    xs = np.einsum("tij,pj->pti", matrices, dists)
+
+    # Reject any solutions that are intersections that lie beyond at least one
+    # of the bounding planes.
+    dots = xs @ planes.T
+    alldists = dists[:, plane_types]
+    dist_filter = (dots <= alldists[:, np.newaxis, :] + _THRESHOLD).all(axis=2)
+    point_ids, triple_ids = np.nonzero(dist_filter)
+    passed_plane_test = xs[point_ids, triple_ids]
+
+    # Identify unique vertices.  We don't want to lose precision in the
+    # vertices to ensure that the convex hull ends up finding the right faces,
+    # so get the unique indices based on rounding but then use the original
+    # vertices.
+    rounded = passed_plane_test.round(6)
+    order = np.lexsort((rounded[:, 2], rounded[:, 1], rounded[:, 0], point_ids))
+    rounded, point_ids = rounded[order], point_ids[order]
+    unique = np.ones(len(order), dtype=bool)
+    unique[1:] = np.any(rounded[1:] != rounded[:-1], axis=1) | (
+        point_ids[1:] != point_ids[:-1]
+    )
+    verts = passed_plane_test[order[unique]]
+    counts = np.bincount(point_ids[unique], minlength=len(dists))
+    return np.split(verts, np.cumsum(counts)[:-1])
+
 
 class TruncationPlaneShapeFamily(ShapeFamily):
     """A shape famly defined by plane half-space intersections.
@@ -61,6 +309,57 @@ class TruncationPlaneShapeFamily(ShapeFamily):
         """
         return cls._plane_types
 
+    @classmethod
+    def _get_plane_intersections(cls):
+        r"""Get the data required to intersect all triples of planes.
+
+        Every candidate vertex of a shape is the intersection of three planes,
+        which is the solution :math:`x = A^{-1} d` of a linear system whose
+        coefficient matrix :math:`A` only depends on the plane normals. The
+        inverses of all nonsingular coefficient matrices are therefore computed
+        once per family and combined with the selection of the distance
+        parameter used by each plane, so that the intersections for any
+        :math:`(a, b, c)` are :math:`x = M (a, b, c)^T`.
+
+        The signed distance of each intersection from each plane,
+        :math:`n \cdot x - d_n`, is also linear in the parameters. The largest
+        norm of its gradient is stored for each triple and plane to bound how
+        much the distances can change between nearby parameters.
+
+        Returns:
+            tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`):
+                The :math:`(N_{triples}, 3, 3)` matrices :math:`M` of all
+                nonsingular triples of planes, and the
+                :math:`(N_{triples}, N_{planes})` norms of the gradients of the
+                plane distances.
+        """
+        # Stored per class because subclasses may define different planes.
+        if "_plane_intersections" not in cls.__dict__:
+            planetypes = cls._plane_types
+            planelist = cls._planes
+
+            # Generate all unique combinations of planes.
+            indices = np.array(list(itertools.combinations(range(len(planetypes)), 3)))
+
+            # A determinant of zero for the coefficient matrix indicates that
+            # the matrix is not full rank, meaning no solution exists, so we
+            # ignore those cases.
+            coeffs = planelist[indices]
+            dets = np.linalg.det(coeffs)
+            solution_indices = np.abs(dets) > _THRESHOLD
+            inverses = np.linalg.inv(coeffs[solution_indices])
+            selections = np.eye(3)[planetypes[indices[solution_indices]]]
+            matrices = inverses @ selections
+
+            gradients = np.matmul(planelist, matrices) - np.eye(3)[planetypes]
+            # Single precision suffices for a bound, but the norms are rounded
+            # up to remain conservative.
+            bounds = (np.linalg.norm(gradients, axis=-1) * (1 + 1e-6)).astype(
+                np.float32
+            )
+            cls._plane_intersections = (matrices, bounds)
+        return cls._plane_intersections
+
     @classmethod
     def make_vertices(cls, a, b, c):
         """Generate vertices from the a, b, and c parameters.
@@ -74,55 +373,183 @@ class TruncationPlaneShapeFamily(ShapeFamily):
             (:math:`N_{vertices}`, 3) :class:`numpy.ndarray` of float:
                 The vertices of the shape generated by the provided parameters.
         """
-        # Vectorize the plane distances.
-        dists = np.array([a, b, c])
+        return cls.make_vertices_batch(a, b, c)[0]
+
+    @classmethod
+    def make_vertices_batch(cls, a, b, c):
+        """Generate vertices for many sets of a, b, and c parameters at once.
+
+        The parameters are broadcast against each other, so for instance a
+        grid of :math:`a` and :math:`c` values may be combined with a single
+        :math:`b` value. All parameter sets are processed in a single
+        vectorized pass (split into blocks to bound memory usage).
 
-        thresh = 1e-6
+        Args:
+            a (float or array-like): The a parameters.
+            b (float or array-like): The b parameters.
+            c (float or array-like): The c parameters.
 
+        Returns:
+            list(:math:`(N_{vertices}, 3)` :class:`numpy.ndarray` of float):
+                The vertices of the shape generated by each set of parameters,
+                in the (flattened) order of the broadcast parameters.
+
+        Example:
+            >>> from coxeter.families import Family423
+            >>> vertices = Family423.make_vertices_batch([1, 2], 2, [3, 3])
+            >>> [len(verts) for verts in vertices]
+            [8, 14]
+        """
+        # Vectorize the plane distances.
+        dists = _broadcast_parameters(a, b, c)
+        matrices, bounds = cls._get_plane_intersections()
+        planelist = cls._planes
         planetypes = cls._plane_types
+
+        # Plane triples whose intersection lies beyond some plane for all
+        # parameters in a block can be skipped for the whole block. Since the
+        # signed distances of each intersection from the planes change linearly
+        # with the parameters, this can be tested at the center of the block's
+        # bounding box. Grouping nearby parameters keeps the boxes small.
+        order = _group_parameters(dists)
+        vertices = [None] * len(dists)
+        for start in range(0, len(dists), _PARAMETERS_PER_BLOCK):
+            block = order[start : start + _PARAMETERS_PER_BLOCK]
+            if len(block) > 1:
+                lower, upper = dists[block].min(axis=0), dists[block].max(axis=0)
+                center = (lower + upper) / 2
+                excess = matrices @ center @ planelist.T - center[planetypes]
+                tolerance = 2 * _THRESHOLD + bounds * np.linalg.norm(upper - center)
+                candidates = matrices[(excess <= tolerance).all(axis=1)]
+            else:
+                # Pruning costs as much as testing a single parameter set.
+                candidates = matrices
+
+            sub_size = max(
+                1, _MAX_ENTRIES_PER_BLOCK // max(1, len(candidates) * len(planelist))
+            )
+            for sub_start in range(0, len(block), sub_size):
+                sub_block = block[sub_start : sub_start + sub_size]
+                block_vertices = _intersect_planes(
+                    dists[sub_block], candidates, planelist, planetypes
+                )
+                for i, verts in zip(sub_block, block_vertices):
+                    vertices[i] = verts
+        return vertices
+
+    @classmethod
+    def make_shapes(cls, a, b, c):
+        """Generate shapes for many sets of a, b, and c parameters.
+
+        This method is designed for sweeps over finely spaced parameters, where
+        neighboring shapes usually have the same topology. The topology of a
+        shape is identified by the set of planes on which each of its vertices
+        lies. The faces of the first shape with a given topology are computed
+        from its convex hull, and all subsequent shapes with the same topology
+        reuse those faces, so that only the vertex coordinates and the
+        quantities derived from them are recomputed.
+
+        Args:
+            a (float or array-like): The a parameters.
+            b (float or array-like): The b parameters.
+            c (float or array-like): The c parameters.
+
+        Returns:
+            list(:class:`~coxeter.shapes.ConvexPolyhedron`):
+                The shapes generated by each set of parameters, in the
+                (flattened) order of the broadcast parameters.
+
+        Example:
+            >>> from coxeter.families import Family423
+            >>> shapes = Family423.make_shapes(1, 2, [2.4, 2.5, 2.6])
+            >>> [shape.num_faces for shape in shapes]
+            [14, 14, 14]
+        """
+        dists = _broadcast_parameters(a, b, c)
+        all_vertices = cls.make_vertices_batch(a, b, c)
         planelist = cls._planes
+        planetypes = cls._plane_types
 
-        # Generate all unique combinations of planes.
-        num_planes = len(planetypes)
-        indices = [
-            (i, j, k)
-            for i in range(num_planes)
-            for j in range(i + 1, num_planes)
-            for k in range(j + 1, num_planes)
-        ]
+        # Map the topology of each shape to the faces, expressed in terms of
+        # the rank of each vertex when sorted by its planes. A value of None
+        # indicates that the faces of a topology cannot be reused.
+        templates = {}
+        shapes = []
+        for dist, vertices in zip(dists, all_vertices):
+            on_planes = np.abs(vertices @ planelist.T - dist[planetypes]) <= _THRESHOLD
+            keys = np.packbits(on_planes, axis=1)
+            order = np.lexsort(keys.T[::-1])
+            topology = keys[order].tobytes()
+
+            if topology not in templates:
+                shape = ConvexPolyhedron(vertices)
+                templates[topology] = _make_face_template(shape, on_planes, keys, order)
+            elif templates[topology] is None:
+                shape = ConvexPolyhedron(vertices)
+            else:
+                indices, offsets = templates[topology]
+                faces = _split_faces(order[indices], offsets)
+                # The faces are known to be correct, so the hull is skipped.
+                shape = ConvexPolyhedron.__new__(ConvexPolyhedron)
+                Polyhedron.__init__(shape, vertices, faces, True)
+            shapes.append(shape)
+        return shapes
 
-        # To identify the vertices of the shape, we set up a linear system of
-        # equations that finds points that simultaneously satisfy multiple
-        # plane equations, i.e. points of intersection of all planes at the
-        # specified distances.
-        coeffs = planelist[indices]
-        alltypes = planetypes[indices]
-        bs = dists[alltypes]
-
-        # A determinant of zero for the coefficient matrix indicates that the
-        # matrix is not full rank, meaning no solution exists, so we ignore
-        # those cases.
-        dets = np.linalg.det(coeffs)
-        solution_indices = np.abs(dets) > thresh
-        xs = np.linalg.solve(coeffs[solution_indices], bs[solution_indices])
-
-        # Reject any solutions that are intersections that lie beyond at least
-        # one of the bounding planes.
-        dots = np.einsum("ik,jk", xs, planelist, optimize=True)
-        alldists = dists[planetypes]
-        dist_filter = (dots <= alldists[np.newaxis, :] + thresh).all(axis=1)
-        passed_plane_test = xs[dist_filter]
-
-        # Identify unique vertices.  We don't want to lose precision in the
-        # vertices to ensure that the convex hull ends up finding the right
-        # faces, so get the unique indices based on rounding but then use the
-        # original vertices.
-        _, verts_indices = np.unique(
-            passed_plane_test.round(6), axis=0, return_index=True
-        )
-        verts = passed_plane_test[verts_indices]
+    @classmethod
+    def compute_properties(cls, a, b, c):
+        """Compute properties of the shapes for many sets of parameters.
+
+        The properties are computed directly from the vertices and the planes
+        defining each shape, without constructing any
+        :class:`~coxeter.shapes.ConvexPolyhedron`. This is much faster when
+        only these properties are needed, e.g. when mapping out phase diagrams.
 
-        return verts
+        Args:
+            a (float or array-like): The a parameters.
+            b (float or array-like): The b parameters.
+            c (float or array-like): The c parameters.
+
+        Returns:
+            dict(str, :class:`numpy.ndarray`):
+                The ``volume``, ``surface_area``, ``mean_curvature``, ``iq``,
+                and ``asphericity`` of each shape (see
+                :class:`~coxeter.shapes.ConvexPolyhedron` for definitions),
+                with the broadcast shape of the parameters.
+
+        Example:
+            >>> from coxeter.families import Family423
+            >>> properties = Family423.compute_properties(1, 2, [2, 3])
+            >>> properties["volume"]
+            array([6.66666667, 8.        ])
+        """
+        shape = np.broadcast(a, b, c).shape
+        dists = _broadcast_parameters(a, b, c)
+        vertices = cls.make_vertices_batch(a, b, c)
+
+        # Process blocks of shapes to bound the memory usage.
+        num_vertices = np.array([len(verts) for verts in vertices])
+        block_size = max(
+            1, _MAX_ENTRIES_PER_BLOCK // (len(cls._planes) * num_vertices.max())
+        )
+        results = []
+        for start in range(0, len(dists), block_size):
+            block = slice(start, start + block_size)
+            results.append(
+                _compute_properties(
+                    vertices[block], dists[block], cls._planes, cls._plane_types
+                )
+            )
+        volume, surface_area, mean_curvature = (
+            np.concatenate(values) for values in zip(*results)
+        )
+        properties = {
+            "volume": volume,
+            "surface_area": surface_area,
+            "mean_curvature": mean_curvature,
+            "iq": np.pi * 36 * volume ** 2 / (surface_area ** 3),
+            "asphericity": mean_curvature * surface_area / (3 * volume),
+        }
+        return {key: value.reshape(shape) for key, value in properties.items()}
 
 
 class Family323Plus(TruncationPlaneShapeFamily):
@@ -161,6 +588,14 @@ class Family323Plus(TruncationPlaneShapeFamily):
 
     _plane_types = np.array([2, 2, 2, 2, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1])
 
+    @classmethod
+    def _check_parameters(cls, a, c):
+        """Raise a ValueError if any parameters are out of bounds."""
+        if not np.all((1 <= np.asarray(a)) & (np.asarray(a) <= 3)):
+            raise ValueError("The a parameter must be between 1 and 3.")
+        if not np.all((1 <= np.asarray(c)) & (np.asarray(c) <= 3)):
+            raise ValueError("The c parameter must be between 1 and 3.")
+
     @classmethod
     def get_shape(cls, a, c):
         r"""Generate a shape for the provided parameters.
@@ -175,12 +610,48 @@ class Family323Plus(TruncationPlaneShapeFamily):
             :class:`~coxeter.shapes.ConvexPolyhedron`:
                 The desired shape.
         """
-        if not 1 <= a <= 3:
-            raise ValueError("The a parameter must be between 1 and 3.")
-        if not 1 <= c <= 3:
-            raise ValueError("The c parameter must be between 1 and 3.")
+        cls._check_parameters(a, c)
         return ConvexPolyhedron(cls.make_vertices(a, 1, c))
 
+    @classmethod
+    def get_shapes(cls, a, c):
+        r"""Generate shapes for many parameters, e.g. for a parameter sweep.
+
+        See :meth:`~.TruncationPlaneShapeFamily.make_shapes` for details.
+
+        Args:
+            a (float or array-like):
+                The parameters :math:`a \in [1, 3]`.
+            c (float or array-like):
+                The parameters :math:`c \in [1, 3]`.
+
+        Returns:
+            list(:class:`~coxeter.shapes.ConvexPolyhedron`):
+                The desired shapes.
+        """
+        cls._check_parameters(a, c)
+        return cls.make_shapes(a, 1, c)
+
+    @classmethod
+    def get_properties(cls, a, c):
+        r"""Compute properties of the shapes for many parameters.
+
+        See :meth:`~.TruncationPlaneShapeFamily.compute_properties` for
+        details.
+
+        Args:
+            a (float or array-like):
+                The parameters :math:`a \in [1, 3]`.
+            c (float or array-like):
+                The parameters :math:`c \in [1, 3]`.
+
+        Returns:
+            dict(str, :class:`numpy.ndarray`):
+                The properties of the shapes.
+        """
+        cls._check_parameters(a, c)
+        return cls.compute_properties(a, 1, c)
+
 
 class Family423(TruncationPlaneShapeFamily):
     r"""The 423 shape family defined in :cite:`Chen2014`.
@@ -233,6 +704,14 @@ class Family423(TruncationPlaneShapeFamily):
         [2, 2, 2, 2, 2, 2, 2, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0]
     )
 
+    @classmethod
+    def _check_parameters(cls, a, c):
+        """Raise a ValueError if any parameters are out of bounds."""
+        if not np.all((1 <= np.asarray(a)) & (np.asarray(a) <= 2)):
+            raise ValueError("The a parameter must be between 1 and 2.")
+        if not np.all((2 <= np.asarray(c)) & (np.asarray(c) <= 3)):
+            raise ValueError("The c parameter must be between 2 and 3.")
+
     @classmethod
     def get_shape(cls, a, c):
         r"""Generate a shape for the provided parameters.
@@ -247,12 +726,48 @@ class Family423(TruncationPlaneShapeFamily):
             :class:`~coxeter.shapes.ConvexPolyhedron`:
                 The desired shape.
         """
-        if not 1 <= a <= 2:
-            raise ValueError("The a parameter must be between 1 and 2.")
-        if not 2 <= c <= 3:
-            raise ValueError("The c parameter must be between 2 and 3.")
+        cls._check_parameters(a, c)
         return ConvexPolyhedron(cls.make_vertices(a, 2, c))
 
+    @classmethod
+    def get_shapes(cls, a, c):
+        r"""Generate shapes for many parameters, e.g. for a parameter sweep.
+
+        See :meth:`~.TruncationPlaneShapeFamily.make_shapes` for details.
+
+        Args:
+            a (float or array-like):
+                The parameters :math:`a \in [1, 2]`.
+            c (float or array-like):
+                The parameters :math:`c \in [2, 3]`.
+
+        Returns:
+            list(:class:`~coxeter.shapes.ConvexPolyhedron`):
+                The desired shapes.
+        """
+        cls._check_parameters(a, c)
+        return cls.make_shapes(a, 2, c)
+
+    @classmethod
+    def get_properties(cls, a, c):
+        r"""Compute properties of the shapes for many parameters.
+
+        See :meth:`~.TruncationPlaneShapeFamily.compute_properties` for
+        details.
+
+        Args:
+            a (float or array-like):
+                The parameters :math:`a \in [1, 2]`.
+            c (float or array-like):
+                The parameters :math:`c \in [2, 3]`.
+
+        Returns:
+            dict(str, :class:`numpy.ndarray`):
+                The properties of the shapes.
+        """
+        cls._check_parameters(a, c)
+        return cls.compute_properties(a, 2, c)
+
 
 class Family523(TruncationPlaneShapeFamily):
     r"""The 523 shape family defined in :cite:`Chen2014`.
@@ -413,6 +928,20 @@ class Family523(TruncationPlaneShapeFamily):
         ]
     )
 
+    @classmethod
+    def _check_parameters(cls, a, c):
+        """Raise a ValueError if any parameters are out of bounds."""
+        if not np.all((1 <= np.asarray(a)) & (np.asarray(a) <= cls.s * np.sqrt(5))):
+            raise ValueError(
+                "The a parameter must be between 1 and s\u221A5 "
+                "(where s is the inverse of the golden ratio)."
+            )
+        if not np.all((cls.S ** 2 <= np.asarray(c)) & (np.asarray(c) <= 3)):
+            raise ValueError(
+                "The c parameter must be between S^2 and 3 "
+                "(where S is the golden ratio)."
+            )
+
     @classmethod
     def get_shape(cls, a, c):
         r"""Generate a shape for the provided parameters.
@@ -427,18 +956,48 @@ class Family523(TruncationPlaneShapeFamily):
             :class:`~coxeter.shapes.ConvexPolyhedron`:
                 The desired shape.
         """
-        if not 1 <= a <= (cls.s * np.sqrt(5)):
-            raise ValueError(
-                "The a parameter must be between 1 and s\u221A5 "
-                "(where s is the inverse of the golden ratio)."
-            )
-        if not cls.S ** 2 <= c <= 3:
-            raise ValueError(
-                "The c parameter must be between S^2 and 3 "
-                "(where S is the golden ratio)."
-            )
+        cls._check_parameters(a, c)
         return ConvexPolyhedron(cls.make_vertices(a, 2, c))
 
+    @classmethod
+    def get_shapes(cls, a, c):
+        r"""Generate shapes for many parameters, e.g. for a parameter sweep.
+
+        See :meth:`~.TruncationPlaneShapeFamily.make_shapes` for details.
+
+        Args:
+            a (float or array-like):
+                The parameters :math:`a \in [1, s\sqrt{5}]`.
+            c (float or array-like):
+                The parameters :math:`c \in [S^2, 3]`.
+
+        Returns:
+            list(:class:`~coxeter.shapes.ConvexPolyhedron`):
+                The desired shapes.
+        """
+        cls._check_parameters(a, c)
+        return cls.make_shapes(a, 2, c)
+
+    @classmethod
+    def get_properties(cls, a, c):
+        r"""Compute properties of the shapes for many parameters.
+
+        See :meth:`~.TruncationPlaneShapeFamily.compute_properties` for
+        details.
+
+        Args:
+            a (float or array-like):
+                The parameters :math:`a \in [1, s\sqrt{5}]`.
+            c (float or array-like):
+                The parameters :math:`c \in [S^2, 3]`.
+
+        Returns:
+            dict(str, :class:`numpy.ndarray`):
+                The properties of the shapes.
+        """
+        cls._check_parameters(a, c)
+        return cls.compute_properties(a, 2, c)
+
 
 class TruncatedTetrahedronFamily(Family323Plus):
     r"""The truncated tetrahedron family used in :cite:`Damasceno2012`.
@@ -464,7 +1023,50 @@ class TruncatedTetrahedronFamily(Family323Plus):
             :class:`~coxeter.shapes.ConvexPolyhedron`:
                 The desired truncated tetrahedron.
         """
-        if not 0 <= truncation <= 1:
-            raise ValueError("The truncation must be between 0 and 1.")
+        cls._check_truncation(truncation)
         c = 3 - 2 * truncation
         return super().get_shape(1, c)
+
+    @classmethod
+    def get_shapes(cls, truncation):
+        r"""Generate shapes for many truncation values, e.g. for a sweep.
+
+        See :meth:`~.TruncationPlaneShapeFamily.make_shapes` for details.
+
+        Args:
+            truncation (float or array-like):
+                The parameters :math:`truncation \in [0, 1]`.
+
+        Returns:
+            list(:class:`~coxeter.shapes.ConvexPolyhedron`):
+                The desired truncated tetrahedra.
+        """
+        cls._check_truncation(truncation)
+        c = 3 - 2 * np.asarray(truncation)
+        return super().get_shapes(1, c)
+
+    @classmethod
+    def get_properties(cls, truncation):
+        r"""Compute properties of the shapes for many truncation values.
+
+        See :meth:`~.TruncationPlaneShapeFamily.compute_properties` for
+        details.
+
+        Args:
+            truncation (float or array-like):
+                The parameters :math:`truncation \in [0, 1]`.
+
+        Returns:
+            dict(str, :class:`numpy.ndarray`):
+                The properties of the truncated tetrahedra.
+        """
+        cls._check_truncation(truncation)
+        c = 3 - 2 * np.asarray(truncation)
+        return super().get_properties(1, c)
+
+    @classmethod
+    def _check_truncation(cls, truncation):
+        """Raise a ValueError if any truncations are out of bounds."""
+        truncation = np.asarray(truncation)
+        if not np.all((0 <= truncation) & (truncation <= 1)):
+            raise ValueError("The truncation must be between 0 and 1.")
@@ -7,7 +7,83 @@ flexible API can be used in a variety of ways, including both tabulated and
 continuously parametrizable shape families.
 """
 
+import copy
+import functools
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict, namedtuple
+
+# Statistics of a shape family's cache, see ShapeFamily.cache_info.
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+# Tracks whether a cached get_shape call is in progress so that nested calls
+# (e.g. a subclass calling its parent's get_shape) are not cached separately.
+_cache_state = threading.local()
+
+
+class _ShapeCache:
+    """A least recently used cache of shapes with hit and miss statistics.
+
+    Args:
+        maxsize (int or None):
+            The maximum number of shapes to store, or None for no limit.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._shapes = OrderedDict()
+
+    def get(self, key):
+        """Get a shape, or None if it is not in the cache."""
+        try:
+            self._shapes.move_to_end(key)
+        except KeyError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self._shapes[key]
+
+    def put(self, key, shape):
+        """Add a shape, evicting the least recently used one if needed."""
+        self._shapes[key] = shape
+        if self.maxsize is not None and len(self._shapes) > self.maxsize:
+            self._shapes.popitem(last=False)
+
+    def info(self):
+        """Get the cache statistics."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._shapes))
+
+
+def _cache_get_shape(get_shape):
+    """Wrap a get_shape function to use the calling family's cache, if any."""
+
+    @functools.wraps(get_shape)
+    def cached_get_shape(cls, *args, **kwargs):
+        cache = cls.__dict__.get("_shape_cache")
+        if cache is None or getattr(_cache_state, "active", False):
+            return get_shape(cls, *args, **kwargs)
+        key = (args, frozenset(kwargs.items()))
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable arguments (e.g. arrays) cannot be cached.
+            return get_shape(cls, *args, **kwargs)
+
+        shape = cache.get(key)
+        if shape is None:
+            _cache_state.active = True
+            try:
+                shape = get_shape(cls, *args, **kwargs)
+            finally:
+                _cache_state.active = False
+            cache.put(key, shape)
+        # Cached shapes are never handed out directly so that callers cannot
+        # modify them.
+        return copy.deepcopy(shape)
+
+    return cached_get_shape
 
 
 class ShapeFamily(ABC):
@@ -25,8 +101,69 @@ class ShapeFamily(ABC):
     APIs, avoiding confusing idioms like ``shape = family()(SHAPE_NAME)``. For instance,
     given a family for generating regular polygons, getting a hexagon should look
     roughly like ``family.get_shape(n=6)``.
+
+    Since generating shapes can be expensive, each family can optionally cache
+    the shapes it generates using :meth:`~.enable_cache`. Cached shapes are
+    keyed by the arguments to `get_shape`, and every call returns a new copy of
+    the cached shape, so modifying a returned shape never affects the cache.
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        get_shape = cls.__dict__.get("get_shape")
+        if isinstance(get_shape, classmethod):
+            cls.get_shape = classmethod(_cache_get_shape(get_shape.__func__))
+
+    @classmethod
+    def enable_cache(cls, maxsize=128):
+        """Cache the shapes generated by this family.
+
+        The cache is specific to this family, so enabling it for a family
+        does not enable it for its subclasses or parent classes. Enabling the
+        cache when it is already enabled clears it.
+
+        Args:
+            maxsize (int or None):
+                The maximum number of shapes to store. When the cache is full,
+                the least recently used shape is discarded. If None, the cache
+                is unbounded (Default value: 128).
+
+        Example:
+            >>> from coxeter.families import PlatonicFamily
+            >>> PlatonicFamily.enable_cache(maxsize=8)
+            >>> cube = PlatonicFamily.get_shape("Cube")
+            >>> cube = PlatonicFamily.get_shape("Cube")
+            >>> PlatonicFamily.cache_info()
+            CacheInfo(hits=1, misses=1, maxsize=8, currsize=1)
+            >>> PlatonicFamily.disable_cache()
+        """
+        cls._shape_cache = _ShapeCache(maxsize)
+
+    @classmethod
+    def disable_cache(cls):
+        """Stop caching shapes and discard all cached shapes."""
+        if "_shape_cache" in cls.__dict__:
+            del cls._shape_cache
+
+    @classmethod
+    def clear_cache(cls):
+        """Discard all cached shapes and reset the statistics."""
+        if "_shape_cache" in cls.__dict__:
+            cls._shape_cache = _ShapeCache(cls._shape_cache.maxsize)
+
+    @classmethod
+    def cache_info(cls):
+        """Get statistics of this family's cache.
+
+        Returns:
+            tuple or None:
+                A named tuple containing the number of ``hits`` and ``misses``,
+                the ``maxsize`` and the current size ``currsize`` of the cache,
+                or None if caching is not enabled.
+        """
+        cache = cls.__dict__.get("_shape_cache")
+        return None if cache is None else cache.info()
+
     @classmethod
     @abstractmethod
     def get_shape(cls):
@@ -12,6 +12,7 @@ import copy
 import json
 
 from ..shape_getters import from_gsd_type_shapes
+from .binary_cache import load_packed_table
 from .shape_family import ShapeFamily
 
 
@@ -97,6 +98,47 @@ class TabulatedGSDShapeFamily(TabulatedShapeFamily):
             can be read into such a dictionary.
     """
 
+    @classmethod
+    def from_json_file(cls, filename, *args, binary_cache=False, **kwargs):
+        r"""Generate a subclass for a dataset from a JSON file.
+
+        See :meth:`TabulatedShapeFamily.from_json_file` for more information.
+
+        Args:
+            filename (str):
+                A JSON file containing valid shape definitions.
+            \*args:
+                Passed on to :meth:`~.from_mapping`.
+            binary_cache (bool):
+                If True, the faces, plane equations and neighbors of all
+                convex polyhedra in the file are precomputed the first time a
+                shape is requested and stored in a binary cache on disk, which
+                is memory-mapped in subsequent sessions so that generating
+                these shapes skips the convex hull computation. The cache is
+                invalidated whenever the file changes, but the :attr:`data`
+                of the family must not be modified when this option is used
+                (Default value: False).
+            \*\*kwargs:
+                Passed on to :meth:`~.from_mapping`.
+
+        Returns:
+            A subclass of this one associated with the the provided data.
+        """
+        family = super().from_json_file(filename, *args, **kwargs)
+        if binary_cache:
+            family._binary_cache_file = filename
+        return family
+
+    @classmethod
+    def _get_packed_table(cls):
+        """Get the precomputed shapes of this family, if a cache is used."""
+        if "_packed_table" not in cls.__dict__:
+            filename = getattr(cls, "_binary_cache_file", None)
+            cls._packed_table = (
+                None if filename is None else load_packed_table(filename, cls.data)
+            )
+        return cls._packed_table
+
     @classmethod
     def get_shape(cls, name):
         """Use the class's data to produce a shape for the given name.
@@ -108,4 +150,7 @@ class TabulatedGSDShapeFamily(TabulatedShapeFamily):
         Returns:
             :class:`~coxeter.shapes.Shape`: The requested shape.
         """
+        table = cls._get_packed_table()
+        if table is not None and name in table:
+            return table.get_shape(name)
         return from_gsd_type_shapes(cls.data[name])
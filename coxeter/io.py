@@ -0,0 +1,488 @@
+"""Read and write large collections of shapes.
+
+Shapes are stored as :ref:`GSD shape specifications <shapes>`, one record per
+shape, and can be read and written in a streaming fashion so that memory usage
+does not depend on the number of shapes in a file. Two formats are supported:
+
+* Newline-delimited JSON (NDJSON), in which each line contains the JSON
+  representation of a single shape spec. This format is human-readable and
+  easily processed by other tools.
+* A packed binary format, in which the scalar parameters of each spec are
+  stored in a small JSON header followed by the raw bytes of its arrays
+  (vertices and faces). Arrays are read directly into NumPy arrays without
+  creating a Python object per coordinate, so this format is much faster to
+  read.
+
+Since shape specs only contain the information required to define a shape,
+shapes read from them must be constructed from scratch, which e.g. requires
+computing a convex hull for convex polyhedra. Polygons and polyhedra can
+instead be saved in their fully constructed form using :func:`save_shapes`,
+and :func:`load_shapes` memory-maps the saved data to construct the shapes
+without any geometric computations.
+"""
+
+import json
+import os
+import struct
+from collections.abc import Sequence
+from contextlib import contextmanager
+
+import numpy as np
+
+from .shape_getters import from_gsd_type_shapes
+from .shapes import (
+    ConvexPolygon,
+    ConvexPolyhedron,
+    ConvexSpheropolygon,
+    ConvexSpheropolyhedron,
+    Polygon,
+    Polyhedron,
+)
+from .shapes.base_classes import Shape
+from .shapes.polyhedron import _split_faces
+
+# The packed format starts with this magic string followed by the version.
+_PACKED_MAGIC = b"COXSHAPE"
+_PACKED_VERSION = 1
+_UINT32 = struct.Struct("<I")
+
+# The dtypes used to store the array-valued entries of shape specs.
+_VERTEX_DTYPE = np.dtype("<f8")
+_INDEX_DTYPE = np.dtype("<i8")
+
+
+@contextmanager
+def _open(file, mode):
+    """Open a filename, or pass through an already open file object."""
+    if hasattr(file, "read" if "r" in mode else "write"):
+        yield file
+    else:
+        with open(file, mode) as f:
+            yield f
+
+
+def _get_spec(shape):
+    """Get the GSD shape spec of a shape, or pass through a spec."""
+    return shape.gsd_shape_spec if isinstance(shape, Shape) else shape
+
+
+def _make_output(spec, dimensions, return_specs):
+    """Convert a spec into the requested output of the readers."""
+    return spec if return_specs else from_gsd_type_shapes(spec, dimensions)
+
+
+def write_ndjson(shapes, file):
+    """Write shapes to a newline-delimited JSON file.
+
+    Args:
+        shapes (iterable of :class:`~coxeter.shapes.Shape` or dict):
+            The shapes to write, or their GSD shape specs. Any iterable is
+            accepted, including generators, and it is consumed lazily.
+        file (str or file-like):
+            The filename or text file object to write to.
+
+    Returns:
+        int: The number of shapes written.
+    """
+    count = 0
+    with _open(file, "w") as f:
+        for shape in shapes:
+            f.write(json.dumps(_get_spec(shape), default=lambda x: x.tolist()))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def read_ndjson(file, dimensions=3, return_specs=False):
+    """Lazily read shapes from a newline-delimited JSON file.
+
+    Args:
+        file (str or file-like):
+            The filename or text file object to read from.
+        dimensions (int):
+            The dimensionality of the shapes, see
+            :func:`~coxeter.from_gsd_type_shapes` (Default value: 3).
+        return_specs (bool):
+            If True, yield the GSD shape specs instead of shapes
+            (Default value: False).
+
+    Yields:
+        :class:`~coxeter.shapes.Shape` or dict:
+            The shapes (or specs) in the order they are stored in the file.
+    """
+    with _open(file, "r") as f:
+        for line in f:
+            if line.strip():
+                yield _make_output(json.loads(line), dimensions, return_specs)
+
+
+def _pack_spec(spec):
+    """Split a spec into a JSON header and a list of arrays."""
+    header = {
+        key: value for key, value in spec.items() if key not in ("vertices", "faces")
+    }
+    arrays = []
+    if "vertices" in spec:
+        vertices = np.asarray(spec["vertices"], dtype=_VERTEX_DTYPE)
+        arrays.append(("vertices", vertices))
+    if "faces" in spec:
+        faces = [np.asarray(face, dtype=_INDEX_DTYPE) for face in spec["faces"]]
+        arrays.append(("face_sizes", np.array([len(f) for f in faces], _INDEX_DTYPE)))
+        arrays.append(
+            ("faces", np.concatenate(faces) if faces else np.empty(0, _INDEX_DTYPE))
+        )
+    header["arrays"] = [[name, list(array.shape)] for name, array in arrays]
+    return header, arrays
+
+
+def _unpack_spec(header, arrays):
+    """Combine a header and its arrays back into a spec."""
+    spec = dict(header)
+    del spec["arrays"]
+    if "vertices" in arrays:
+        spec["vertices"] = arrays["vertices"]
+    if "faces" in arrays:
+        offsets = np.concatenate(([0], np.cumsum(arrays["face_sizes"])))
+        spec["faces"] = [
+            arrays["faces"][start:end]
+            for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())
+        ]
+    return spec
+
+
+def write_packed(shapes, file):
+    """Write shapes to a packed binary file.
+
+    Each shape is stored as the length of a JSON header, the header itself
+    containing the scalar parameters of the spec and the shapes of its arrays,
+    and the raw little-endian bytes of the arrays. Vertices are stored as
+    64-bit floats, and faces (of meshes) as a flat array of 64-bit vertex
+    indices along with the size of each face.
+
+    Args:
+        shapes (iterable of :class:`~coxeter.shapes.Shape` or dict):
+            The shapes to write, or their GSD shape specs. Any iterable is
+            accepted, including generators, and it is consumed lazily.
+        file (str or file-like):
+            The filename or binary file object to write to.
+
+    Returns:
+        int: The number of shapes written.
+    """
+    count = 0
+    with _open(file, "wb") as f:
+        f.write(_PACKED_MAGIC + _UINT32.pack(_PACKED_VERSION))
+        for shape in shapes:
+            header, arrays = _pack_spec(_get_spec(shape))
+            header = json.dumps(header).encode()
+            f.write(_UINT32.pack(len(header)))
+            f.write(header)
+            for _, array in arrays:
+                f.write(np.ascontiguousarray(array).tobytes())
+            count += 1
+    return count
+
+
+def _read_exactly(f, size):
+    """Read a given number of bytes, raising an error on truncated files."""
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError("The packed shape file is truncated.")
+    return data
+
+
+def read_packed(file, dimensions=3, return_specs=False):
+    """Lazily read shapes from a packed binary file.
+
+    Args:
+        file (str or file-like):
+            The filename or binary file object to read from.
+        dimensions (int):
+            The dimensionality of the shapes, see
+            :func:`~coxeter.from_gsd_type_shapes` (Default value: 3).
+        return_specs (bool):
+            If True, yield the GSD shape specs instead of shapes. Vertices and
+            faces are then provided as NumPy arrays (Default value: False).
+
+    Yields:
+        :class:`~coxeter.shapes.Shape` or dict:
+            The shapes (or specs) in the order they are stored in the file.
+    """
+    with _open(file, "rb") as f:
+        preamble = f.read(len(_PACKED_MAGIC) + _UINT32.size)
+        if preamble[: len(_PACKED_MAGIC)] != _PACKED_MAGIC:
+            raise ValueError("The file is not a packed shape file.")
+        (version,) = _UINT32.unpack(preamble[len(_PACKED_MAGIC) :])
+        if version != _PACKED_VERSION:
+            raise ValueError(
+                "Unsupported packed shape file version {}.".format(version)
+            )
+
+        while True:
+            size = f.read(_UINT32.size)
+            if not size:
+                return
+            (size,) = _UINT32.unpack(size)
+            header = json.loads(_read_exactly(f, size))
+            arrays = {}
+            for name, shape in header["arrays"]:
+                dtype = _VERTEX_DTYPE if name == "vertices" else _INDEX_DTYPE
+                count = int(np.prod(shape))
+                data = _read_exactly(f, count * dtype.itemsize)
+                arrays[name] = np.frombuffer(data, dtype=dtype).reshape(shape)
+            yield _make_output(_unpack_spec(header, arrays), dimensions, return_specs)
+
+
+# The classes that can be stored in a shape archive. The polygons and
+# polyhedra are stored as the underlying polygon or polyhedron of the rounded
+# shapes, along with the rounding radius.
+_ARCHIVE_VERSION = 1
+_ARCHIVE_TYPES = (
+    "Polygon",
+    "ConvexPolygon",
+    "ConvexSpheropolygon",
+    "Polyhedron",
+    "ConvexPolyhedron",
+    "ConvexSpheropolyhedron",
+)
+_ARCHIVE_POLYGON_TYPES = ("Polygon", "ConvexPolygon", "ConvexSpheropolygon")
+_ARCHIVE_ARRAYS = (
+    "types",
+    "radii",
+    "vertices",
+    "vertex_offsets",
+    "normals",
+    "faces_are_convex",
+    "faces",
+    "face_offsets",
+    "shape_face_offsets",
+    "equations",
+    "neighbors",
+    "neighbor_offsets",
+)
+
+
+def _offsets(counts):
+    """Convert counts into offsets delimiting consecutive blocks."""
+    return np.concatenate(([0], np.cumsum(counts, dtype=np.int64)))
+
+
+def _concatenate(arrays, dtype, empty_shape=(0,)):
+    """Concatenate arrays, handling the case where there are none."""
+    if not arrays:
+        return np.empty(empty_shape, dtype=dtype)
+    return np.concatenate(arrays).astype(dtype, copy=False)
+
+
+def _pack_shapes(shapes):
+    """Pack polygons and polyhedra into the arrays of a shape archive."""
+    types, radii, normals, faces_are_convex = [], [], [], []
+    vertices, vertex_counts = [], []
+    faces, face_lengths, face_counts = [], [], []
+    equations, neighbors, neighbor_counts = [], [], []
+    for shape in shapes:
+        name = type(shape).__name__
+        if name not in _ARCHIVE_TYPES:
+            raise TypeError("Shapes of type {} cannot be saved.".format(name))
+        types.append(_ARCHIVE_TYPES.index(name))
+        radii.append(getattr(shape, "_radius", 0.0))
+        base = getattr(shape, "_polygon", getattr(shape, "_polyhedron", shape))
+        vertices.append(base._vertices)
+        vertex_counts.append(len(base._vertices))
+        if name in _ARCHIVE_POLYGON_TYPES:
+            normals.append(base._normal)
+            faces_are_convex.append(True)
+            face_counts.append(0)
+        else:
+            normals.append(np.zeros(3))
+            faces_are_convex.append(base._faces_are_convex)
+            face_counts.append(len(base._faces))
+            face_lengths.extend(len(face) for face in base._faces)
+            faces.extend(base._faces)
+            equations.append(base._equations)
+            neighbor_counts.extend(len(n) for n in base._neighbors)
+            neighbors.extend(base._neighbors)
+
+    arrays = {
+        "types": np.array(types, dtype=np.uint8),
+        "radii": np.array(radii, dtype=np.float64),
+        "vertices": _concatenate(vertices, np.float64, (0, 3)),
+        "vertex_offsets": _offsets(vertex_counts),
+        "normals": np.array(normals, dtype=np.float64).reshape(-1, 3),
+        "faces_are_convex": np.array(faces_are_convex, dtype=bool),
+        "faces": _concatenate(faces, np.int64),
+        "face_offsets": _offsets(face_lengths),
+        "shape_face_offsets": _offsets(face_counts),
+        "equations": _concatenate(equations, np.float64, (0, 4)),
+        "neighbors": _concatenate(neighbors, np.int64),
+        "neighbor_offsets": _offsets(neighbor_counts),
+    }
+    return arrays
+
+
+def _write_archive(arrays, directory):
+    """Write the arrays of a shape archive to a directory."""
+    os.makedirs(directory, exist_ok=True)
+    for name in _ARCHIVE_ARRAYS:
+        np.save(os.path.join(directory, name + ".npy"), arrays[name])
+    with open(os.path.join(directory, "metadata.json"), "w") as f:
+        json.dump({"version": _ARCHIVE_VERSION, "types": _ARCHIVE_TYPES}, f)
+
+
+def save_shapes(shapes, directory):
+    """Save fully constructed polygons and polyhedra to a shape archive.
+
+    In addition to the vertices, the archive contains all data that is
+    otherwise computed when constructing a shape, namely the faces, plane
+    equations, and face neighbors of polyhedra and the normals of polygons.
+    Shapes loaded with :func:`load_shapes` therefore require no geometric
+    computations. All data is stored in packed arrays, one ``.npy`` file per
+    array, so that they can be memory-mapped.
+
+    Args:
+        shapes (iterable of :class:`~coxeter.shapes.Shape`):
+            The shapes to save. Supported classes are
+            :class:`~coxeter.shapes.Polygon`,
+            :class:`~coxeter.shapes.ConvexPolygon`,
+            :class:`~coxeter.shapes.ConvexSpheropolygon`,
+            :class:`~coxeter.shapes.Polyhedron`,
+            :class:`~coxeter.shapes.ConvexPolyhedron`, and
+            :class:`~coxeter.shapes.ConvexSpheropolyhedron`.
+        directory (str):
+            The directory to write the archive to, which is created if needed.
+
+    Returns:
+        int: The number of shapes saved.
+    """
+    arrays = _pack_shapes(shapes)
+    _write_archive(arrays, directory)
+    return len(arrays["types"])
+
+
+class ShapeArchive(Sequence):
+    """A sequence of shapes stored in packed arrays.
+
+    Shapes are constructed on demand when indexed, directly from the stored
+    arrays. Instances are typically created by :func:`load_shapes`.
+
+    Args:
+        arrays (dict(str, :class:`numpy.ndarray`)):
+            The packed arrays written by :func:`save_shapes`.
+        copy (bool):
+            If False, the arrays of each shape are views into ``arrays``.
+            Otherwise, each shape gets its own copy (Default value: False).
+    """
+
+    def __init__(self, arrays, copy=False):
+        self._arrays = arrays
+        self._copy = copy
+
+    def __len__(self):
+        return len(self._arrays["types"])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Shape archive index out of range.")
+
+        arrays = self._arrays
+        convert = np.array if self._copy else np.asarray
+        name = _ARCHIVE_TYPES[arrays["types"][index]]
+        vertex_start, vertex_end = arrays["vertex_offsets"][index : index + 2]
+        vertices = convert(arrays["vertices"][vertex_start:vertex_end])
+
+        # The stored data is already valid, so the constructors are skipped.
+        if name in _ARCHIVE_POLYGON_TYPES:
+            base = Polygon if name == "Polygon" else ConvexPolygon
+            shape = base.__new__(base)
+            shape._vertices = vertices
+            shape._normal = convert(arrays["normals"][index])
+        else:
+            base = Polyhedron if name == "Polyhedron" else ConvexPolyhedron
+            face_start, face_end = arrays["shape_face_offsets"][index : index + 2]
+            face_offsets = np.asarray(arrays["face_offsets"][face_start : face_end + 1])
+            neighbor_offsets = np.asarray(
+                arrays["neighbor_offsets"][face_start : face_end + 1]
+            )
+            shape = base.__new__(base)
+            shape._vertices = vertices
+            shape._faces = _split_faces(
+                convert(arrays["faces"][face_offsets[0] : face_offsets[-1]]),
+                face_offsets - face_offsets[0],
+            )
+            shape._faces_are_convex = bool(arrays["faces_are_convex"][index])
+            shape._equations = convert(arrays["equations"][face_start:face_end])
+            shape._neighbors = _split_faces(
+                convert(
+                    arrays["neighbors"][neighbor_offsets[0] : neighbor_offsets[-1]]
+                ),
+                neighbor_offsets - neighbor_offsets[0],
+            )
+
+        if name == "ConvexSpheropolygon":
+            rounded = ConvexSpheropolygon.__new__(ConvexSpheropolygon)
+            rounded._polygon = shape
+            rounded.radius = float(arrays["radii"][index])
+            shape = rounded
+        elif name == "ConvexSpheropolyhedron":
+            rounded = ConvexSpheropolyhedron.__new__(ConvexSpheropolyhedron)
+            rounded._polyhedron = shape
+            rounded.radius = float(arrays["radii"][index])
+            shape = rounded
+        return shape
+
+
+def load_shapes(directory, mmap_mode="c", copy=False):
+    """Load shapes saved with :func:`save_shapes`.
+
+    By default, the stored arrays are memory-mapped in copy-on-write mode and
+    the arrays of each shape are views into them, so loading an archive is
+    essentially free and shapes are constructed without copying any data.
+    Modifying a shape in place never modifies the archive on disk.
+
+    .. note::
+
+        Without ``copy``, indexing the same position of the archive twice
+        returns two shapes that share memory, so modifying one of them in
+        place also modifies the other.
+
+    Args:
+        directory (str):
+            The directory containing the archive.
+        mmap_mode (str or None):
+            Passed on to :func:`numpy.load`. Use None to read all arrays into
+            memory. With "r+", modifying a shape in place also modifies the
+            archive on disk (Default value: "c").
+        copy (bool):
+            Whether to give each shape its own copy of its data
+            (Default value: False).
+
+    Returns:
+        :class:`ShapeArchive`: A sequence that constructs the shapes on demand.
+
+    Raises:
+        ValueError: If ``mmap_mode`` is "r" and ``copy`` is False, since the
+            shapes would then be backed by read-only arrays that cannot be
+            modified in place (e.g. by :func:`~.diagonalize_inertia_batch`).
+    """
+    if mmap_mode == "r" and not copy:
+        raise ValueError(
+            'Read-only memory maps require copy=True; use mmap_mode="c" to '
+            "share the stored data between shapes without copying."
+        )
+    with open(os.path.join(directory, "metadata.json")) as f:
+        metadata = json.load(f)
+    if metadata["version"] != _ARCHIVE_VERSION:
+        raise ValueError(
+            "Unsupported shape archive version {}.".format(metadata["version"])
+        )
+    if tuple(metadata["types"]) != _ARCHIVE_TYPES:
+        raise ValueError("The shape archive uses an unknown set of shape types.")
+    arrays = {
+        name: np.load(os.path.join(directory, name + ".npy"), mmap_mode=mmap_mode)
+        for name in _ARCHIVE_ARRAYS
+    }
+    return ShapeArchive(arrays, copy)
@@ -4,6 +4,9 @@ The methods here provide routes for generating instances of
 :class:`~coxeter.shapes.Shape` based on certain pre-specified mappings.
 """
 
+import json
+
+from .bentley_ottmann import is_simple_batch
 from .shapes import (
     Circle,
     ConvexPolygon,
@@ -16,6 +19,41 @@ from .shapes import (
     Polyhedron,
     Sphere,
 )
+from .shapes.convex_polygon import _is_convex
+from .shapes.polygon import _align_points_by_normal
+
+
+def _make_polygon(vertices):
+    """Create a convex polygon if possible, and otherwise a general polygon.
+
+    The polygon is only constructed once, and the test for self-intersections
+    that general polygons require is left to the caller.
+
+    Args:
+        vertices (:math:`(N, 3)` or :math:`(N, 2)` array-like):
+            The vertices of the polygon.
+
+    Returns:
+        tuple(:class:`~.shapes.Polygon`, bool):
+            The polygon, and whether it is convex.
+    """
+    polygon = Polygon(vertices, test_simple=False)
+    if not _is_convex(polygon.vertices, polygon.normal):
+        return polygon, False
+    # The vertices have already been validated, they just need to be sorted.
+    polygon = ConvexPolygon.from_trusted_vertices(polygon.vertices, polygon.normal)
+    polygon.reorder_verts()
+    return polygon, True
+
+
+def _is_polygon_spec(params):
+    """Check whether a shape spec describes a (non-rounded) polygon."""
+    return params.get("type") == "Polygon" and "rounding_radius" not in params
+
+
+def _spec_key(params, dimensions):
+    """Generate a hashable key identifying a shape spec."""
+    return dimensions, json.dumps(params, sort_keys=True, default=lambda x: x.tolist())
 
 
 def from_gsd_type_shapes(params, dimensions=3):  # noqa: C901
@@ -63,11 +101,11 @@ def from_gsd_type_shapes(params, dimensions=3):  # noqa: C901
         if "rounding_radius" in params:
             return ConvexSpheropolygon(params["vertices"], params["rounding_radius"])
         else:
-            try:
-                return ConvexPolygon(params["vertices"])
-            except ValueError:
-                # If it's not a convex polygon, return a simple polygon.
-                return Polygon(params["vertices"])
+            # If it's not a convex polygon, return a simple polygon.
+            polygon, convex = _make_polygon(params["vertices"])
+            if not convex:
+                polygon._check_simple()
+            return polygon
     elif params["type"] == "ConvexPolyhedron":
         if "rounding_radius" in params:
             return ConvexSpheropolyhedron(params["vertices"], params["rounding_radius"])
@@ -77,3 +115,84 @@ def from_gsd_type_shapes(params, dimensions=3):  # noqa: C901
         return Polyhedron(params["vertices"], params["faces"])
     else:
         raise ValueError("Unsupported shape type.")
+
+
+def from_gsd_type_shapes_batch(specs, dimensions=3, cache=None):
+    """Create many shapes from dicts conforming to the GSD schema.
+
+    This function is equivalent to calling :func:`from_gsd_type_shapes` on
+    every element of ``specs``, but it is much faster for large collections of
+    specs that contain many duplicates, such as the type shapes stored in the
+    frames of a GSD trajectory. Identical specs are only converted once, and
+    polygons are checked for self-intersections all at once using
+    :func:`~coxeter.bentley_ottmann.is_simple_batch`.
+
+    .. note::
+
+        Identical specs produce the *same* shape object, both within a call
+        and across calls sharing a ``cache``. Copy shapes before modifying
+        them if they may be shared.
+
+    Args:
+        specs (sequence of dict):
+            The parameters of the shapes to construct.
+        dimensions (int):
+            The dimensionality of the shapes, see :func:`from_gsd_type_shapes`
+            (Default value: 3).
+        cache (dict, optional):
+            A dictionary used to store the generated shapes. Passing the same
+            dictionary to multiple calls reuses shapes generated in previous
+            calls. The keys and values should be treated as opaque
+            (Default value: None).
+
+    Returns:
+        list(:class:`~coxeter.shapes.Shape`):
+            The shapes in the same order as ``specs``.
+
+    Example:
+        >>> square = {"type": "Polygon",
+        ...           "vertices": [[0, 0], [1, 0], [1, 1], [0, 1]]}
+        >>> sphere = {"type": "Sphere", "diameter": 1}
+        >>> shapes = coxeter.from_gsd_type_shapes_batch([square, sphere, square])
+        >>> [type(shape).__name__ for shape in shapes]
+        ['ConvexPolygon', 'Sphere', 'ConvexPolygon']
+        >>> shapes[0] is shapes[2]
+        True
+
+    """
+    if cache is None:
+        cache = {}
+    keys = [_spec_key(params, dimensions) for params in specs]
+
+    # Deduplicate the specs that are not in the cache, and group them by type.
+    new_specs = {}
+    for key, params in zip(keys, specs):
+        if key not in cache:
+            new_specs.setdefault(key, params)
+    polygon_keys = [
+        key for key, params in new_specs.items() if _is_polygon_spec(params)
+    ]
+
+    shapes = {}
+    nonconvex = []
+    for key in polygon_keys:
+        shapes[key], convex = _make_polygon(new_specs[key]["vertices"])
+        if not convex:
+            nonconvex.append(key)
+    if nonconvex:
+        simple = is_simple_batch(
+            [
+                _align_points_by_normal(shapes[key].normal, shapes[key].vertices)
+                for key in nonconvex
+            ]
+        )
+        for key, is_simple in zip(nonconvex, simple):
+            shapes[key]._check_simple(is_simple)
+
+    for key, params in new_specs.items():
+        if key not in shapes:
+            shapes[key] = from_gsd_type_shapes(params, dimensions)
+
+    # Only update the cache once all shapes have been validated.
+    cache.update(shapes)
+    return [cache[key] for key in keys]
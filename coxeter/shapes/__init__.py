@@ -6,17 +6,37 @@ and they take care of various conveniences such as orienting polyhedron faces
 and automatically identifying convex hulls of points.
 """
 
-from .base_classes import Shape, Shape2D, Shape3D
-from .circle import Circle
-from .convex_polygon import ConvexPolygon
-from .convex_polyhedron import ConvexPolyhedron
-from .convex_spheropolygon import ConvexSpheropolygon
-from .convex_spheropolyhedron import ConvexSpheropolyhedron
-from .ellipse import Ellipse
-from .ellipsoid import Ellipsoid
-from .polygon import Polygon
-from .polyhedron import Polyhedron
-from .sphere import Sphere
+import importlib
+
+# Each shape is imported from its module when first accessed, so that using a
+# shape does not require importing the dependencies of all other shapes.
+_SHAPE_MODULES = {
+    "Circle": "circle",
+    "ConvexPolygon": "convex_polygon",
+    "ConvexPolyhedron": "convex_polyhedron",
+    "ConvexSpheropolygon": "convex_spheropolygon",
+    "ConvexSpheropolyhedron": "convex_spheropolyhedron",
+    "Ellipse": "ellipse",
+    "Ellipsoid": "ellipsoid",
+    "Polygon": "polygon",
+    "Polyhedron": "polyhedron",
+    "Shape": "base_classes",
+    "Shape2D": "base_classes",
+    "Shape3D": "base_classes",
+    "Sphere": "sphere",
+    "clip_polyhedron": "clipping",
+    "diagonalize_inertia_batch": "polyhedron",
+    "excluded_volume": "virial",
+    "find_duplicate_shapes": "descriptors",
+    "hausdorff_distance": "descriptors",
+    "intersect_polyhedra": "clipping",
+    "minkowski_sum": "minkowski",
+    "nearest_shapes": "descriptors",
+    "polygon_moments_batch": "polygon",
+    "sample_excluded_volume": "virial",
+    "second_virial_coefficient": "virial",
+    "shape_descriptors": "descriptors",
+}
 
 __all__ = [
     "Circle",
@@ -32,4 +52,32 @@ __all__ = [
     "Shape2D",
     "Shape3D",
     "Sphere",
+    "clip_polyhedron",
+    "diagonalize_inertia_batch",
+    "excluded_volume",
+    "find_duplicate_shapes",
+    "hausdorff_distance",
+    "intersect_polyhedra",
+    "minkowski_sum",
+    "nearest_shapes",
+    "polygon_moments_batch",
+    "sample_excluded_volume",
+    "second_virial_coefficient",
+    "shape_descriptors",
 ]
+
+
+def __getattr__(name):
+    try:
+        module_name = _SHAPE_MODULES[name]
+    except KeyError:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        ) from None
+    value = getattr(importlib.import_module("." + module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
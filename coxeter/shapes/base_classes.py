@@ -42,6 +42,42 @@ class Shape(ABC):
         """
         raise NotImplementedError
 
+    def sample_volume(self, n, rng=None):
+        """Sample points uniformly distributed inside the shape.
+
+        For two dimensional shapes, the points are sampled from the area
+        enclosed by the shape.
+
+        Args:
+            n (int):
+                The number of points to sample.
+            rng (:class:`numpy.random.Generator`, int, or None):
+                The random number generator, or a seed used to create one
+                with :func:`numpy.random.default_rng` (Default value: None).
+
+        Returns:
+            :math:`(n, 3)` :class:`numpy.ndarray`: The sampled points.
+        """
+        raise NotImplementedError("Sampling is not implemented for this shape.")
+
+    def sample_surface(self, n, rng=None):
+        """Sample points uniformly distributed on the surface of the shape.
+
+        For two dimensional shapes, the points are sampled from the boundary
+        (perimeter) of the shape.
+
+        Args:
+            n (int):
+                The number of points to sample.
+            rng (:class:`numpy.random.Generator`, int, or None):
+                The random number generator, or a seed used to create one
+                with :func:`numpy.random.default_rng` (Default value: None).
+
+        Returns:
+            :math:`(n, 3)` :class:`numpy.ndarray`: The sampled points.
+        """
+        raise NotImplementedError("Sampling is not implemented for this shape.")
+
     def compute_form_factor_amplitude(self, q):
         r"""Calculate the form factor intensity.
 
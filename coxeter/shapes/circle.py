@@ -3,6 +3,7 @@
 import numpy as np
 
 from .base_classes import Shape2D
+from .utils import _sample_directions
 
 
 class Circle(Shape2D):
@@ -150,3 +151,16 @@ class Circle(Shape2D):
         This is 1 by definition for circles.
         """
         return 1
+
+    def sample_volume(self, n, rng=None):  # noqa: D102
+        # Use the parent docstring.
+        rng = np.random.default_rng(rng)
+        distances = self.radius * np.sqrt(rng.random((n, 1)))
+        points = distances * _sample_directions(n, rng, dimensions=2)
+        return self.center + np.insert(points, 2, 0, axis=1)
+
+    def sample_surface(self, n, rng=None):  # noqa: D102
+        # Use the parent docstring.
+        rng = np.random.default_rng(rng)
+        points = self.radius * _sample_directions(n, rng, dimensions=2)
+        return self.center + np.insert(points, 2, 0, axis=1)
@@ -0,0 +1,480 @@
+"""Clip convex polyhedra by half-spaces and intersect convex polyhedra.
+
+The intersection of a convex polyhedron with a half-space is computed by
+clipping each of its faces by the bounding plane :cite:`Sutherland1974` and
+closing the result with a new face, the cap, composed of the points of the
+clipped faces that lie on the plane. Intersections with several half-spaces,
+including the intersection of two convex polyhedra, are computed by clipping
+by one plane after another.
+
+The faces are stored in padded arrays, so that a polyhedron can be clipped
+by many different sets of planes at once (e.g. a stack of slabs of different
+heights), with each clipping step vectorized over all faces and all sets of
+planes. Volumes and surface areas are computed directly from the clipped
+faces, so shapes only need to be constructed when they are requested.
+"""
+
+import numpy as np
+import rowan
+from scipy.spatial import ConvexHull
+
+from .convex_polyhedron import ConvexPolyhedron
+from .polyhedron import _flatten_faces
+from .utils import _MAX_ELEMENTS_PER_BLOCK
+
+# The tolerance for points lying on a clipping plane, relative to the size of
+# the clipped shape.
+_TOLERANCE = 1e-10
+
+
+def _padded_faces(shape):
+    """Get the vertices of all faces of a polyhedron as a padded array.
+
+    Returns:
+        tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`):
+            The :math:`(N_{faces}, N_{max}, 3)` array of the vertices of each
+            face, padded with zeros, and the number of vertices of each face.
+    """
+    indices, face_ids, offsets, _ = _flatten_faces(shape.faces)
+    counts = np.diff(offsets)
+    vertices = np.zeros((len(counts), counts.max(), 3))
+    vertices[face_ids, np.arange(len(indices)) - offsets[face_ids]] = shape.vertices[
+        indices
+    ]
+    return vertices, counts
+
+
+def _compact(points, flags):
+    """Move the flagged entries of padded arrays to their front.
+
+    Args:
+        points (:class:`numpy.ndarray`):
+            The :math:`(..., N_{slots}, 3)` points.
+        flags (:class:`numpy.ndarray`):
+            The :math:`(..., N_{slots})` boolean array of points to keep.
+
+    Returns:
+        tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`):
+            The kept points padded with zeros and their numbers.
+    """
+    counts = np.sum(flags, axis=-1)
+    *batch, _ = np.nonzero(flags)
+    positions = np.cumsum(flags, axis=-1) - 1
+    compacted = np.zeros(flags.shape[:-1] + (max(counts.max(initial=0), 1), 3))
+    compacted[(*batch, positions[flags])] = points[flags]
+    return compacted, counts
+
+
+def _clip_faces(vertices, counts, planes, tolerance):
+    """Clip padded convex polygons by one plane for each set of polygons.
+
+    Args:
+        vertices (:class:`numpy.ndarray`):
+            The :math:`(N, N_{faces}, N_{max}, 3)` vertices of the polygons.
+        counts (:class:`numpy.ndarray`):
+            The :math:`(N, N_{faces})` numbers of vertices of the polygons.
+        planes (:class:`numpy.ndarray`):
+            The :math:`(N, 4)` normalized plane equations.
+        tolerance (float):
+            The distance below which points are considered to lie on a plane.
+
+    Returns:
+        tuple(:class:`numpy.ndarray`, ...):
+            The vertices and numbers of vertices of the clipped polygons, the
+            vertices and numbers of vertices of the points of the clipped
+            polygons on the plane (which may contain duplicates), and whether
+            any polygon of each set lies in the plane facing outward.
+    """
+    slots = np.arange(vertices.shape[2])
+    valid = slots < counts[..., np.newaxis]
+    distances = (
+        np.einsum("nfmi,ni->nfm", vertices, planes[:, :3])
+        + planes[:, np.newaxis, np.newaxis, 3]
+    )
+    distances[np.abs(distances) <= tolerance] = 0
+    distances[~valid] = 0
+
+    following = np.where(slots + 1 < counts[..., np.newaxis], slots + 1, 0)
+    next_distances = np.take_along_axis(distances, following, axis=2)
+    next_vertices = np.take_along_axis(vertices, following[..., np.newaxis], axis=2)
+
+    # Each edge contributes its start if it is inside the half-space and its
+    # intersection with the plane if it crosses the plane.
+    keep = valid & (distances <= 0)
+    cross = valid & (distances * next_distances < 0)
+    fractions = distances / np.where(cross, distances - next_distances, 1)
+    crossings = vertices + fractions[..., np.newaxis] * (next_vertices - vertices)
+    shape = distances.shape[:2] + (2 * len(slots),)
+    points = np.stack((vertices, crossings), axis=3).reshape(shape + (3,))
+    flags = np.stack((keep, cross), axis=-1).reshape(shape)
+    on_plane = np.stack((keep & (distances == 0), cross), axis=-1).reshape(shape)
+
+    # A face in the plane facing outward already closes the clipped shape.
+    n, f = np.nonzero((counts > 0) & np.all(distances == 0, axis=2))
+    outward = np.einsum(
+        "fi,fi->f", _vector_areas(vertices[n, f], counts[n, f]), planes[n, :3]
+    )
+    coplanar = np.zeros(len(planes), dtype=bool)
+    coplanar[n[outward > 0]] = True
+    clipped, clipped_counts = _compact(points, flags)
+    clipped_counts[clipped_counts < 3] = 0
+    section, section_counts = _compact(
+        points.reshape(len(planes), np.prod(shape[1:]), 3),
+        on_plane.reshape(len(planes), np.prod(shape[1:])),
+    )
+    return clipped, clipped_counts, section, section_counts, coplanar
+
+
+def _cap_faces(points, counts, planes, tolerance):
+    """Construct the convex polygons closing polyhedra clipped by planes.
+
+    The points on the boundary of each cap are sorted counterclockwise about
+    the normal of the plane (i.e. the outward normal of the cap) by their
+    angle about their mean, and duplicate points shared between neighboring
+    faces are removed.
+
+    Args:
+        points (:class:`numpy.ndarray`):
+            The :math:`(N, N_{points}, 3)` points on the boundary of each cap.
+        counts (:class:`numpy.ndarray`):
+            The :math:`(N, )` numbers of points.
+        planes (:class:`numpy.ndarray`):
+            The :math:`(N, 4)` normalized plane equations.
+        tolerance (float):
+            The distance below which points are considered identical.
+
+    Returns:
+        tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`):
+            The vertices and numbers of vertices of the caps.
+    """
+    slots = np.arange(points.shape[1])
+    valid = slots < counts[:, np.newaxis]
+    centers = np.sum(points, axis=1) / np.maximum(counts, 1)[:, np.newaxis]
+
+    normals = planes[:, :3]
+    axes = np.eye(3)[np.argmin(np.abs(normals), axis=1)]
+    first = np.cross(normals, axes)
+    first /= np.linalg.norm(first, axis=1)[:, np.newaxis]
+    second = np.cross(normals, first)
+    relative = points - centers[:, np.newaxis]
+    angles = np.arctan2(
+        np.einsum("npi,ni->np", relative, second),
+        np.einsum("npi,ni->np", relative, first),
+    )
+    angles[~valid] = np.inf
+    order = np.argsort(angles, axis=1)
+    points = np.take_along_axis(points, order[..., np.newaxis], axis=1)
+
+    previous = np.where(slots > 0, slots - 1, counts[:, np.newaxis] - 1)
+    steps = points - np.take_along_axis(points, previous[..., np.newaxis], axis=1)
+    distinct = valid & (np.linalg.norm(steps, axis=-1) > tolerance)
+    caps, cap_counts = _compact(points, distinct)
+    cap_counts[cap_counts < 3] = 0
+    return caps, cap_counts
+
+
+def _pad(vertices, width):
+    """Pad the vertex axis of an array of padded polygons."""
+    padding = [(0, 0)] * vertices.ndim
+    padding[-2] = (0, width - vertices.shape[-2])
+    return np.pad(vertices, padding)
+
+
+def _clip(vertices, counts, planes, tolerance):
+    """Clip convex polyhedra by sets of half-spaces.
+
+    Args:
+        vertices (:class:`numpy.ndarray`):
+            The :math:`(N, N_{faces}, N_{max}, 3)` vertices of the faces of
+            each polyhedron.
+        counts (:class:`numpy.ndarray`):
+            The :math:`(N, N_{faces})` numbers of vertices of the faces.
+        planes (:class:`numpy.ndarray`):
+            The :math:`(N, N_{planes}, 4)` normalized plane equations of the
+            half-spaces clipping each polyhedron.
+        tolerance (float):
+            The distance below which points are considered to lie on a plane.
+
+    Returns:
+        tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`):
+            The vertices and numbers of vertices of the faces of the clipped
+            polyhedra.
+    """
+    for k in range(planes.shape[1]):
+        vertices, counts, section, section_counts, coplanar = _clip_faces(
+            vertices, counts, planes[:, k], tolerance
+        )
+        section_counts[coplanar] = 0
+        caps, cap_counts = _cap_faces(section, section_counts, planes[:, k], tolerance)
+
+        width = max(vertices.shape[2], caps.shape[1])
+        vertices = np.concatenate(
+            (_pad(vertices, width), _pad(caps, width)[:, np.newaxis]), axis=1
+        )
+        counts = np.concatenate((counts, cap_counts[:, np.newaxis]), axis=1)
+
+        # Drop faces that were clipped away entirely for all polyhedra.
+        nonempty = np.any(counts > 0, axis=0)
+        vertices, counts = vertices[:, nonempty], counts[:, nonempty]
+    return vertices, counts
+
+
+def _vector_areas(vertices, counts):
+    """Compute the vector areas of padded polygons.
+
+    Each polygon is triangulated as a fan about its first vertex.
+    """
+    first = vertices[..., :1, :]
+    triangles = np.cross(vertices[..., 1:-1, :] - first, vertices[..., 2:, :] - first)
+    valid = np.arange(2, vertices.shape[-2]) < counts[..., np.newaxis]
+    return 0.5 * np.einsum("...m,...mi->...i", valid, triangles)
+
+
+def _volumes_and_areas(vertices, counts, centers):
+    """Compute the volumes and surface areas of polyhedra from their faces.
+
+    The volume is the sum of the volumes of the cones spanned by the faces
+    and the given centers.
+    """
+    vector_areas = _vector_areas(vertices, counts)
+    heights = vertices[:, :, 0] - centers[:, np.newaxis]
+    volumes = np.einsum("nfi,nfi->n", heights, vector_areas) / 3
+    areas = np.sum(np.linalg.norm(vector_areas, axis=-1), axis=1)
+    return volumes, areas
+
+
+def _clipped_polyhedra(vertices, counts, planes, return_shapes):
+    """Clip polyhedra in blocks and collect the requested results.
+
+    Args:
+        vertices (:class:`numpy.ndarray`):
+            The :math:`(N, N_{faces}, N_{max}, 3)` or
+            :math:`(1, N_{faces}, N_{max}, 3)` vertices of the faces of the
+            polyhedra, where the latter are clipped by all sets of planes.
+        counts (:class:`numpy.ndarray`):
+            The matching numbers of vertices of the faces.
+        planes (:class:`numpy.ndarray`):
+            The :math:`(N, N_{planes}, 4)` plane equations.
+        return_shapes (bool):
+            Whether to construct shapes.
+
+    Returns:
+        list(:class:`~.ConvexPolyhedron`) or tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`):
+            The clipped shapes or their volumes and surface areas.
+    """  # noqa: E501
+    planes = planes / np.linalg.norm(planes[..., :3], axis=-1)[..., np.newaxis]
+    valid = np.arange(vertices.shape[2]) < counts[0, :, np.newaxis]
+    size = np.ptp(vertices[0][valid], axis=0).max()
+    tolerance = _TOLERANCE * size
+
+    # Clipping adds one face per plane, each with at most one vertex per face.
+    num_faces = vertices.shape[1] + planes.shape[1]
+    block_size = max(
+        1,
+        _MAX_ELEMENTS_PER_BLOCK // (6 * num_faces * max(num_faces, vertices.shape[2])),
+    )
+
+    results = []
+    for start in range(0, len(planes), block_size):
+        block = planes[start : start + block_size]
+        block_vertices, block_counts = (
+            np.broadcast_to(array, (len(block),) + array.shape[1:])
+            if len(array) == 1
+            else array[start : start + block_size]
+            for array in (vertices, counts)
+        )
+        # Volumes are computed relative to the centers of the unclipped
+        # shapes for accuracy.
+        valid = np.arange(block_vertices.shape[2]) < block_counts[..., np.newaxis]
+        centers = (
+            np.einsum("nfm,nfmi->ni", valid, block_vertices)
+            / np.sum(valid, axis=(1, 2))[:, np.newaxis]
+        )
+        block_vertices, block_counts = _clip(
+            block_vertices, block_counts, block, tolerance
+        )
+        volumes, areas = _volumes_and_areas(block_vertices, block_counts, centers)
+
+        # Intersections without interior are empty.
+        empty = volumes <= tolerance * size ** 2
+        if not return_shapes:
+            volumes[empty] = areas[empty] = 0
+            results.append((volumes, areas))
+            continue
+        valid = np.arange(block_vertices.shape[2]) < block_counts[..., np.newaxis]
+        for n in range(len(block)):
+            if empty[n]:
+                results.append(None)
+            else:
+                points = block_vertices[n][valid[n]]
+                results.append(ConvexPolyhedron(points[ConvexHull(points).vertices]))
+
+    if return_shapes:
+        return results
+    if not results:
+        return np.zeros(0), np.zeros(0)
+    return tuple(np.concatenate(arrays) for arrays in zip(*results))
+
+
+def clip_polyhedron(shape, planes, return_shapes=True):
+    r"""Clip a convex polyhedron by one or more half-spaces.
+
+    Each half-space is specified by the equation :math:`(a, b, c, d)` of its
+    bounding plane and contains the points :math:`ax + by + cz + d \leq 0`,
+    matching the sign convention of the face equations of polyhedra. A
+    polyhedron can be clipped by many sets of half-spaces at once, e.g. to
+    compute the parts of a shape below a stack of heights. Intersections
+    with a volume of at most :math:`10^{-10} L^3`, where :math:`L` is the
+    extent of the shape, are considered empty.
+
+    Args:
+        shape (:class:`~.ConvexPolyhedron`):
+            The polyhedron to clip.
+        planes (:class:`numpy.ndarray`):
+            The plane equations. An array of shape :math:`(4, )` or
+            :math:`(N_{planes}, 4)` specifies a single half-space or the
+            intersection of several half-spaces, while an array of shape
+            :math:`(N, N_{planes}, 4)` specifies :math:`N` independent sets
+            of half-spaces.
+        return_shapes (bool):
+            If False, only the volumes and surface areas of the clipped
+            shapes are computed, which is much faster than constructing the
+            shapes (Default value: True).
+
+    Returns:
+        :class:`~.ConvexPolyhedron` or list(:class:`~.ConvexPolyhedron`), or tuple(float, float) or tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`):
+            The clipped shape, or the clipped shape for each set of
+            half-spaces if ``planes`` is three dimensional. Empty
+            intersections are None. If ``return_shapes`` is False, the
+            volumes and surface areas of the clipped shapes are returned
+            instead, which are zero for empty intersections.
+
+    Example:
+        >>> cube = coxeter.shapes.ConvexPolyhedron(
+        ...   [[1, 1, 1], [1, -1, 1], [1, 1, -1], [1, -1, -1],
+        ...    [-1, 1, 1], [-1, -1, 1], [-1, 1, -1], [-1, -1, -1]])
+        >>> half = coxeter.shapes.clip_polyhedron(cube, [1, 1, 1, 0])
+        >>> half.num_faces
+        7
+        >>> import numpy as np
+        >>> assert np.isclose(half.volume, 4)
+        >>> heights = np.linspace(-1, 1, 5)
+        >>> planes = np.zeros((len(heights), 1, 4))
+        >>> planes[:, 0, 2], planes[:, 0, 3] = 1, -heights
+        >>> volumes, areas = coxeter.shapes.clip_polyhedron(
+        ...   cube, planes, return_shapes=False)
+        >>> volumes
+        array([0., 2., 4., 6., 8.])
+
+    """  # noqa: E501
+    if not isinstance(shape, ConvexPolyhedron):
+        raise TypeError("Only convex polyhedra can be clipped.")
+    planes = np.asarray(planes, dtype=np.float64)
+    if planes.shape[-1] != 4 or not 1 <= planes.ndim <= 3:
+        raise ValueError(
+            "The planes must be an array of shape (4, ), (N_planes, 4), or "
+            "(N, N_planes, 4)."
+        )
+    batched = planes.ndim == 3
+    if not batched:
+        planes = np.atleast_2d(planes)[np.newaxis]
+
+    vertices, counts = _padded_faces(shape)
+    results = _clipped_polyhedra(
+        vertices[np.newaxis], counts[np.newaxis], planes, return_shapes
+    )
+    if batched:
+        return results
+    return results[0] if return_shapes else tuple(array[0] for array in results)
+
+
+def intersect_polyhedra(
+    first, second, orientations=None, positions=None, return_shapes=True
+):
+    """Compute the intersection of two convex polyhedra.
+
+    The intersection is computed by clipping the polyhedron with more faces
+    by the planes of the faces of the other one. This can be done for many
+    orientations and positions of ``second`` at once, e.g. to compute the
+    overlap volumes of pairs of particles.
+
+    Args:
+        first (:class:`~.ConvexPolyhedron`):
+            The first polyhedron.
+        second (:class:`~.ConvexPolyhedron`):
+            The second polyhedron.
+        orientations (:class:`numpy.ndarray`, optional):
+            The :math:`(N, 4)` quaternions by which ``second`` is rotated
+            about the origin before it is translated. If None, ``second`` is
+            not rotated (Default value: None).
+        positions (:class:`numpy.ndarray`, optional):
+            The :math:`(N, 3)` translations of ``second``. If None,
+            ``second`` is not translated (Default value: None).
+        return_shapes (bool):
+            If False, only the volumes and surface areas of the intersections
+            are computed (Default value: True).
+
+    Returns:
+        :class:`~.ConvexPolyhedron` or list(:class:`~.ConvexPolyhedron`), or tuple(float, float) or tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`):
+            The intersection, or the intersection for each orientation and
+            position if either ``orientations`` or ``positions`` is
+            provided. Empty intersections are None. If ``return_shapes`` is
+            False, the volumes and surface areas of the intersections are
+            returned instead, which are zero for empty intersections.
+
+    Example:
+        >>> cube = coxeter.shapes.ConvexPolyhedron(
+        ...   [[1, 1, 1], [1, -1, 1], [1, 1, -1], [1, -1, -1],
+        ...    [-1, 1, 1], [-1, -1, 1], [-1, 1, -1], [-1, -1, -1]])
+        >>> volumes, areas = coxeter.shapes.intersect_polyhedra(
+        ...   cube, cube, positions=[[0, 0, 0], [1, 0, 0], [1, 1, 1], [3, 0, 0]],
+        ...   return_shapes=False)
+        >>> volumes
+        array([8., 4., 1., 0.])
+
+    """  # noqa: E501
+    if not (
+        isinstance(first, ConvexPolyhedron) and isinstance(second, ConvexPolyhedron)
+    ):
+        raise TypeError("Only convex polyhedra can be intersected.")
+    batched = orientations is not None or positions is not None
+    rotations = (
+        np.eye(3)[np.newaxis]
+        if orientations is None
+        else rowan.to_matrix(np.asarray(orientations, dtype=np.float64))
+    )
+    translations = (
+        np.zeros((1, 3))
+        if positions is None
+        else np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    )
+    num_transforms = np.broadcast(rotations[:, 0, 0], translations[:, 0]).size
+
+    # Transforming the shape with fewer faces and clipping the other by its
+    # planes minimizes the number of clipping steps.
+    if second.num_faces <= first.num_faces:
+        normals = np.einsum("nij,fj->nfi", rotations, second._equations[:, :3])
+        offsets = second._equations[:, 3] - np.sum(
+            normals * translations[:, np.newaxis], axis=-1
+        )
+        planes = np.concatenate(
+            (np.broadcast_to(normals, offsets.shape + (3,)), offsets[..., np.newaxis]),
+            axis=-1,
+        )
+        vertices, counts = _padded_faces(first)
+        vertices, counts = vertices[np.newaxis], counts[np.newaxis]
+    else:
+        planes = first._equations[np.newaxis]
+        vertices, counts = _padded_faces(second)
+        vertices = (
+            np.einsum("nij,fmj->nfmi", rotations, vertices)
+            + translations[:, np.newaxis, np.newaxis]
+        )
+        vertices = np.broadcast_to(vertices, (num_transforms,) + vertices.shape[1:])
+        counts = np.broadcast_to(counts, (num_transforms,) + counts.shape)
+    planes = np.broadcast_to(planes, (num_transforms,) + planes.shape[1:])
+
+    results = _clipped_polyhedra(vertices, counts, planes, return_shapes)
+    if batched:
+        return results
+    return results[0] if return_shapes else tuple(array[0] for array in results)
@@ -1,12 +1,133 @@
 """Defines a convex polyhedron."""
 
 import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 from scipy.spatial import ConvexHull
 
-from .polyhedron import Polyhedron
+from .convex_polygon import ConvexPolygon
+from .polyhedron import (
+    Polyhedron,
+    _neighbors_from_pairs,
+    _orient_faces,
+    _planes_close,
+    _sort_convex_faces,
+    _split_faces,
+)
 from .sphere import Sphere
 
 
+def _merge_coplanar_cells(vertices, indices, cell_ids, labels):
+    """Merge coplanar polygonal cells of the surface of a convex polyhedron.
+
+    The vertices of a face are the vertices of its cells, except for those
+    that only belong to cells of that face and therefore lie inside of it.
+    Cells that are merged within a tolerance need not form a convex polygon,
+    in which case they are kept as separate faces.
+
+    Args:
+        vertices (:math:`(N, 3)` :class:`numpy.ndarray`):
+            The vertices of the polyhedron.
+        indices (:class:`numpy.ndarray`):
+            The vertex indices of all cells concatenated.
+        cell_ids (:class:`numpy.ndarray`):
+            The cell of each element of ``indices``.
+        labels (:math:`(N_{cells},)` :class:`numpy.ndarray`):
+            The face of each cell, numbered consecutively.
+
+    Returns:
+        tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`):
+            The face of each cell after splitting faces that are not convex,
+            and the flat representation (indices, face ids, and offsets) of
+            the faces sorted by :func:`_sort_convex_faces`.
+    """  # noqa: E501
+    num_vertices = len(vertices)
+    while True:
+        num_faces = np.max(labels) + 1
+        incidences = np.unique(indices.astype(np.int64) * num_faces + labels[cell_ids])
+        inside = np.bincount(incidences // num_faces, minlength=num_vertices) == 1
+        keys = np.unique(labels[cell_ids].astype(np.int64) * num_vertices + indices)
+        face_ids, face_indices = np.divmod(keys, num_vertices)
+        corners = ~inside[face_indices]
+        face_ids, face_indices = face_ids[corners], face_indices[corners]
+        offsets = np.searchsorted(face_ids, np.arange(num_faces + 1))
+        order, nonconvex = _sort_convex_faces(
+            vertices, face_indices, face_ids, offsets, return_nonconvex=True
+        )
+        if not np.any(nonconvex):
+            return labels, face_indices[order], face_ids, offsets
+        split = nonconvex[labels]
+        labels = labels.copy()
+        labels[split] = num_faces + np.arange(np.count_nonzero(split))
+        _, labels = np.unique(labels, return_inverse=True)
+
+
+def _merge_hull_facets(hull, atol=1e-8, rtol=1e-5):
+    """Merge the coplanar simplices of a convex hull into faces.
+
+    The triangulated output of :class:`scipy.spatial.ConvexHull` already
+    contains consistently oriented plane equations and the adjacency of all
+    simplices, so the faces of the polyhedron can be constructed directly
+    rather than by building, merging, and sorting a triangulated
+    :class:`~.Polyhedron`. The merging criterion is the same as in
+    :meth:`~.Polyhedron.merge_faces`.
+
+    Args:
+        hull (:class:`scipy.spatial.ConvexHull`):
+            The convex hull.
+        atol (float):
+            Absolute tolerance for comparing plane equations
+            (Default value: 1e-8).
+        rtol (float):
+            Relative tolerance for comparing plane equations
+            (Default value: 1e-5).
+
+    Returns:
+        tuple(list(:class:`numpy.ndarray`), list(:class:`numpy.ndarray`)):
+            The faces, ordered counterclockwise with respect to their
+            outward normals, and the neighbors of each face.
+    """
+    simplices, equations = hull.simplices, hull.equations
+    num_simplices = len(simplices)
+
+    # Each pair of adjacent simplices appears twice in the neighbor array.
+    first = np.repeat(np.arange(num_simplices), 3)
+    second = hull.neighbors.ravel()
+    unique = first < second
+    first, second = first[unique], second[unique]
+
+    merge = _planes_close(equations[first], equations[second], atol, rtol)
+    merge_graph = coo_matrix(
+        (np.ones(np.count_nonzero(merge)), (first[merge], second[merge])),
+        shape=(num_simplices, num_simplices),
+    )
+    _, labels = connected_components(merge_graph, directed=False, return_labels=True)
+    labels, indices, face_ids, offsets = _merge_coplanar_cells(
+        hull.points,
+        simplices.ravel(),
+        np.repeat(np.arange(num_simplices), 3),
+        labels,
+    )
+
+    # Reverse the faces that were sorted clockwise about the outward normal of
+    # the hull.
+    _, representatives = np.unique(labels, return_index=True)
+    indices = _orient_faces(
+        hull.points, indices, face_ids, offsets, equations[representatives, :3]
+    ).astype(simplices.dtype)
+
+    # Merged faces are adjacent if any of their simplices are.
+    num_faces = len(representatives)
+    face_first, face_second = labels[first], labels[second]
+    keys = np.unique(
+        np.minimum(face_first, face_second).astype(np.int64) * num_faces
+        + np.maximum(face_first, face_second)
+    )
+    keys = keys[keys // num_faces != keys % num_faces]
+    neighbors = _neighbors_from_pairs(keys // num_faces, keys % num_faces, num_faces)
+    return _split_faces(indices, offsets), neighbors
+
+
 class ConvexPolyhedron(Polyhedron):
     """A convex polyhedron.
 
@@ -52,12 +173,12 @@ class ConvexPolyhedron(Polyhedron):
         [array([1, 2, 3, 4]), array([0, 2, 3, 5]), array([0, 1, 4, 5]),
         array([0, 1, 4, 5]), array([0, 2, 3, 5]), array([1, 2, 3, 4])]
         >>> cube.normals
-        array([[-0., -0.,  1.],
-               [-0.,  1., -0.],
-               [-1.,  0., -0.],
-               [ 1., -0., -0.],
-               [-0., -1.,  0.],
-               [-0., -0., -1.]])
+        array([[ 0.,  0.,  1.],
+               [ 0.,  1., -0.],
+               [-1.,  0.,  0.],
+               [ 1., -0.,  0.],
+               [ 0., -1.,  0.],
+               [ 0.,  0., -1.]])
         >>> cube.num_faces
         6
         >>> cube.num_vertices
@@ -80,8 +201,12 @@ class ConvexPolyhedron(Polyhedron):
 
     def __init__(self, vertices):
         hull = ConvexHull(vertices)
-        super(ConvexPolyhedron, self).__init__(vertices, hull.simplices, True)
-        self.merge_faces()
+        # The faces are built directly from the hull rather than by passing
+        # the simplices to the parent constructor and merging them afterwards.
+        self._vertices = np.array(vertices, dtype=np.float64)
+        self._faces_are_convex = True
+        self._faces, self._neighbors = _merge_hull_facets(hull)
+        self._find_equations()
 
     @property
     def mean_curvature(self):
@@ -92,13 +217,14 @@ class ConvexPolyhedron(Polyhedron):
         :math:`L_i` and dihedral angles :math:`\phi_i` (see :cite:`Irrgang2017`
         for more information).
         """
-        unnorm_r = 0
-        for i, j, edge in self._get_face_intersections():
-            phi = self.get_dihedral(i, j)
-            edge_vector = self.vertices[edge[0]] - self.vertices[edge[1]]
-            edge_length = np.linalg.norm(edge_vector)
-            unnorm_r += edge_length * (np.pi - phi)
-        return unnorm_r / (8 * np.pi)
+        first, second, edges = self._find_face_intersections()
+        normals = self._equations[:, :3]
+        cosines = np.sum(-normals[first] * normals[second], axis=1)
+        phi = np.arccos(np.clip(cosines, -1, 1))
+        edge_lengths = np.linalg.norm(
+            self._vertices[edges[:, 0]] - self._vertices[edges[:, 1]], axis=1
+        )
+        return np.sum(edge_lengths * (np.pi - phi)) / (8 * np.pi)
 
     @property
     def gsd_shape_spec(self):
@@ -121,6 +247,10 @@ class ConvexPolyhedron(Polyhedron):
         """float: Get the asphericity as defined in :cite:`Irrgang2017`."""
         return self.mean_curvature * self.surface_area / (3 * self.volume)
 
+    def _make_cross_section(self, vertices, normal):
+        # The cross sections of a convex polyhedron are convex polygons.
+        return ConvexPolygon.from_trusted_vertices(vertices, normal)
+
     def is_inside(self, points):
         """Determine whether points are contained in this polyhedron.
 
@@ -7,7 +7,14 @@ a circle of some radius.
 import numpy as np
 
 from .base_classes import Shape2D
-from .convex_polygon import ConvexPolygon, _is_convex
+from .convex_polygon import ConvexPolygon
+from .utils import (
+    _get_cached_sampler,
+    _PieceSampler,
+    _sample_prisms,
+    _sample_simplices,
+    _sample_wedges,
+)
 
 
 class ConvexSpheropolygon(Shape2D):
@@ -52,9 +59,9 @@ class ConvexSpheropolygon(Shape2D):
 
     def __init__(self, vertices, radius, normal=None):
         self.radius = radius
+        # The ConvexPolygon constructor already raises an error if the vertices
+        # do not define a convex polygon.
         self._polygon = ConvexPolygon(vertices, normal)
-        if not _is_convex(self.vertices, self._polygon.normal):
-            raise ValueError("The vertices do not define a convex polygon.")
 
     def reorder_verts(self, clockwise=False, ref_index=0, increasing_length=True):
         """Sort the vertices.
@@ -180,3 +187,84 @@ class ConvexSpheropolygon(Shape2D):
             self.radius *= scale_factor
         else:
             raise ValueError("Perimeter must be greater than zero.")
+
+    def _get_sampler(self, filled):
+        """Get a sampler for the interior or the boundary of the spheropolygon.
+
+        The spheropolygon is decomposed into the polygon, a rectangle on each
+        edge, and a circular sector at each vertex.
+        """
+
+        def build():
+            vertices = self._polygon._vertices
+            # Orient the normal such that the vertices are counterclockwise.
+            normal = self._polygon._normal / np.linalg.norm(self._polygon._normal)
+            if self._polygon.signed_area < 0:
+                normal = -normal
+
+            edges = np.stack((vertices, np.roll(vertices, shift=-1, axis=0)), axis=1)
+            lengths = np.linalg.norm(edges[:, 1] - edges[:, 0], axis=1)
+            outward = np.cross(edges[:, 1] - edges[:, 0], normal)
+            outward /= np.linalg.norm(outward, axis=1, keepdims=True)
+
+            # The sector at each vertex spans the outward normals of the
+            # preceding and following edges.
+            previous = np.roll(outward, shift=1, axis=0)
+            angles = np.arccos(np.clip(np.sum(previous * outward, axis=1), -1, 1))
+            sector_args = (
+                vertices[:, np.newaxis],
+                previous,
+                np.cross(normal, previous),
+                angles,
+                self.radius,
+                filled,
+            )
+
+            if not filled:
+                return _PieceSampler(
+                    [
+                        (lengths, _sample_prisms, (edges, outward, self.radius, False)),
+                        (angles * self.radius, _sample_wedges, sector_args),
+                    ]
+                )
+            triangles = np.stack(
+                (
+                    np.broadcast_to(vertices[0], vertices[1:-1].shape),
+                    vertices[1:-1],
+                    vertices[2:],
+                ),
+                axis=1,
+            )
+            areas = (
+                np.linalg.norm(
+                    np.cross(
+                        triangles[:, 1] - triangles[:, 0],
+                        triangles[:, 2] - triangles[:, 0],
+                    ),
+                    axis=1,
+                )
+                / 2
+            )
+            return _PieceSampler(
+                [
+                    (areas, _sample_simplices, (triangles,)),
+                    (
+                        lengths * self.radius,
+                        _sample_prisms,
+                        (edges, outward, self.radius, True),
+                    ),
+                    (angles * self.radius ** 2 / 2, _sample_wedges, sector_args),
+                ]
+            )
+
+        name = "volume" if filled else "surface"
+        state = (self._polygon, self._polygon._vertices, self.radius)
+        return _get_cached_sampler(self, name, state, build)
+
+    def sample_volume(self, n, rng=None):  # noqa: D102
+        # Use the parent docstring.
+        return self._get_sampler(True).sample(n, np.random.default_rng(rng))
+
+    def sample_surface(self, n, rng=None):  # noqa: D102
+        # Use the parent docstring.
+        return self._get_sampler(False).sample(n, np.random.default_rng(rng))
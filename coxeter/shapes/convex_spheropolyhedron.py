@@ -8,6 +8,14 @@ import numpy as np
 
 from .base_classes import Shape3D
 from .convex_polyhedron import ConvexPolyhedron
+from .utils import (
+    _get_cached_sampler,
+    _PieceSampler,
+    _sample_prisms,
+    _sample_simplices,
+    _sample_vertex_balls,
+    _sample_wedges,
+)
 
 
 class ConvexSpheropolyhedron(Shape3D):
@@ -108,29 +116,30 @@ class ConvexSpheropolyhedron(Shape3D):
         # 1) The volume of the underlying polyhedron.
         # 2) The volume of the spherical caps on the vertices, which sum up to
         #    a single sphere with the spheropolyhedron's rounding radius.
-        # 3) The volume of cylindrical wedges along the edges, which are
-        #    computed using a standard cylinder formula then using the dihedral
-        #    angle of the face to determine what fraction of the cylinder to
-        #    include.
+        # 3) The volume of cylindrical wedges along the edges. The wedge on
+        #    each edge spans the exterior angle pi - phi of the dihedral angle
+        #    phi, so the wedges sum up to 4 pi R r^2 where R is the mean
+        #    curvature of the polyhedron.
         # 4) The volume of the extruded faces, which is the surface area of
         #    each face multiplied by the rounding radius.
         v_poly = self.polyhedron.volume
         v_sphere = (4 / 3) * np.pi * self._radius ** 3
-        v_cyl = 0
+        v_cyl = 4 * np.pi * self.polyhedron.mean_curvature * self._radius ** 2
         v_face = self.polyhedron.surface_area * self._radius
-
-        # For every pair of faces, find the dihedral angle, divide by 2*pi to
-        # get the fraction of a cylinder it includes, then multiply by the edge
-        # length to get the cylinder contribution.
-        for i, j, edge in self.polyhedron._get_face_intersections():
-            phi = self.polyhedron.get_dihedral(i, j)
-            edge_length = np.linalg.norm(
-                self.polyhedron.vertices[edge[0]] - self.polyhedron.vertices[edge[1]]
-            )
-            v_cyl += (np.pi * self.radius ** 2) * (phi / (2 * np.pi)) * edge_length
-
         return v_poly + v_sphere + v_face + v_cyl
 
+    @property
+    def mean_curvature(self):
+        r"""float: The integrated, normalized mean curvature.
+
+        The normalization matches :attr:`.ConvexPolyhedron.mean_curvature`,
+        so that the value for a sphere is its radius. Since rounding a shape
+        by a radius :math:`r` adds :math:`r` to its mean curvature, this is
+        :math:`R + r` where :math:`R` is the mean curvature of the underlying
+        polyhedron.
+        """
+        return self.polyhedron.mean_curvature + self._radius
+
     @property
     def radius(self):
         """float: The rounding radius."""
@@ -150,24 +159,11 @@ class ConvexSpheropolyhedron(Shape3D):
         # 1) The (now extruded) surface area of the underlying polyhedron.
         # 2) The surface are of the spherical vertex caps, which is just the
         #    surface area of a single sphere with the rounding radius.
-        # 3) The surface area of cylindrical wedges along the edges, which are
-        #    computed using a standard cylinder formula then using the dihedral
-        #    angle of the face to determine what fraction of the cylinder to
-        #    include.
+        # 3) The surface area of cylindrical wedges along the edges, which
+        #    span the exterior angles of the edges and sum up to 8 pi R r.
         a_poly = self.polyhedron.surface_area
         a_sphere = 4 * np.pi * self._radius ** 2
-        a_cyl = 0
-
-        # For every pair of faces, find the dihedral angle, divide by 2*pi to
-        # get the fraction of a cylinder it includes, then multiply by the edge
-        # length to get the cylinder contribution.
-        for i, j, edge in self.polyhedron._get_face_intersections():
-            phi = self.polyhedron.get_dihedral(i, j)
-            edge_length = np.linalg.norm(
-                self.polyhedron.vertices[edge[0]] - self.polyhedron.vertices[edge[1]]
-            )
-            a_cyl += (2 * np.pi * self.radius) * (phi / (2 * np.pi)) * edge_length
-
+        a_cyl = 8 * np.pi * self.polyhedron.mean_curvature * self._radius
         return a_poly + a_sphere + a_cyl
 
     def is_inside(self, points):
@@ -321,3 +317,105 @@ class ConvexSpheropolyhedron(Shape3D):
         insphere = self._polyhedron.insphere_from_center
         insphere.radius += self._radius
         return insphere
+
+    def _get_sampler(self, filled):
+        """Get a sampler for the interior or the surface of the spheropolyhedron.
+
+        The spheropolyhedron is decomposed into the polyhedron, a prism on
+        each face, a cylindrical wedge on each edge, and a spherical region at
+        each vertex. The vertex regions together form a ball.
+        """
+
+        def build():
+            poly = self._polyhedron
+            radius = self.radius
+            faces = poly._faces
+            normals = poly._equations[:, :3] / np.linalg.norm(
+                poly._equations[:, :3], axis=1, keepdims=True
+            )
+            triangles = poly._vertices[poly._get_fan_triangles()]
+            triangle_normals = normals[
+                np.repeat(np.arange(len(faces)), [len(face) - 2 for face in faces])
+            ]
+            areas = (
+                np.linalg.norm(
+                    np.cross(
+                        triangles[:, 1] - triangles[:, 0],
+                        triangles[:, 2] - triangles[:, 0],
+                    ),
+                    axis=1,
+                )
+                / 2
+            )
+
+            # The wedge on each edge spans the normals of the adjacent faces.
+            first, second, edges = poly._find_face_intersections()
+            segments = poly._vertices[edges]
+            lengths = np.linalg.norm(segments[:, 1] - segments[:, 0], axis=1)
+            first_normals, second_normals = normals[first], normals[second]
+            cosines = np.clip(np.sum(first_normals * second_normals, axis=1), -1, 1)
+            angles = np.arccos(cosines)
+            perpendicular = second_normals - cosines[:, np.newaxis] * first_normals
+            norms = np.linalg.norm(perpendicular, axis=1, keepdims=True)
+            perpendicular /= np.where(norms > 0, norms, 1)
+            wedge_args = (
+                segments,
+                first_normals,
+                perpendicular,
+                angles,
+                radius,
+                filled,
+            )
+            face_args = (triangles, triangle_normals, radius, filled)
+            ball_args = (poly._vertices, radius, filled)
+
+            if not filled:
+                return _PieceSampler(
+                    [
+                        (areas, _sample_prisms, face_args),
+                        (lengths * angles * radius, _sample_wedges, wedge_args),
+                        ([4 * np.pi * radius ** 2], _sample_vertex_balls, ball_args),
+                    ]
+                )
+            # The polyhedron is convex, so the tetrahedra formed by the surface
+            # triangles and any interior point do not overlap.
+            reference = np.mean(poly._vertices, axis=0)
+            tetrahedra = np.concatenate(
+                (np.broadcast_to(reference, (len(triangles), 1, 3)), triangles), axis=1
+            )
+            volumes = (
+                areas
+                * np.abs(
+                    np.sum((triangles[:, 0] - reference) * triangle_normals, axis=1)
+                )
+                / 3
+            )
+            return _PieceSampler(
+                [
+                    (volumes, _sample_simplices, (tetrahedra,)),
+                    (areas * radius, _sample_prisms, face_args),
+                    (
+                        lengths * angles * radius ** 2 / 2,
+                        _sample_wedges,
+                        wedge_args,
+                    ),
+                    (
+                        [4 / 3 * np.pi * radius ** 3],
+                        _sample_vertex_balls,
+                        ball_args,
+                    ),
+                ]
+            )
+
+        name = "volume" if filled else "surface"
+        poly = self._polyhedron
+        state = (poly, poly._faces, poly._vertices, self.radius)
+        return _get_cached_sampler(self, name, state, build)
+
+    def sample_volume(self, n, rng=None):  # noqa: D102
+        # Use the parent docstring.
+        return self._get_sampler(True).sample(n, np.random.default_rng(rng))
+
+    def sample_surface(self, n, rng=None):  # noqa: D102
+        # Use the parent docstring.
+        return self._get_sampler(False).sample(n, np.random.default_rng(rng))
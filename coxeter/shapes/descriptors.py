@@ -0,0 +1,319 @@
+r"""Compare shapes with rotation-invariant descriptors and distances.
+
+Aligning every pair of shapes in a large collection to compare them is
+prohibitively expensive. Instead, each shape is summarized by a short vector
+of features that are invariant to rotations, reflections, translations, and
+scaling (see :meth:`~.Polyhedron.get_descriptor` and
+:meth:`~.Polygon.get_descriptor`), so that similar shapes can be found with
+a nearest neighbor search among these vectors. For collections of
+:math:`10^5` shapes, computing the descriptors takes seconds and finding all
+near-duplicates takes a fraction of a second.
+
+Equal descriptors do not guarantee equal shapes, and the descriptors cannot
+distinguish a shape from its mirror image. Candidate pairs found by the
+descriptors can be confirmed with the Hausdorff distance
+
+.. math::
+
+    d_H(A, B) = \max\left(\max_{\vec{a} \in A} \min_{\vec{b} \in B}
+    |\vec{a} - \vec{b}|, \max_{\vec{b} \in B} \min_{\vec{a} \in A}
+    |\vec{a} - \vec{b}|\right),
+
+which depends on the relative orientation of the shapes. For convex shapes,
+the distance to the other shape is a convex function of the position, so
+the maxima are attained at vertices and the Hausdorff distance is computed
+exactly from the distances of the vertices of each shape to the faces and
+edges of the other.
+"""
+
+import numpy as np
+import rowan
+from scipy.spatial import cKDTree
+
+from .clipping import _padded_faces
+from .convex_polygon import ConvexPolygon
+from .convex_polyhedron import ConvexPolyhedron
+from .polygon import Polygon, _polygon_descriptors
+from .polyhedron import Polyhedron, _polyhedron_descriptors
+from .utils import _MAX_ELEMENTS_PER_BLOCK
+
+
+def shape_descriptors(shapes, degree=10):
+    """Compute the rotation-invariant descriptors of many shapes at once.
+
+    The descriptors of all shapes are computed together in vectorized form,
+    which is much faster than calling
+    :meth:`~.Polyhedron.get_descriptor` or :meth:`~.Polygon.get_descriptor`
+    for each shape. Nearby descriptors indicate similar shapes, so the
+    results can be passed to :func:`nearest_shapes` and
+    :func:`find_duplicate_shapes`.
+
+    Args:
+        shapes (sequence of :class:`~.Polyhedron` or :class:`~.Polygon`):
+            The shapes, which must either all be polyhedra or all be
+            polygons.
+        degree (int):
+            The largest degree of the spectra of the descriptors (Default
+            value: 10).
+
+    Returns:
+        :math:`(N_{shapes}, N_{features})` :class:`numpy.ndarray`:
+            The descriptors, with :math:`N_{features} = l_{max} + 2` for
+            polyhedra and :math:`N_{features} = k_{max} + 1` for polygons.
+
+    Example:
+        >>> family = coxeter.families.PlatonicFamily
+        >>> shapes = [family.get_shape(name) for name in family.data]
+        >>> descriptors = coxeter.shapes.shape_descriptors(shapes)
+        >>> descriptors.shape
+        (5, 12)
+
+    """
+    shapes = list(shapes)
+    if all(isinstance(shape, Polyhedron) for shape in shapes):
+        return _polyhedron_descriptors(shapes, degree)
+    elif all(isinstance(shape, Polygon) for shape in shapes):
+        return _polygon_descriptors(shapes, degree)
+    raise TypeError("The shapes must either all be polyhedra or all be polygons.")
+
+
+def nearest_shapes(descriptors, queries=None, k=1):
+    """Find the shapes with the most similar descriptors.
+
+    The descriptors are stored in a k-d tree, so each query takes
+    logarithmic time in the number of shapes.
+
+    Args:
+        descriptors (:math:`(N_{shapes}, N_{features})` array-like):
+            The descriptors of the shapes to search, e.g. computed with
+            :func:`shape_descriptors`.
+        queries (:math:`(N_{queries}, N_{features})` array-like, optional):
+            The descriptors for which to find the nearest shapes. If None,
+            the nearest other shapes are found for each shape in
+            ``descriptors`` (Default value: None).
+        k (int):
+            The number of nearest shapes to find (Default value: 1).
+
+    Returns:
+        tuple(:math:`(N_{queries}, k)` :class:`numpy.ndarray`, :math:`(N_{queries}, k)` :class:`numpy.ndarray`):
+            The Euclidean distances between the descriptors in increasing
+            order and the indices of the corresponding shapes.
+
+    Example:
+        >>> family = coxeter.families.PlatonicFamily
+        >>> shapes = [family.get_shape(name) for name in ("Cube", "Octahedron")]
+        >>> descriptors = coxeter.shapes.shape_descriptors(shapes)
+        >>> tetrahedron = family.get_shape("Tetrahedron")
+        >>> distances, indices = coxeter.shapes.nearest_shapes(
+        ...   descriptors, [tetrahedron.get_descriptor()])
+        >>> indices
+        array([[1]])
+
+    """  # noqa: E501
+    descriptors = np.asarray(descriptors, dtype=np.float64)
+    tree = cKDTree(descriptors)
+    if queries is not None:
+        distances, indices = tree.query(
+            np.asarray(queries, dtype=np.float64).reshape(-1, descriptors.shape[1]),
+            k=[i + 1 for i in range(k)],
+        )
+        return distances, indices
+
+    distances, indices = tree.query(descriptors, k=[i + 1 for i in range(k + 1)])
+    # Remove each shape from its own neighbors. Shapes with duplicate
+    # descriptors may be found before themselves, and if a shape is not found
+    # at all the farthest neighbor is removed instead.
+    keep = indices != np.arange(len(descriptors))[:, np.newaxis]
+    keep[np.all(keep, axis=1), -1] = False
+    return (
+        distances[keep].reshape(len(descriptors), k),
+        indices[keep].reshape(len(descriptors), k),
+    )
+
+
+def find_duplicate_shapes(descriptors, tolerance=1e-6):
+    """Find all pairs of shapes with nearly identical descriptors.
+
+    Args:
+        descriptors (:math:`(N_{shapes}, N_{features})` array-like):
+            The descriptors of the shapes, e.g. computed with
+            :func:`shape_descriptors`.
+        tolerance (float):
+            The largest Euclidean distance between the descriptors of
+            duplicates (Default value: 1e-6).
+
+    Returns:
+        :math:`(N_{pairs}, 2)` :class:`numpy.ndarray`:
+            The pairs of indices :math:`i < j` of duplicate shapes in
+            lexicographic order.
+
+    Example:
+        >>> cube = coxeter.families.PlatonicFamily.get_shape("Cube")
+        >>> box = coxeter.shapes.ConvexPolyhedron(
+        ...   cube.vertices * [1, 1, 2])
+        >>> rotated_cube = coxeter.shapes.ConvexPolyhedron(
+        ...   cube.vertices[:, [1, 2, 0]] * 3)
+        >>> descriptors = coxeter.shapes.shape_descriptors(
+        ...   [cube, box, rotated_cube])
+        >>> coxeter.shapes.find_duplicate_shapes(descriptors)
+        array([[0, 2]])
+
+    """
+    descriptors = np.asarray(descriptors, dtype=np.float64)
+    pairs = cKDTree(descriptors).query_pairs(tolerance, output_type="ndarray")
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))].reshape(-1, 2)
+
+
+def _boundary(shape):
+    """Get the faces and edges of a convex polyhedron or polygon.
+
+    Returns:
+        tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`):
+            The :math:`(N_{faces}, 4)` plane equations of the faces, the
+            :math:`(N_{faces}, N_{max}, 4)` equations of the planes through
+            the edges of each face perpendicular to the face with the face on
+            their negative side (zero for padding), and the start points and
+            vectors of all edges.
+    """  # noqa: E501
+    if isinstance(shape, Polyhedron):
+        vertices, counts = _padded_faces(shape)
+        normals = shape._equations[:, :3]
+        normals = normals / np.linalg.norm(normals, axis=1, keepdims=True)
+    else:
+        vertices = shape.vertices[np.newaxis]
+        counts = np.array([len(shape.vertices)])
+        normals = shape.normal[np.newaxis]
+
+    valid = np.arange(vertices.shape[1]) < counts[:, np.newaxis]
+    next_positions = (np.arange(vertices.shape[1]) + 1) % counts[:, np.newaxis]
+    edges = (
+        np.take_along_axis(vertices, next_positions[..., np.newaxis], axis=1) - vertices
+    )
+    # The faces are ordered counterclockwise about their normals, so the
+    # cross products of the edges with the normals point outward.
+    edge_normals = np.cross(edges, normals[:, np.newaxis])
+    edge_planes = np.concatenate(
+        (
+            edge_normals,
+            -np.einsum("fmi,fmi->fm", edge_normals, vertices)[..., np.newaxis],
+        ),
+        axis=-1,
+    )
+    edge_planes[~valid] = 0
+    planes = np.column_stack((normals, -np.einsum("fi,fi->f", normals, vertices[:, 0])))
+    return planes, edge_planes, vertices[valid], edges[valid]
+
+
+def _distances(points, shape):
+    """Compute the distances of points from a convex polyhedron or polygon.
+
+    The distance of a point outside of the shape is the smallest distance to
+    any edge and to any face whose interior contains the projection of the
+    point onto its plane.
+
+    Args:
+        points (:math:`(N_{points}, 3)` :class:`numpy.ndarray`):
+            The points.
+        shape (:class:`~.ConvexPolyhedron` or :class:`~.ConvexPolygon`):
+            The shape.
+
+    Returns:
+        :math:`(N_{points}, )` :class:`numpy.ndarray`:
+            The distances, which are zero for points inside the shape.
+    """
+    planes, edge_planes, starts, edges = _boundary(shape)
+    squared_lengths = np.einsum("ij,ij->i", edges, edges)
+    squared_lengths[squared_lengths == 0] = 1
+    block_size = max(
+        1, _MAX_ELEMENTS_PER_BLOCK // (edge_planes.shape[0] * edge_planes.shape[1])
+    )
+
+    distances = np.empty(len(points))
+    for begin in range(0, len(points), block_size):
+        block = points[begin : begin + block_size]
+        homogeneous = np.column_stack((block, np.ones(len(block))))
+
+        # The closest points on all edges.
+        relative = block[:, np.newaxis] - starts
+        fractions = np.clip(
+            np.einsum("pei,ei->pe", relative, edges) / squared_lengths, 0, 1
+        )
+        edge_distances = np.linalg.norm(
+            relative - fractions[..., np.newaxis] * edges, axis=-1
+        ).min(axis=1)
+
+        heights = homogeneous @ planes.T
+        within = np.all(np.einsum("pi,fmi->pfm", homogeneous, edge_planes) <= 0, axis=2)
+        face_distances = np.where(within, np.abs(heights), np.inf).min(axis=1)
+        result = np.minimum(edge_distances, face_distances)
+        if isinstance(shape, Polyhedron):
+            result[np.all(heights <= 0, axis=1)] = 0
+        distances[begin : begin + block_size] = result
+    return distances
+
+
+def hausdorff_distance(first, second, orientations=None):
+    """Compute the Hausdorff distance between two convex shapes.
+
+    The shapes are compared as solids (or filled polygons) in their given
+    positions, with the second shape rotated about the origin. Unlike
+    :func:`shape_descriptors`, the distance depends on the relative
+    orientation and position of the shapes, so shapes should be aligned
+    (e.g. with :func:`~.diagonalize_inertia_batch`) or the smallest distance
+    over many candidate orientations should be used.
+
+    Args:
+        first (:class:`~.ConvexPolyhedron` or :class:`~.ConvexPolygon`):
+            The first shape.
+        second (:class:`~.ConvexPolyhedron` or :class:`~.ConvexPolygon`):
+            The second shape, which must have the same dimension as the
+            first.
+        orientations (:math:`(N, 4)` array-like, optional):
+            Quaternions by which to rotate the second shape. If None, the
+            distance is computed for the given orientation and returned as a
+            single value (Default value: None).
+
+    Returns:
+        float or :math:`(N, )` :class:`numpy.ndarray`:
+            The Hausdorff distance for each orientation.
+
+    Example:
+        >>> cube = coxeter.families.PlatonicFamily.get_shape("Cube")
+        >>> large_cube = coxeter.shapes.ConvexPolyhedron(cube.vertices * 2)
+        >>> distance = coxeter.shapes.hausdorff_distance(cube, large_cube)
+        >>> np.isclose(distance, np.sqrt(3) / 2)
+        True
+
+    """
+    if not (
+        isinstance(first, ConvexPolyhedron) and isinstance(second, ConvexPolyhedron)
+    ) and not (isinstance(first, ConvexPolygon) and isinstance(second, ConvexPolygon)):
+        raise TypeError(
+            "The Hausdorff distance is only supported between two convex "
+            "polyhedra or two convex polygons."
+        )
+
+    single = orientations is None
+    if single:
+        orientations = np.array([[1.0, 0, 0, 0]])
+    orientations = np.asarray(orientations, dtype=np.float64).reshape(-1, 4)
+    num_orientations = len(orientations)
+
+    # The distances of the vertices of the first shape from the rotated
+    # second shape are the distances of the inversely rotated vertices from
+    # the second shape.
+    first_vertices = rowan.rotate(
+        rowan.conjugate(orientations)[:, np.newaxis], first.vertices[np.newaxis]
+    )
+    second_vertices = rowan.rotate(
+        orientations[:, np.newaxis], second.vertices[np.newaxis]
+    )
+    distances = np.maximum(
+        _distances(first_vertices.reshape(-1, 3), second)
+        .reshape(num_orientations, -1)
+        .max(axis=1),
+        _distances(second_vertices.reshape(-1, 3), first)
+        .reshape(num_orientations, -1)
+        .max(axis=1),
+    )
+    return distances[0] if single else distances
@@ -4,6 +4,7 @@ import numpy as np
 from scipy.special import ellipe
 
 from .base_classes import Shape2D
+from .utils import _sample_by_rejection, _sample_directions
 
 
 class Ellipse(Shape2D):
@@ -169,3 +170,26 @@ class Ellipse(Shape2D):
     def iq(self):
         """float: The isoperimetric quotient."""
         return np.min([4 * np.pi * self.area / (self.perimeter ** 2), 1])
+
+    def sample_volume(self, n, rng=None):  # noqa: D102
+        # Use the parent docstring.
+        rng = np.random.default_rng(rng)
+        distances = np.sqrt(rng.random((n, 1)))
+        points = distances * _sample_directions(n, rng, dimensions=2)
+        return self.center + np.insert(points * [self.a, self.b], 2, 0, axis=1)
+
+    def sample_surface(self, n, rng=None):  # noqa: D102
+        # Use the parent docstring.
+        rng = np.random.default_rng(rng)
+        scale = np.array([self.a, self.b])
+
+        def propose(num_proposals):
+            # Stretching the unit circle to the ellipse scales the length of
+            # each arc element by the norm of the tangent, so points on the
+            # circle are accepted proportionally to that norm.
+            directions = _sample_directions(num_proposals, rng, dimensions=2)
+            stretch = np.linalg.norm(directions[:, ::-1] * scale, axis=1)
+            points = np.insert(directions * scale, 2, 0, axis=1)
+            return points, stretch / np.max(scale)
+
+        return self.center + _sample_by_rejection(n, rng, propose)
@@ -1,10 +1,10 @@
 """Defines an ellipsoid."""
 
 import numpy as np
-from scipy.special import ellipeinc, ellipkinc
+from scipy.special import ellipeinc, ellipkinc, elliprg
 
 from .base_classes import Shape3D
-from .utils import translate_inertia_tensor
+from .utils import _sample_by_rejection, _sample_directions, translate_inertia_tensor
 
 
 class Ellipsoid(Shape3D):
@@ -139,6 +139,18 @@ class Ellipsoid(Shape3D):
         result = 2 * np.pi * (c ** 2 + a * b * elliptic_part)
         return result
 
+    @property
+    def mean_curvature(self):
+        r"""float: The integrated, normalized mean curvature.
+
+        The normalization matches :attr:`.ConvexPolyhedron.mean_curvature`,
+        i.e. this is the integral of the mean curvature divided by
+        :math:`4 \pi`, which equals half the mean width of the ellipsoid. It
+        is given by Carlson's symmetric elliptic integral
+        :math:`R_G(a^2, b^2, c^2)`.
+        """
+        return float(elliprg(self.a ** 2, self.b ** 2, self.c ** 2))
+
     @property
     def inertia_tensor(self):
         """float: Get the inertia tensor.
@@ -177,3 +189,27 @@ class Ellipsoid(Shape3D):
         points = np.atleast_2d(points) - self.center
         scale = np.array([self.a, self.b, self.c])
         return np.linalg.norm(points / scale, axis=-1) <= 1
+
+    def sample_volume(self, n, rng=None):  # noqa: D102
+        # Use the parent docstring.
+        rng = np.random.default_rng(rng)
+        scale = np.array([self.a, self.b, self.c])
+        distances = np.cbrt(rng.random((n, 1)))
+        return self.center + distances * _sample_directions(n, rng) * scale
+
+    def sample_surface(self, n, rng=None):  # noqa: D102
+        # Use the parent docstring.
+        rng = np.random.default_rng(rng)
+        scale = np.array([self.a, self.b, self.c])
+        # The scaling of the area element at each point of the unit sphere.
+        cofactors = np.prod(scale) / scale
+
+        def propose(num_proposals):
+            # Stretching the unit sphere to the ellipsoid scales each area
+            # element by a factor depending on its normal, so points on the
+            # sphere are accepted proportionally to that factor.
+            directions = _sample_directions(num_proposals, rng)
+            stretch = np.linalg.norm(directions * cofactors, axis=1)
+            return directions * scale, stretch / np.max(cofactors)
+
+        return self.center + _sample_by_rejection(n, rng, propose)
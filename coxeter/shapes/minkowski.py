@@ -0,0 +1,535 @@
+r"""Compute Minkowski sums of convex polygons and polyhedra.
+
+The Minkowski sum :math:`A \oplus B = \{a + b : a \in A, b \in B\}` of two
+convex polytopes can be computed as the convex hull of all pairwise sums of
+their vertices, but this requires a hull of :math:`N_A N_B` points. Instead,
+the sums here are constructed from the overlay of the Gauss maps of the two
+shapes, i.e. the decompositions of the sphere of directions into the normal
+cones of their vertices :cite:`Fogel2007`. Every face of the sum is
+
+- a face of :math:`A` translated by the vertex of :math:`B` in the direction
+  of its normal,
+- a face of :math:`B` translated by the vertex of :math:`A` in the direction
+  of its normal, or
+- a parallelogram spanned by an edge of :math:`A` and an edge of :math:`B`
+  whose arcs on the Gauss sphere (connecting the normals of their adjacent
+  faces) cross.
+
+Each face is therefore known from the combinatorics of the two shapes,
+without any hull computation. For polygons, the Gauss map reduces to the
+sequence of edge directions, and the sum is obtained by merging the edges of
+the two polygons sorted by angle.
+
+Orientations at which faces of one shape are parallel to faces or edges of
+the other (e.g. aligned cubes) are degenerate, since the sum then contains
+faces composed of more than one feature of each shape. For these
+orientations, the faces of the overlay of a slightly rotated copy are
+evaluated at the original orientation, where they either collapse or tile the
+faces of the sum, and the tiles of each face are merged.
+"""
+
+import numpy as np
+import rowan
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
+
+from .convex_polygon import ConvexPolygon
+from .convex_polyhedron import ConvexPolyhedron, _merge_coplanar_cells
+from .convex_spheropolygon import ConvexSpheropolygon
+from .convex_spheropolyhedron import ConvexSpheropolyhedron
+from .polyhedron import (
+    _find_shared_edges,
+    _flatten_faces,
+    _neighbors_from_pairs,
+    _orient_faces,
+    _planes_close,
+    _split_faces,
+    _vertex_heights,
+)
+from .utils import _MAX_ELEMENTS_PER_BLOCK
+
+# A small fixed rotation used to break ties at degenerate orientations. Since
+# Minkowski sums are continuous in the orientation, resolving degenerate
+# configurations (e.g. parallel faces) like their slightly rotated
+# counterparts gives the correct limit.
+_TIE_BREAKING_ROTATION = rowan.to_matrix(
+    rowan.from_axis_angle([1, np.sqrt(2), np.pi], 1e-6)
+)
+
+# The tolerance for detecting degenerate orientations, relative to the size
+# of the shapes.
+_DEGENERACY_TOLERANCE = 1e-9
+
+
+def _arc_crossings(starts, ends, other_starts, other_ends):
+    r"""Determine which pairs of arcs on the unit sphere cross.
+
+    Two arcs shorter than :math:`\pi` cross if each one separates the end
+    points of the other and both contain the same of the two intersection
+    points :math:`\pm (a_1 \times a_2) \times (b_1 \times b_2)` of their
+    great circles. Arcs that only touch at their end points do not cross.
+
+    Args:
+        starts, ends (:math:`(E, 3)` :class:`numpy.ndarray`):
+            The end points of the first set of arcs.
+        other_starts, other_ends (:math:`(N, F, 3)` :class:`numpy.ndarray`):
+            The end points of :math:`N` sets of arcs to test against the
+            first set.
+
+    Returns:
+        :math:`(N, E, F)` :class:`numpy.ndarray` of int:
+            1 if a pair of arcs crosses at
+            :math:`(a_1 \times a_2) \times (b_1 \times b_2)`, -1 if it crosses
+            at the opposite point, and 0 if it does not cross.
+    """
+    p = np.cross(starts, ends)
+    q = np.cross(other_starts, other_ends)
+    a1q = np.einsum("ei,nfi->nef", starts, q)
+    a2q = np.einsum("ei,nfi->nef", ends, q)
+    b1p = np.einsum("nfi,ei->nef", other_starts, p)
+    b2p = np.einsum("nfi,ei->nef", other_ends, p)
+    forward = (a1q > 0) & (a2q < 0) & (b1p < 0) & (b2p > 0)
+    backward = (a1q < 0) & (a2q > 0) & (b1p > 0) & (b2p < 0)
+    return forward.astype(np.int8) - backward
+
+
+class _PolyhedronData:
+    """The combinatorial data of a convex polyhedron used to build sums."""
+
+    def __init__(self, polyhedron):
+        self.vertices = polyhedron._vertices
+        self.indices, self.face_ids, self.offsets, _ = _flatten_faces(polyhedron.faces)
+        # Only vertices of faces can support the polyhedron.
+        self.used = np.unique(self.indices)
+        self.normals = polyhedron._equations[:, :3]
+        first, second, self.edges = polyhedron._find_face_intersections()
+        self.arc_starts = self.normals[first]
+        self.arc_ends = self.normals[second]
+
+
+def _supports(normals, vertices, used):
+    """Find the supporting vertices of many directions.
+
+    Args:
+        normals (:math:`(N, F, 3)` :class:`numpy.ndarray`):
+            The directions.
+        vertices (:math:`(N, V, 3)` :class:`numpy.ndarray`):
+            The vertices.
+        used (:class:`numpy.ndarray`):
+            The indices of the vertices to consider.
+
+    Returns:
+        tuple(:math:`(N, F)` :class:`numpy.ndarray`, :math:`(N, F)` :class:`numpy.ndarray`):
+            The index of the supporting vertex of each direction and the gap
+            between the largest and second largest projections, which
+            vanishes if a direction is supported by more than one vertex.
+    """  # noqa: E501
+    projections = np.einsum("nfi,nvi->nfv", normals, vertices[:, used])
+    top = np.partition(projections, len(used) - 2, axis=-1)[..., -2:]
+    return used[np.argmax(projections, axis=-1)], top[..., 1] - top[..., 0]
+
+
+def _overlay_faces(first, second, rotations):
+    """Compute the faces of Minkowski sums from the overlay of Gauss maps.
+
+    The vertices of the sums are identified by the pairs of vertices of the
+    two polyhedra that they are composed of, encoded as
+    ``i * num_second_vertices + j``.
+
+    Args:
+        first, second (:class:`_PolyhedronData`):
+            The polyhedra.
+        rotations (:math:`(N, 3, 3)` :class:`numpy.ndarray`):
+            The rotation matrices applied to the second polyhedron.
+
+    Returns:
+        tuple(list(tuple), :math:`(N, )` :class:`numpy.ndarray`):
+            For each sum, a tuple ``(keys, face_sizes, normals)`` containing
+            the vertex pairs of all faces concatenated, the number of
+            vertices of each face, and the outward normal of each face. Also
+            the smallest gap between the supporting vertices of any face
+            normal of either polyhedron for each sum, which vanishes at
+            degenerate orientations.
+    """
+    stride = len(second.vertices)
+    vertices = np.einsum("nij,vj->nvi", rotations, second.vertices)
+    normals = np.einsum("nij,fj->nfi", rotations, second.normals)
+    arc_starts = np.einsum("nij,ej->nei", rotations, second.arc_starts)
+    arc_ends = np.einsum("nij,ej->nei", rotations, second.arc_ends)
+
+    # Faces of each polyhedron translated by the supporting vertex of the
+    # other one in the direction of their normal.
+    support, first_gaps = _supports(
+        np.broadcast_to(first.normals, (len(rotations),) + first.normals.shape),
+        vertices,
+        second.used,
+    )
+    first_keys = first.indices * stride + support[:, first.face_ids]
+    support, second_gaps = _supports(normals, first.vertices[np.newaxis], first.used)
+    second_keys = support[:, second.face_ids] * stride + second.indices
+
+    # Parallelograms spanned by pairs of edges whose arcs cross. The crossing
+    # point on the Gauss sphere is the outward normal of the parallelogram.
+    crossings = _arc_crossings(first.arc_starts, first.arc_ends, arc_starts, arc_ends)
+    orientation_ids, first_edges, second_edges = np.nonzero(crossings)
+    a0, a1 = first.edges[first_edges].T
+    b0, b1 = second.edges[second_edges].T
+    crossing_normals = np.cross(
+        first.vertices[a1] - first.vertices[a0],
+        vertices[orientation_ids, b1] - vertices[orientation_ids, b0],
+    )
+    directions = crossings[orientation_ids, first_edges, second_edges][
+        :, np.newaxis
+    ] * np.cross(
+        np.cross(first.arc_starts, first.arc_ends)[first_edges],
+        np.cross(arc_starts, arc_ends)[orientation_ids, second_edges],
+    )
+    counterclockwise = np.sum(crossing_normals * directions, axis=1) > 0
+    crossing_normals[~counterclockwise] *= -1
+    crossing_normals /= np.linalg.norm(crossing_normals, axis=1, keepdims=True)
+    crossing_keys = np.stack(
+        (a0 * stride + b0, a1 * stride + b0, a1 * stride + b1, a0 * stride + b1),
+        axis=1,
+    )
+    # Traversing a parallelogram backwards flips its orientation.
+    crossing_keys[~counterclockwise] = crossing_keys[~counterclockwise, ::-1]
+
+    face_sizes = (np.diff(first.offsets), np.diff(second.offsets))
+    offsets = np.searchsorted(orientation_ids, np.arange(len(rotations) + 1))
+    faces = []
+    for n, (start, end) in enumerate(zip(offsets[:-1], offsets[1:])):
+        faces.append(
+            (
+                np.concatenate(
+                    (first_keys[n], second_keys[n], crossing_keys[start:end].ravel())
+                ),
+                np.concatenate((*face_sizes, np.full(end - start, 4))),
+                np.concatenate(
+                    (first.normals, normals[n], crossing_normals[start:end])
+                ),
+            )
+        )
+
+    gaps = np.minimum(np.min(first_gaps, axis=1), np.min(second_gaps, axis=1))
+    return faces, gaps
+
+
+def _polyhedron_from_faces(vertices, keys, face_sizes, normals):
+    """Construct a convex polyhedron from the faces of a Minkowski sum.
+
+    Args:
+        vertices (tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`)):
+            The vertices of the two summands.
+        keys (:class:`numpy.ndarray`):
+            The vertex pairs of all faces concatenated.
+        face_sizes (:class:`numpy.ndarray`):
+            The number of vertices of each face.
+        normals (:math:`(N_{faces}, 3)` :class:`numpy.ndarray`):
+            The outward normals of the faces.
+
+    Returns:
+        :class:`~.ConvexPolyhedron`: The sum.
+    """
+    first, second = vertices
+    unique, indices = np.unique(keys, return_inverse=True)
+    i, j = np.divmod(unique, len(second))
+    offsets = np.concatenate(([0], np.cumsum(face_sizes)))
+
+    # The faces are already sorted and merged, so the constructor is skipped.
+    polyhedron = ConvexPolyhedron.__new__(ConvexPolyhedron)
+    polyhedron._vertices = first[i] + second[j]
+    polyhedron._faces = _split_faces(indices, offsets)
+    polyhedron._faces_are_convex = True
+    polyhedron._equations = np.empty((len(normals), 4))
+    polyhedron._equations[:, :3] = normals
+    polyhedron._equations[:, 3] = -np.sum(
+        normals * polyhedron._vertices[indices[offsets[:-1]]], axis=1
+    )
+    face_ids = np.repeat(np.arange(len(face_sizes)), face_sizes)
+    next_positions = np.arange(1, len(indices) + 1)
+    next_positions[offsets[1:] - 1] = offsets[:-1]
+    first_faces, second_faces, _, _ = _find_shared_edges(
+        indices, face_ids, next_positions
+    )
+    polyhedron._neighbors = _neighbors_from_pairs(
+        first_faces, second_faces, len(face_sizes)
+    )
+    return polyhedron
+
+
+def _merge_tiles(vertices, keys, face_sizes, tolerance):
+    """Merge the faces of a Minkowski sum at a slightly rotated orientation.
+
+    At a degenerate orientation, the faces of the sum at a slightly rotated
+    orientation either collapse or tile the faces of the sum once their
+    vertices are evaluated at the degenerate orientation. Coinciding vertices
+    are identified, collapsed tiles are removed, and coplanar tiles are
+    merged into faces.
+
+    Args:
+        vertices (tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`)):
+            The vertices of the two summands at the degenerate orientation.
+        keys (:class:`numpy.ndarray`):
+            The vertex pairs of all tiles concatenated.
+        face_sizes (:class:`numpy.ndarray`):
+            The number of vertices of each tile.
+        tolerance (float):
+            The distance below which vertices coincide.
+
+    Returns:
+        tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`, :math:`(N_{faces}, 3)` :class:`numpy.ndarray`):
+            The vertex pairs of all faces concatenated, the number of vertices
+            of each face, and the outward normal of each face.
+    """  # noqa: E501
+    first, second = vertices
+    unique, indices = np.unique(keys, return_inverse=True)
+    i, j = np.divmod(unique, len(second))
+    points = first[i] + second[j]
+    num_points = len(points)
+
+    # Vertices that coincide at the degenerate orientation are identified.
+    pairs = cKDTree(points).query_pairs(tolerance, output_type="ndarray")
+    _, labels = connected_components(
+        coo_matrix(
+            (np.ones(len(pairs)), (pairs[:, 0], pairs[:, 1])),
+            shape=(num_points, num_points),
+        ),
+        directed=False,
+    )
+    _, representatives = np.unique(labels, return_index=True)
+    indices = representatives[labels[indices]]
+
+    # Collapsed tiles have no area. The vector areas of the other tiles give
+    # their normals.
+    offsets = np.concatenate(([0], np.cumsum(face_sizes)))
+    tile_ids = np.repeat(np.arange(len(face_sizes)), face_sizes)
+    next_positions = np.arange(1, len(indices) + 1)
+    next_positions[offsets[1:] - 1] = offsets[:-1]
+    areas = np.add.reduceat(
+        np.cross(points[indices], points[indices[next_positions]]), offsets[:-1]
+    )
+    magnitudes = np.linalg.norm(areas, axis=1)
+    kept = magnitudes > tolerance * np.ptp(points)
+    normals = areas[kept] / magnitudes[kept, np.newaxis]
+    equations = np.column_stack(
+        (normals, -np.sum(normals * points[indices[offsets[:-1][kept]]], axis=1))
+    )
+
+    # Since the sum is convex, tiles are part of the same face if and only if
+    # they lie in the same plane.
+    tile_first, tile_second = np.triu_indices(len(normals), 1)
+    merge = _planes_close(
+        equations[tile_first], equations[tile_second], atol=1e-8, rtol=1e-5
+    )
+    _, labels = connected_components(
+        coo_matrix(
+            (np.ones(np.count_nonzero(merge)), (tile_first[merge], tile_second[merge])),
+            shape=(len(normals), len(normals)),
+        ),
+        directed=False,
+    )
+    positions = np.flatnonzero(kept[tile_ids])
+    labels, indices, face_ids, offsets = _merge_coplanar_cells(
+        points, indices[positions], (np.cumsum(kept) - 1)[tile_ids[positions]], labels
+    )
+    _, representatives = np.unique(labels, return_index=True)
+    normals = normals[representatives]
+    indices = _orient_faces(points, indices, face_ids, offsets, normals)
+
+    # Vertices of the sum are corners of at least one face, while the other
+    # vertices of tiles lie inside the edges of the faces.
+    heights = _vertex_heights(points[indices], face_ids, normals)
+    corners = np.isin(indices, indices[heights > tolerance])
+    indices, face_ids = indices[corners], face_ids[corners]
+    return unique[indices], np.bincount(face_ids, minlength=len(normals)), normals
+
+
+def _polyhedron_sums(first, second, rotations):
+    """Compute the Minkowski sums of two polyhedra at many orientations."""
+    first, second = _PolyhedronData(first), _PolyhedronData(second)
+    tolerance = _DEGENERACY_TOLERANCE * (
+        np.ptp(first.vertices) + np.ptp(second.vertices)
+    )
+    block_size = max(
+        1,
+        _MAX_ELEMENTS_PER_BLOCK
+        // max(
+            len(first.normals) * len(second.used),
+            len(second.normals) * len(first.used),
+            len(first.edges) * len(second.edges),
+            1,
+        ),
+    )
+
+    sums = []
+    for start in range(0, len(rotations), block_size):
+        block = rotations[start : start + block_size]
+        faces, gaps = _overlay_faces(first, second, block)
+        degenerate = np.flatnonzero(gaps <= tolerance)
+        if len(degenerate):
+            # The faces of the sum are tiled by the faces of the sum at a
+            # slightly different orientation.
+            perturbed, _ = _overlay_faces(
+                first, second, block[degenerate] @ _TIE_BREAKING_ROTATION
+            )
+        for n, (keys, face_sizes, normals) in enumerate(faces):
+            vertices = (first.vertices, second.vertices @ block[n].T)
+            if n in degenerate:
+                keys, face_sizes, _ = perturbed[np.searchsorted(degenerate, n)]
+                keys, face_sizes, normals = _merge_tiles(
+                    vertices, keys, face_sizes, tolerance
+                )
+            sums.append(_polyhedron_from_faces(vertices, keys, face_sizes, normals))
+    return sums
+
+
+def _polygon_sums(first, second, rotations):
+    """Compute the Minkowski sums of two polygons at many orientations.
+
+    The edges of a convex polygon ordered counterclockwise are sorted by
+    angle, so the edges of the sum are the edges of both polygons merged by
+    angle, starting from the sum of the vertices at which the edge angles
+    wrap around.
+    """
+    normal = first.normal
+    first_vertices = first.vertices
+    second_vertices = second.vertices
+    if np.dot(second.normal, normal) < 0:
+        second_vertices = second_vertices[::-1]
+
+    # Measure the angles of all edges in the plane of the polygons.
+    basis = first_vertices[1] - first_vertices[0]
+    basis /= np.linalg.norm(basis)
+    basis = np.stack((basis, np.cross(normal, basis)))
+
+    def edge_angles(edges):
+        coordinates = edges @ basis.T
+        return np.arctan2(coordinates[..., 1], coordinates[..., 0]) % (2 * np.pi)
+
+    second_vertices = np.einsum("nij,vj->nvi", rotations, second_vertices)
+    vertices = (
+        np.broadcast_to(first_vertices, (len(rotations),) + first_vertices.shape),
+        second_vertices,
+    )
+    edges = np.concatenate(
+        [np.roll(verts, -1, axis=1) - verts for verts in vertices], axis=1
+    )
+    angles = edge_angles(edges)
+    num_first = len(first_vertices)
+    starts = [
+        np.argmin(angles[:, :num_first], axis=1),
+        np.argmin(angles[:, num_first:], axis=1),
+    ]
+    origins = (
+        vertices[0][np.arange(len(rotations)), starts[0]]
+        + vertices[1][np.arange(len(rotations)), starts[1]]
+    )
+
+    order = np.argsort(angles, axis=1, kind="stable")
+    angles = np.take_along_axis(angles, order, axis=1)
+    edges = np.take_along_axis(edges, order[..., np.newaxis], axis=1)
+    sum_vertices = origins[:, np.newaxis] + np.cumsum(edges, axis=1) - edges
+
+    # Parallel edges of the two polygons form a single edge of the sum.
+    gaps = np.diff(angles, axis=1, prepend=angles[:, -1:] - 2 * np.pi)
+    keep = gaps > _DEGENERACY_TOLERANCE
+    return [
+        ConvexPolygon.from_trusted_vertices(verts[mask], normal)
+        for verts, mask in zip(sum_vertices, keep)
+    ]
+
+
+def minkowski_sum(first, second, orientations=None):
+    r"""Compute the Minkowski sum of two convex polygons or polyhedra.
+
+    The sum :math:`A \oplus B` is computed from the overlay of the Gauss
+    maps of the shapes, which scales linearly with the number of their
+    features rather than with the product of their numbers of vertices. The
+    sum of two rounded shapes is the sum of the underlying shapes rounded by
+    the sum of their radii.
+
+    The excluded volume shape :math:`A \oplus (-B)`, i.e. the region of
+    positions of :math:`B` relative to :math:`A` in which the two overlap, is
+    the sum of :math:`A` and :math:`B` reflected through the origin.
+
+    Args:
+        first (:class:`~.Shape`):
+            A :class:`~.ConvexPolyhedron`, :class:`~.ConvexSpheropolyhedron`,
+            :class:`~.ConvexPolygon`, or :class:`~.ConvexSpheropolygon`.
+        second (:class:`~.Shape`):
+            The shape to add, which must have the same dimension as
+            ``first``. Polygons must lie in parallel planes.
+        orientations (:class:`numpy.ndarray`, optional):
+            A stack of orientations of ``second`` about the origin. For
+            polyhedra, these are :math:`(N, 4)` quaternions. For polygons,
+            these are :math:`(N, )` angles of rotations about the normal of
+            ``first``. If None, ``second`` is not rotated (Default value:
+            None).
+
+    Returns:
+        :class:`~.Shape` or list(:class:`~.Shape`):
+            The sum, or the sum at each orientation if ``orientations`` is
+            provided.
+
+    Example:
+        >>> cube = coxeter.shapes.ConvexPolyhedron(
+        ...   [[1, 1, 1], [1, -1, 1], [1, 1, -1], [1, -1, -1],
+        ...    [-1, 1, 1], [-1, -1, 1], [-1, 1, -1], [-1, -1, -1]])
+        >>> octahedron = coxeter.shapes.ConvexPolyhedron(
+        ...   [[1, 0, 0], [-1, 0, 0], [0, 1, 0], [0, -1, 0], [0, 0, 1], [0, 0, -1]])
+        >>> shape = coxeter.shapes.minkowski_sum(cube, octahedron)
+        >>> shape.num_vertices, shape.num_faces
+        (24, 26)
+        >>> import numpy as np
+        >>> assert np.isclose(shape.volume, 8 + 24 + 12 + 4 / 3)
+        >>> shapes = coxeter.shapes.minkowski_sum(
+        ...   cube, octahedron, orientations=[[1, 0, 0, 0], [0, 1, 0, 0]])
+        >>> len(shapes)
+        2
+
+    """
+    radius = 0
+    rounded = (ConvexSpheropolyhedron, ConvexSpheropolygon)
+    shapes = []
+    for shape in (first, second):
+        if isinstance(shape, ConvexSpheropolyhedron):
+            radius += shape.radius
+            shape = shape.polyhedron
+        elif isinstance(shape, ConvexSpheropolygon):
+            radius += shape.radius
+            shape = shape.polygon
+        if not isinstance(shape, (ConvexPolyhedron, ConvexPolygon)):
+            raise TypeError(
+                "Minkowski sums can only be computed for convex polygons, "
+                "convex polyhedra, and their rounded counterparts."
+            )
+        shapes.append(shape)
+
+    if all(isinstance(shape, ConvexPolyhedron) for shape in shapes):
+        if orientations is None:
+            rotations = np.eye(3)[np.newaxis]
+        else:
+            rotations = rowan.to_matrix(np.asarray(orientations, dtype=np.float64))
+        sums = _polyhedron_sums(*shapes, rotations)
+    elif all(isinstance(shape, ConvexPolygon) for shape in shapes):
+        if not np.isclose(np.abs(np.dot(shapes[0].normal, shapes[1].normal)), 1):
+            raise ValueError("The polygons must lie in parallel planes.")
+        angles = np.zeros(1) if orientations is None else np.asarray(orientations)
+        rotations = rowan.to_matrix(
+            rowan.from_axis_angle(shapes[0].normal, angles.ravel())
+        )
+        sums = _polygon_sums(*shapes, rotations)
+    else:
+        raise TypeError("Both shapes must have the same dimension.")
+
+    if isinstance(first, rounded) or isinstance(second, rounded):
+        for i, shape in enumerate(sums):
+            if isinstance(shape, ConvexPolyhedron):
+                sums[i] = ConvexSpheropolyhedron.__new__(ConvexSpheropolyhedron)
+                sums[i]._polyhedron = shape
+            else:
+                sums[i] = ConvexSpheropolygon.__new__(ConvexSpheropolygon)
+                sums[i]._polygon = shape
+            sums[i].radius = radius
+    return sums[0] if orientations is None else sums
@@ -3,11 +3,19 @@
 import numpy as np
 import rowan
 
-from ..bentley_ottmann import poly_point_isect
+from ..bentley_ottmann import is_simple_batch
 from ..polytri import polytri
 from .base_classes import Shape2D
 from .circle import Circle
-from .utils import _generate_ax, rotate_order2_tensor, translate_inertia_tensor
+from .utils import (
+    _generate_ax,
+    _get_cached_sampler,
+    _PieceSampler,
+    _sample_simplices,
+    _segment_sum,
+    rotate_order2_tensor,
+    translate_inertia_tensor,
+)
 
 try:
     import miniball
@@ -44,15 +52,58 @@ def _align_points_by_normal(normal, points):
     return np.dot(points, rotation.T)
 
 
+def _planar_moments(verts):
+    """Compute the planar moments of inertia of a polygon in the xy plane.
+
+    See :attr:`Polygon.planar_moments_inertia` for the formulas.
+
+    Args:
+        verts (:math:`(N, 3)` :class:`numpy.ndarray`):
+            The vertices of the polygon, which must lie in the :math:`xy`
+            plane.
+
+    Returns:
+        tuple(float, float, float): The planar moments :math:`I_x`,
+        :math:`I_y`, and the product of inertia :math:`I_{xy}`.
+    """
+    shifted_verts = np.roll(verts, shift=-1, axis=0)
+
+    xi_yip1 = verts[:, 0] * shifted_verts[:, 1]
+    xip1_yi = verts[:, 1] * shifted_verts[:, 0]
+
+    areas = xi_yip1 - xip1_yi
+
+    # These are the terms in the formulas for Ix and Iy, which are computed
+    # simulataneously since they're identical except that they use either
+    # the x or y coordinates.
+    sv_sq = shifted_verts ** 2
+    verts_sq = verts ** 2
+    prod = verts * shifted_verts
+
+    # This accounts for the x_i*y_{i+1} and x_{i+1}*y_i terms in Ixy.
+    xi_yi = verts[:, 0] * verts[:, 1]
+    xip1_yip1 = shifted_verts[:, 0] * shifted_verts[:, 1]
+
+    # Need to take absolute values in case vertices are ordered clockwise.
+    diag_sums = areas[:, np.newaxis] * (verts_sq + prod + sv_sq)
+    i_y, i_x, _ = np.abs(np.sum(diag_sums, axis=0) / 12)
+
+    xy_sums = areas * (xi_yip1 + 2 * (xi_yi + xip1_yip1) + xip1_yi)
+    i_xy = np.abs(np.sum(xy_sums) / 24)
+
+    return i_x, i_y, i_xy
+
+
 def _is_simple(vertices):
     """Check if the vertices define a simple polygon.
 
-    This code directly calls through to an external implementation
+    Small polygons are checked with vectorized pairwise segment intersection
+    tests, while larger ones are passed through to an external implementation
     (https://github.com/ideasman42/isect_segments-bentley_ottmann) of the
     Bentley-Ottmann algorithm to check for intersections between the line
-    segments.
+    segments. See :func:`~coxeter.bentley_ottmann.is_simple_batch`.
     """
-    return len(poly_point_isect.isect_polygon(vertices)) == 0
+    return is_simple_batch([vertices])[0]
 
 
 class Polygon(Shape2D):
@@ -129,28 +180,16 @@ class Polygon(Shape2D):
         if len(indices) != vertices.shape[0]:
             raise ValueError("Found duplicate vertices.")
 
-        # For convenience, we support providing vertices without z components,
-        # but the stored vertices are always Nx3.
-        if vertices.shape[1] == 2:
-            self._vertices = np.hstack((vertices, np.zeros((vertices.shape[0], 1))))
-        else:
-            self._vertices = vertices
+        self._set_vertices(vertices, None)
 
         # Note: Vertices do not yet need to be ordered for the purpose of
         # determining the normal, this check can be performed irrespective of
         # ordering since any cross product of vectors will provide a normal.
-        computed_normal = np.cross(
-            self._vertices[2, :] - self._vertices[1, :],
-            self._vertices[0, :] - self._vertices[1, :],
-        )
-        computed_normal /= np.linalg.norm(computed_normal)
-        if normal is None:
-            self._normal = computed_normal
-        else:
+        if normal is not None:
             norm_normal = np.asarray(normal, dtype=np.float64)
             norm_normal /= np.linalg.norm(normal)
 
-            if not np.isclose(np.abs(np.dot(computed_normal, norm_normal)), 1):
+            if not np.isclose(np.abs(np.dot(self._normal, norm_normal)), 1):
                 raise ValueError(
                     "The provided normal vector is not orthogonal to the polygon."
                 )
@@ -161,19 +200,97 @@ class Polygon(Shape2D):
         # desired polygon, it might be necessary to implement more robust
         # checks based on something like
         # http://www.cs.cmu.edu/~quake/robust.html
-        for v in self.vertices:
-            if not np.isclose(self._normal.dot(v), d, planar_tolerance):
-                raise ValueError("Not all vertices are coplanar.")
+        if not np.all(
+            np.isclose(self._vertices.dot(self._normal), d, planar_tolerance)
+        ):
+            raise ValueError("Not all vertices are coplanar.")
 
         if test_simple:
+            self._check_simple()
+
+    def _check_simple(self, is_simple=None):
+        """Raise a ValueError if the polygon is not simple.
+
+        Args:
+            is_simple (bool, optional):
+                The precomputed result of the simplicity check, e.g. from
+                :func:`~coxeter.bentley_ottmann.is_simple_batch`. If None, the
+                check is performed (Default value: None).
+        """
+        if is_simple is None:
             planar_vertices = _align_points_by_normal(self._normal, self._vertices)
-            if not _is_simple(planar_vertices):
-                raise ValueError(
-                    "The vertices must be passed in counterclockwise order. "
-                    "Note that the Polygon class only supports simple "
-                    "polygons, so self-intersecting polygons are not "
-                    "permitted."
-                )
+            is_simple = _is_simple(planar_vertices)
+        if not is_simple:
+            raise ValueError(
+                "The vertices must be passed in counterclockwise order. "
+                "Note that the Polygon class only supports simple "
+                "polygons, so self-intersecting polygons are not "
+                "permitted."
+            )
+
+    def _set_vertices(self, vertices, normal):
+        """Store the vertices and normal without any validation.
+
+        For convenience, we support providing vertices without z components,
+        but the stored vertices are always Nx3. If no normal is provided, it is
+        computed from the first three vertices as described in the class
+        docstring.
+        """
+        if vertices.shape[1] == 2:
+            self._vertices = np.hstack((vertices, np.zeros((vertices.shape[0], 1))))
+        else:
+            self._vertices = vertices
+
+        if normal is None:
+            normal = np.cross(
+                self._vertices[2, :] - self._vertices[1, :],
+                self._vertices[0, :] - self._vertices[1, :],
+            )
+        else:
+            normal = np.array(normal, dtype=np.float64)
+        self._normal = normal / np.linalg.norm(normal)
+
+    @classmethod
+    def from_trusted_vertices(cls, vertices, normal=None):
+        """Construct a polygon from vertices that are known to be valid.
+
+        Constructing a polygon normally involves checking for duplicate
+        vertices, verifying that the vertices are coplanar and (optionally)
+        checking for self-intersections, and subclasses may perform additional
+        validation or sorting. This method skips all of these steps, so it is
+        substantially faster when constructing many polygons from data that
+        has already been validated, e.g. the faces of a polyhedron. The
+        vertices must already be ordered in the manner the class expects
+        (counterclockwise relative to the normal for convex polygons).
+
+        .. warning::
+
+            No checks are performed on the input, so invalid vertices will
+            silently produce invalid results.
+
+        Args:
+            vertices (:math:`(N, 3)` or :math:`(N, 2)` :class:`numpy.ndarray`):
+                The vertices of the polygon.
+            normal (sequence of length 3 or None):
+                The normal vector to the polygon. If :code:`None`, the normal
+                is computed from the first three vertices as in the
+                constructor (Default value: None).
+
+        Returns:
+            An instance of this class with the provided vertices.
+
+        Example:
+            >>> square = coxeter.shapes.ConvexPolygon.from_trusted_vertices(
+            ...   [[0, 0], [1, 0], [1, 1], [0, 1]])
+            >>> square.area
+            1.0
+            >>> import numpy as np
+            >>> assert np.allclose(square.normal, [0, 0, 1])
+
+        """
+        polygon = cls.__new__(cls)
+        polygon._set_vertices(np.array(vertices, dtype=np.float64), normal)
+        return polygon
 
     def reorder_verts(self, clockwise=False, ref_index=0, increasing_length=True):
         """Sort the vertices.
@@ -345,34 +462,7 @@ class Polygon(Shape2D):
         :math:`y` position) should not be relied upon.
         """  # noqa: E501
         # Rotate shape so that normal vector coincides with z-axis.
-        verts = _align_points_by_normal(self._normal, self._vertices)
-
-        shifted_verts = np.roll(verts, shift=-1, axis=0)
-
-        xi_yip1 = verts[:, 0] * shifted_verts[:, 1]
-        xip1_yi = verts[:, 1] * shifted_verts[:, 0]
-
-        areas = xi_yip1 - xip1_yi
-
-        # These are the terms in the formulas for Ix and Iy, which are computed
-        # simulataneously since they're identical except that they use either
-        # the x or y coordinates.
-        sv_sq = shifted_verts ** 2
-        verts_sq = verts ** 2
-        prod = verts * shifted_verts
-
-        # This accounts for the x_i*y_{i+1} and x_{i+1}*y_i terms in Ixy.
-        xi_yi = verts[:, 0] * verts[:, 1]
-        xip1_yip1 = shifted_verts[:, 0] * shifted_verts[:, 1]
-
-        # Need to take absolute values in case vertices are ordered clockwise.
-        diag_sums = areas[:, np.newaxis] * (verts_sq + prod + sv_sq)
-        i_y, i_x, _ = np.abs(np.sum(diag_sums, axis=0) / 12)
-
-        xy_sums = areas * (xi_yip1 + 2 * (xi_yi + xip1_yip1) + xip1_yi)
-        i_xy = np.abs(np.sum(xy_sums) / 24)
-
-        return i_x, i_y, i_xy
+        return _planar_moments(_align_points_by_normal(self._normal, self._vertices))
 
     @property
     def inertia_tensor(self):
@@ -384,30 +474,26 @@ class Polygon(Shape2D):
         relative to its centroid. The tensor is then rotated back to the
         orientation of the polygon and shifted to the original centroid.
         """
-        # Save the original configuration as we translate and rotate it to the
-        # origin so that we can reset after (since we're modifying the internal
-        # state in order to use self.polar_moment_inertia). The sequence here
-        # is important: we must translate before rotating so that the parallel
-        # axis theorem can be applied in the reverse direction (rotating about
-        # the origin before translating to the actual centroid).
+        # The moments are computed for a copy of the vertices translated to the
+        # origin and rotated into the xy plane. The sequence here is important:
+        # we must translate before rotating so that the parallel axis theorem
+        # can be applied in the reverse direction (rotating about the origin
+        # before translating to the actual centroid).
         center = self.center
-        self.center = (0, 0, 0)
         mat, _ = rowan.mapping.kabsch(
             [self.normal, -self.normal], [[0, 0, 1], [0, 0, -1]]
         )
-        self._vertices = self._vertices.dot(mat.T)
-        original_normal = self._normal
-        self._normal = np.asarray([0, 0, 1])
+        i_x, i_y, _ = _planar_moments(
+            _align_points_by_normal(
+                np.array([0, 0, 1]), (self._vertices - center).dot(mat.T)
+            )
+        )
 
-        inertia_tensor = np.diag([0, 0, self.polar_moment_inertia])
+        inertia_tensor = np.diag([0, 0, i_x + i_y])
         shifted_inertia_tensor = translate_inertia_tensor(
             center, rotate_order2_tensor(mat, inertia_tensor), self.area
         )
 
-        self.center = center
-        self._vertices = self._vertices.dot(mat)
-        self._normal = original_normal
-
         return shifted_inertia_tensor
 
     @property
@@ -430,6 +516,40 @@ class Polygon(Shape2D):
         """
         yield from polytri.triangulate(self.vertices)
 
+    def _get_sampler(self, filled):
+        """Get a sampler for the interior or the boundary of the polygon."""
+
+        def build():
+            if filled:
+                triangles = np.array(list(self._triangulation()), dtype=np.float64)
+                areas = (
+                    np.linalg.norm(
+                        np.cross(
+                            triangles[:, 1] - triangles[:, 0],
+                            triangles[:, 2] - triangles[:, 0],
+                        ),
+                        axis=1,
+                    )
+                    / 2
+                )
+                return _PieceSampler([(areas, _sample_simplices, (triangles,))])
+            edges = np.stack(
+                (self._vertices, np.roll(self._vertices, shift=-1, axis=0)), axis=1
+            )
+            lengths = np.linalg.norm(edges[:, 1] - edges[:, 0], axis=1)
+            return _PieceSampler([(lengths, _sample_simplices, (edges,))])
+
+        name = "volume" if filled else "surface"
+        return _get_cached_sampler(self, name, (self._vertices,), build)
+
+    def sample_volume(self, n, rng=None):  # noqa: D102
+        # Use the parent docstring.
+        return self._get_sampler(True).sample(n, np.random.default_rng(rng))
+
+    def sample_surface(self, n, rng=None):  # noqa: D102
+        # Use the parent docstring.
+        return self._get_sampler(False).sample(n, np.random.default_rng(rng))
+
     def plot(self, ax=None, center=False, plot_verts=False, label_verts=False):
         """Plot the polygon.
 
@@ -529,6 +649,52 @@ class Polygon(Shape2D):
 
         return Circle(np.linalg.norm(x), x + self.vertices[0])
 
+    def get_descriptor(self, degree=10):
+        r"""Get a rotation-invariant descriptor of the shape of the polygon.
+
+        The descriptor is a vector of features that are invariant to
+        rotations, reflections, translations, and scaling of the polygon, so
+        that similar shapes have nearby descriptors. It consists of
+
+        - the principal second moments of area in ascending order, divided
+          by :math:`A^2`, and
+        - the magnitudes of the Fourier coefficients of the distribution of
+          the edge lengths :math:`L_e` over the edge directions
+          :math:`\theta_e` in the plane of the polygon,
+
+          .. math::
+
+              \frac{1}{P} \left| \sum_e L_e e^{i k \theta_e} \right|
+
+          for :math:`k = 2, \ldots, k_{max}`, which lie between 0 and 1,
+          where :math:`P` is the perimeter.
+
+        The coefficient for :math:`k = 1` is omitted since it vanishes for
+        all closed polygons. This is the two-dimensional analog of
+        :meth:`Polyhedron.get_descriptor`.
+
+        See :func:`~coxeter.shapes.shape_descriptors` to compute the
+        descriptors of many polygons at once.
+
+        Args:
+            degree (int):
+                The largest frequency :math:`k_{max} \geq 2` of the
+                coefficients (Default value: 10).
+
+        Returns:
+            :math:`(k_{max} + 1, )` :class:`numpy.ndarray`:
+                The descriptor.
+
+        Example:
+            >>> square = coxeter.shapes.ConvexPolygon(
+            ...   [[0, 0], [2, 0], [2, 2], [0, 2]])
+            >>> descriptor = square.get_descriptor(degree=4)
+            >>> np.allclose(descriptor, [1 / 12, 1 / 12, 0, 0, 1])
+            True
+
+        """
+        return _polygon_descriptors([self], degree)[0]
+
     def compute_form_factor_amplitude(self, q, density=1.0):  # noqa: D102
         """Calculate the form factor intensity.
 
@@ -579,3 +745,220 @@ class Polygon(Shape2D):
         )
         form_factor *= density
         return form_factor
+
+
+def _edge_moments(starts, ends, crosses, offsets):
+    """Compute the moments of polygons from their directed boundary edges.
+
+    Each edge forms a triangle with the reference point of its polygon, and
+    the moments of the polygon are the sums of the signed moments of these
+    triangles. The edges of a polygon need not be ordered, so this also
+    applies to regions bounded by several loops.
+
+    Args:
+        starts, ends (:math:`(N_{edges}, D)` :class:`numpy.ndarray`):
+            The start and end points of the edges relative to the reference
+            points, grouped by polygon.
+        crosses (:math:`(N_{edges}, )` :class:`numpy.ndarray`):
+            Twice the signed area of the triangle formed by each edge and the
+            reference point.
+        offsets (:math:`(N_{polygons} + 1, )` :class:`numpy.ndarray`):
+            The position of the first edge of each polygon followed by the
+            total number of edges.
+
+    Returns:
+        tuple(:math:`(N_{polygons}, )` :class:`numpy.ndarray`, :math:`(N_{polygons}, D)` :class:`numpy.ndarray`, :math:`(N_{polygons}, D, D)` :class:`numpy.ndarray`):
+            The areas, the centroids relative to the reference points, and
+            the inertia tensors about the centroids.
+    """  # noqa: E501
+    dimension = starts.shape[1]
+    areas = _segment_sum(crosses, offsets) / 2
+    corners = np.stack((starts, ends, starts + ends))
+    first_moments = _segment_sum(crosses[:, np.newaxis] * corners[2], offsets) / 6
+    second_moments = (
+        _segment_sum(np.einsum("t,kti,ktj->tij", crosses, corners, corners), offsets)
+        / 24
+    )
+
+    # Degenerate polygons without area are assigned their reference point.
+    empty = areas == 0
+    centroids = first_moments / np.where(empty, 1, areas)[:, np.newaxis]
+    second_moments -= areas[:, np.newaxis, np.newaxis] * (
+        centroids[:, :, np.newaxis] * centroids[:, np.newaxis, :]
+    )
+    second_moments[empty] = 0
+    inertia_tensors = (
+        np.trace(second_moments, axis1=1, axis2=2)[:, np.newaxis, np.newaxis]
+        * np.eye(dimension)
+        - second_moments
+    )
+    return areas, centroids, inertia_tensors
+
+
+def polygon_moments_batch(vertices, normals=None, lengths=None):
+    r"""Compute the areas, centroids, and inertia tensors of many polygons.
+
+    All polygons are processed together without constructing any shape
+    objects. Each polygon is decomposed into the triangles formed by its
+    edges and the mean of its vertices, so the results are exact for simple
+    polygons whether or not they are convex.
+
+    The inertia tensor of each polygon is computed about its centroid from
+    the second moments :math:`M = \int \vec{r} \vec{r}^T dA` as
+    :math:`\mathrm{tr}(M) \mathbb{1} - M`. For polygons in the plane, this is
+    the :math:`(2, 2)` tensor of second moments of area, with the planar
+    moments :math:`I_x` and :math:`I_y` on the diagonal and the negated
+    product of inertia off the diagonal. For polygons embedded in
+    :math:`\mathbb{R}^3`, this is the :math:`(3, 3)` inertia tensor of a thin
+    lamina, which can be moved to another point with
+    :func:`~.utils.translate_inertia_tensor`.
+
+    Args:
+        vertices (sequence of :math:`(N_i, 2)` or :math:`(N_i, 3)` array-like):
+            The vertices of the polygons, all of the same dimension. May also
+            be provided as a padded :math:`(N_{polygons}, N_{max}, 2)` or
+            :math:`(N_{polygons}, N_{max}, 3)` array, in which case only the
+            first ``lengths[i]`` vertices of polygon ``i`` are used.
+        normals (:math:`(N_{polygons}, 3)` array-like, optional):
+            The normals of polygons embedded in :math:`\mathbb{R}^3`. If None,
+            the normals are computed with Newell's method (Default value:
+            None).
+        lengths (:math:`(N_{polygons}, )` array-like, optional):
+            The number of vertices of each polygon in a padded array. If
+            None, all vertices are used (Default value: None).
+
+    Returns:
+        tuple(:math:`(N_{polygons}, )` :class:`numpy.ndarray`, :math:`(N_{polygons}, D)` :class:`numpy.ndarray`, :math:`(N_{polygons}, D, D)` :class:`numpy.ndarray`):
+            The areas, centroids, and inertia tensors about the centroids,
+            where :math:`D` is the dimension of the vertices.
+
+    Example:
+        >>> rectangle = [[0, 0], [2, 0], [2, 1], [0, 1]]
+        >>> triangle = [[0, 0, 0], [1, 0, 0], [0, 1, 0]]
+        >>> areas, centroids, tensors = coxeter.shapes.polygon_moments_batch(
+        ...   [rectangle, rectangle])
+        >>> areas
+        array([2., 2.])
+        >>> centroids[0]
+        array([1. , 0.5])
+        >>> np.allclose(tensors[0], np.diag([1 / 6, 2 / 3]))
+        True
+        >>> areas, centroids, tensors = coxeter.shapes.polygon_moments_batch(
+        ...   [triangle])
+        >>> np.allclose(centroids, [[1 / 3, 1 / 3, 0]])
+        True
+
+    """  # noqa: E501
+    if isinstance(vertices, np.ndarray) and vertices.ndim == 3:
+        num_polygons, max_length, dimension = vertices.shape
+        if lengths is None:
+            lengths = np.full(num_polygons, max_length)
+        lengths = np.asarray(lengths, dtype=int)
+        mask = np.arange(max_length) < lengths[:, np.newaxis]
+        vertices = vertices[mask].astype(np.float64)
+    else:
+        polygons = [np.asarray(polygon, dtype=np.float64) for polygon in vertices]
+        num_polygons = len(polygons)
+        lengths = np.array([len(polygon) for polygon in polygons], dtype=int)
+        dimension = polygons[0].shape[-1] if num_polygons else 2
+        if num_polygons:
+            vertices = np.concatenate(polygons)
+        else:
+            vertices = np.empty((0, dimension))
+
+    if dimension not in (2, 3) or vertices.ndim != 2:
+        raise ValueError("Polygon vertices must be two or three dimensional.")
+    if np.any(lengths < 3):
+        raise ValueError("Each polygon must have at least three vertices.")
+
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+    polygon_ids = np.repeat(np.arange(num_polygons), lengths)
+    references = _segment_sum(vertices, offsets) / lengths[:, np.newaxis]
+
+    # The edges of each polygon relative to its reference point.
+    starts = vertices - references[polygon_ids]
+    next_positions = np.arange(len(vertices)) + 1
+    next_positions[offsets[1:] - 1] = offsets[:-1]
+    ends = starts[next_positions]
+
+    # Twice the signed area of the triangle formed by each edge and the
+    # reference point.
+    if dimension == 2:
+        crosses = starts[:, 0] * ends[:, 1] - starts[:, 1] * ends[:, 0]
+    else:
+        cross_vectors = np.cross(starts, ends)
+        if normals is None:
+            normals = _segment_sum(cross_vectors, offsets)
+        else:
+            normals = np.asarray(normals, dtype=np.float64)
+        normals = normals / np.linalg.norm(normals, axis=-1, keepdims=True)
+        crosses = np.einsum("ij,ij->i", cross_vectors, normals[polygon_ids])
+
+    # Clockwise polygons produce negative areas, so the signs are fixed per
+    # polygon.
+    signs = np.where(_segment_sum(crosses, offsets) < 0, -1.0, 1.0)
+    crosses *= signs[polygon_ids]
+    areas, centroids, inertia_tensors = _edge_moments(starts, ends, crosses, offsets)
+    return areas, centroids + references, inertia_tensors
+
+
+def _polygon_descriptors(polygons, degree):
+    """Compute the rotation-invariant descriptors of many polygons.
+
+    See :meth:`Polygon.get_descriptor` for the definition of the descriptors.
+
+    Args:
+        polygons (sequence of :class:`Polygon`):
+            The polygons.
+        degree (int):
+            The largest frequency of the Fourier coefficients.
+
+    Returns:
+        :math:`(N_{polygons}, k_{max} + 1)` :class:`numpy.ndarray`:
+            The descriptors.
+    """
+    if degree < 2:
+        raise ValueError("The degree of the descriptors must be at least 2.")
+    polygons = list(polygons)
+    if len(polygons) == 0:
+        return np.empty((0, degree + 1))
+
+    normals = np.array([polygon._normal for polygon in polygons])
+    areas, _, inertia_tensors = polygon_moments_batch(
+        [polygon._vertices for polygon in polygons], normals
+    )
+    # The two smallest principal moments of a lamina are its principal
+    # second moments of area, while the largest is their sum.
+    moments = np.linalg.eigvalsh(inertia_tensors)[:, :2] / areas[:, np.newaxis] ** 2
+
+    lengths = np.array([len(polygon._vertices) for polygon in polygons])
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+    polygon_ids = np.repeat(np.arange(len(polygons)), lengths)
+    vertices = np.concatenate([polygon._vertices for polygon in polygons])
+    next_positions = np.arange(len(vertices)) + 1
+    next_positions[offsets[1:] - 1] = offsets[:-1]
+    edges = vertices[next_positions] - vertices
+
+    # Any orthonormal basis of each plane works, since changing the basis
+    # only changes the phases of the coefficients.
+    axes = np.eye(3)[np.argmin(np.abs(normals), axis=1)]
+    first_axes = np.cross(normals, axes)
+    first_axes /= np.linalg.norm(first_axes, axis=1, keepdims=True)
+    second_axes = np.cross(normals, first_axes)
+    second_axes /= np.linalg.norm(second_axes, axis=1, keepdims=True)
+    edges = np.einsum("ij,ij->i", edges, first_axes[polygon_ids]) + 1j * np.einsum(
+        "ij,ij->i", edges, second_axes[polygon_ids]
+    )
+    edge_lengths = np.abs(edges)
+    directions = edges / np.where(edge_lengths > 0, edge_lengths, 1)
+
+    terms = edge_lengths[:, np.newaxis] * directions[:, np.newaxis] ** np.arange(
+        2, degree + 1
+    )
+    coefficients = _segment_sum(
+        np.concatenate((terms.real, terms.imag), axis=1), offsets
+    )
+    num_terms = terms.shape[1]
+    magnitudes = np.hypot(coefficients[:, :num_terms], coefficients[:, num_terms:])
+    perimeters = _segment_sum(edge_lengths, offsets)
+    return np.concatenate((moments, magnitudes / perimeters[:, np.newaxis]), axis=1)
@@ -2,13 +2,23 @@
 
 import numpy as np
 import rowan
-from scipy.sparse.csgraph import connected_components
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import breadth_first_order, connected_components
 
 from .base_classes import Shape3D
-from .convex_polygon import ConvexPolygon, _is_convex
-from .polygon import Polygon, _is_simple
+from .polygon import Polygon, _edge_moments
 from .sphere import Sphere
-from .utils import _generate_ax, _set_3d_axes_equal, translate_inertia_tensor
+from .utils import (
+    _MAX_ELEMENTS_PER_BLOCK,
+    _generate_ax,
+    _get_cached_sampler,
+    _PieceSampler,
+    _sample_by_rejection,
+    _sample_simplices,
+    _segment_sum,
+    _set_3d_axes_equal,
+    translate_inertia_tensor,
+)
 
 try:
     import miniball
@@ -18,21 +28,614 @@ except ImportError:
     MINIBALL = False
 
 
-def _face_to_edges(face, reverse=False):
-    """Convert a face into a sequence of edges (tuples).
+def _flatten_faces(faces):
+    """Convert a list of faces into a flat array representation.
+
+    Many operations on polyhedra need to operate on all edges or vertices of
+    all faces at once. Concatenating the faces into a single array allows
+    these operations to be vectorized even when faces have different sizes.
+
+    Args:
+        faces (list(array-like)):
+            The faces, each composed of vertex indices.
+
+    Returns:
+        tuple(:class:`numpy.ndarray`, ...):
+            A tuple ``(indices, face_ids, offsets, next_positions)``, where
+            ``indices`` contains the vertex indices of all faces concatenated,
+            ``face_ids`` contains the face each entry belongs to, ``offsets``
+            contains the position of the first entry of each face followed by
+            the total number of entries, and ``next_positions`` contains the
+            position of the next vertex in the same face (wrapping around), so
+            that ``(indices, indices[next_positions])`` enumerates all directed
+            edges.
+    """
+    counts = np.array([len(face) for face in faces], dtype=np.intp)
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+    indices = np.concatenate(faces) if len(faces) else np.empty(0, dtype=np.intp)
+    face_ids = np.repeat(np.arange(len(faces)), counts)
+    next_positions = np.arange(1, offsets[-1] + 1)
+    next_positions[offsets[1:] - 1] = offsets[:-1]
+    return indices, face_ids, offsets, next_positions
+
+
+def _find_shared_edges(indices, face_ids, next_positions):
+    """Identify pairs of faces that share an edge.
+
+    Rather than comparing all pairs of faces, each edge is mapped to the faces
+    containing it by sorting the undirected edges, so that matching edges end
+    up next to each other. This assumes that the polyhedron is manifold, i.e.
+    that each edge is shared by at most two faces.
+
+    Args:
+        indices, face_ids, next_positions (:class:`numpy.ndarray`):
+            The flat face representation returned by :func:`_flatten_faces`.
+
+    Returns:
+        tuple(:class:`numpy.ndarray`, ...):
+            A tuple ``(first, second, edges, same_direction)`` where
+            ``first[k] < second[k]`` are the indices of a pair of neighboring
+            faces, ``edges[k]`` is their common edge as it appears in
+            ``first[k]``, and ``same_direction[k]`` indicates whether the two
+            faces traverse that edge in the same direction (i.e. they have
+            inconsistent orientations). Pairs are sorted by face index.
+    """
+    starts = indices
+    ends = indices[next_positions]
+    lows = np.minimum(starts, ends)
+    highs = np.maximum(starts, ends)
+    order = np.lexsort((face_ids, highs, lows))
+    matches = (lows[order[1:]] == lows[order[:-1]]) & (
+        highs[order[1:]] == highs[order[:-1]]
+    )
+    first, second = order[:-1][matches], order[1:][matches]
+
+    # The lexsort guarantees that the first member of a match is the face with
+    # the lower index. Two faces can only share a single edge (otherwise they
+    # would be coplanar), but degenerate inputs are deduplicated to be safe.
+    num_faces = face_ids[-1] + 1 if len(face_ids) else 0
+    _, unique = np.unique(
+        face_ids[first].astype(np.int64) * num_faces + face_ids[second],
+        return_index=True,
+    )
+    first, second = first[unique], second[unique]
+    return (
+        face_ids[first],
+        face_ids[second],
+        np.stack((starts[first], ends[first]), axis=1),
+        starts[first] == starts[second],
+    )
+
+
+def _pack_arrays(arrays):
+    """Concatenate a list of 1D integer arrays, returning the offsets too.
+
+    This is a cheaper version of :func:`_flatten_faces` for when only the
+    indices and offsets are needed.
+    """
+    offsets = np.zeros(len(arrays) + 1, dtype=np.intp)
+    np.cumsum([len(array) for array in arrays], out=offsets[1:])
+    if not len(arrays):
+        return np.empty(0, dtype=np.intp), offsets
+    return np.concatenate(arrays), offsets
+
+
+def _fan_triangles(faces):
+    """Triangulate each face as a fan around its first vertex.
+
+    For any planar polygon (convex or not), the signed areas of the fan
+    triangles sum to the area of the polygon, so integrals over a closed,
+    consistently oriented surface can be computed from the fans regardless of
+    the convexity of the faces.
+
+    Args:
+        faces (list(:class:`numpy.ndarray`)):
+            The faces, each composed of at least three vertex indices.
+
+    Returns:
+        :math:`(N_{triangles}, 3)` :class:`numpy.ndarray` of int:
+            The vertex indices of the triangles.
+    """
+    indices, _, offsets, _ = _flatten_faces(faces)
+    counts = np.diff(offsets) - 2
+    firsts = np.repeat(offsets[:-1], counts)
+    # The i-th triangle of a fan uses the vertices at positions i + 1 and i + 2.
+    seconds = firsts + 1 + np.arange(np.sum(counts))
+    seconds -= np.repeat(np.cumsum(counts) - counts, counts)
+    return np.stack((indices[firsts], indices[seconds], indices[seconds + 1]), axis=1)
+
+
+def _stack_triangulations(polyhedra):
+    """Stack the vertices and fan triangulations of many polyhedra.
+
+    The faces of all polyhedra are triangulated together, which avoids the
+    overhead of triangulating each polyhedron separately.
+
+    Returns:
+        tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`):
+            The vertices of all polyhedra, the positions at which the
+            vertices of each polyhedron start followed by the total number of
+            vertices, the triangles of all polyhedra indexing the stacked
+            vertices, and the corresponding offsets of the triangles.
+    """  # noqa: E501
+    vertex_counts = [len(poly._vertices) for poly in polyhedra]
+    vertex_offsets = np.concatenate([[0], np.cumsum(vertex_counts)]).astype(np.intp)
+    vertices = np.concatenate([poly._vertices for poly in polyhedra])
+
+    faces = [face for poly in polyhedra for face in poly._faces]
+    face_offsets = np.concatenate(
+        [[0], np.cumsum([len(poly._faces) for poly in polyhedra])]
+    ).astype(np.intp)
+    triangle_counts = _segment_sum(
+        np.fromiter(map(len, faces), dtype=np.intp, count=len(faces)) - 2,
+        face_offsets,
+    ).astype(np.intp)
+    triangle_offsets = np.concatenate([[0], np.cumsum(triangle_counts)])
+    # Shift the triangles of each polyhedron to index the stacked vertices.
+    triangles = (
+        _fan_triangles(faces)
+        + np.repeat(vertex_offsets[:-1], triangle_counts)[:, np.newaxis]
+    )
+    return vertices, vertex_offsets, triangles, triangle_offsets
+
+
+def _mass_properties_batch(vertices, vertex_offsets, triangles, triangle_offsets):
+    r"""Compute the volumes and moments of many closed triangulated surfaces.
+
+    Each solid is decomposed into signed tetrahedra formed by each surface
+    triangle and a reference point, and the exact integrals over all
+    tetrahedra of all solids are accumulated in a single pass. The reference
+    point of each solid is the mean of its vertices, which avoids
+    cancellation errors for shapes far from the origin.
+
+    Args:
+        vertices (:math:`(N_{vertices}, 3)` :class:`numpy.ndarray`):
+            The vertices of all surfaces.
+        vertex_offsets (:math:`(N_{shapes} + 1, )` :class:`numpy.ndarray`):
+            The positions in ``vertices`` at which each surface's vertices
+            start, followed by the total number of vertices.
+        triangles (:math:`(N_{triangles}, 3)` :class:`numpy.ndarray`):
+            The indices into ``vertices`` of the triangles of all surfaces.
+            The triangles of each surface must be consistently oriented
+            (either all outward or all inward).
+        triangle_offsets (:math:`(N_{shapes} + 1, )` :class:`numpy.ndarray`):
+            The positions in ``triangles`` at which each surface's triangles
+            start, followed by the total number of triangles.
+
+    Returns:
+        tuple(:math:`(N_{shapes}, )` :class:`numpy.ndarray`, :math:`(N_{shapes}, 3)` :class:`numpy.ndarray`, :math:`(N_{shapes}, 3, 3)` :class:`numpy.ndarray`):
+            The volumes, the centroids, and the second moments
+            :math:`\int (\vec{r} - \vec{c}) (\vec{r} - \vec{c})^T dV` about
+            the centroids :math:`\vec{c}`.
+    """  # noqa: E501
+    vertex_counts = np.diff(vertex_offsets)
+    triangle_counts = np.diff(triangle_offsets)
+    references = (
+        np.add.reduceat(vertices, vertex_offsets[:-1], axis=0)
+        / vertex_counts[:, np.newaxis]
+    )
+    shape_ids = np.repeat(np.arange(len(vertex_counts)), triangle_counts)
+
+    # The vertices of each tetrahedron relative to the reference point, with
+    # the sum of the three vertices appended.
+    corners = np.empty((4, len(triangles), 3))
+    corners[:3] = vertices[triangles.T] - references[shape_ids]
+    np.sum(corners[:3], axis=0, out=corners[3])
+
+    # Six times the signed volume of each tetrahedron. Inward facing triangles
+    # produce negative volumes, so the signs are fixed per shape.
+    dets = np.einsum("ij,ij->i", corners[0], np.cross(corners[1], corners[2]))
+    volumes = _segment_sum(dets, triangle_offsets) / 6
+    signs = np.where(volumes < 0, -1.0, 1.0)
+    dets *= signs[shape_ids]
+    volumes *= signs
+
+    first_moments = _segment_sum(dets[:, np.newaxis] * corners[3], triangle_offsets)
+    second_moments = _segment_sum(
+        np.einsum("t,kti,ktj->tij", dets, corners, corners), triangle_offsets
+    )
+
+    # Degenerate shapes without volume are assigned their reference point.
+    empty = volumes == 0
+    centroids = first_moments / (24 * np.where(empty, 1, volumes))[:, np.newaxis]
+    second_moments /= 120
+    second_moments -= volumes[:, np.newaxis, np.newaxis] * (
+        centroids[:, :, np.newaxis] * centroids[:, np.newaxis, :]
+    )
+    second_moments[empty] = 0
+    return volumes, centroids + references, second_moments
+
+
+def _mass_properties(vertices, triangles):
+    r"""Compute the volume and moments of a closed triangulated surface.
+
+    This is a single surface version of :func:`_mass_properties_batch`.
+
+    Args:
+        vertices (:math:`(N_{vertices}, 3)` :class:`numpy.ndarray`):
+            The vertices of the surface.
+        triangles (:math:`(N_{triangles}, 3)` :class:`numpy.ndarray`):
+            The vertex indices of the triangles, which must be consistently
+            oriented (either all outward or all inward).
+
+    Returns:
+        tuple(float, :math:`(3, )` :class:`numpy.ndarray`, :math:`(3, 3)` :class:`numpy.ndarray`):
+            The volume, the centroid, and the second moments
+            :math:`\int (\vec{r} - \vec{c}) (\vec{r} - \vec{c})^T dV` about
+            the centroid :math:`\vec{c}`.
+    """  # noqa: E501
+    volumes, centroids, second_moments = _mass_properties_batch(
+        vertices, np.array([0, len(vertices)]), triangles, np.array([0, len(triangles)])
+    )
+    return volumes[0], centroids[0], second_moments[0]
+
+
+def _count_containing_tetrahedra(points, tetrahedra):
+    """Count the number of tetrahedra containing each point.
+
+    Args:
+        points (:math:`(N_{points}, 3)` :class:`numpy.ndarray`):
+            The points to test.
+        tetrahedra (:math:`(N_{tetrahedra}, 4, 3)` :class:`numpy.ndarray`):
+            The corners of the tetrahedra, which must not be degenerate.
+
+    Returns:
+        :math:`(N_{points}, )` :class:`numpy.ndarray` of int:
+            The number of tetrahedra containing each point.
+    """
+    origins = tetrahedra[:, 0]
+    # Maps each point to its barycentric coordinates in each tetrahedron.
+    inverses = np.linalg.inv(
+        np.transpose(tetrahedra[:, 1:] - origins[:, np.newaxis], (0, 2, 1))
+    )
+    counts = np.zeros(len(points), dtype=int)
+    # Bound the size of the temporary arrays regardless of the input size.
+    block_size = max(1, 2 ** 20 // max(len(tetrahedra), 1))
+    for start in range(0, len(points), block_size):
+        offsets = points[start : start + block_size, np.newaxis] - origins
+        coordinates = np.einsum("kij,bkj->bki", inverses, offsets)
+        inside = np.all(coordinates >= 0, axis=2) & (np.sum(coordinates, axis=2) <= 1)
+        counts[start : start + block_size] = np.sum(inside, axis=1)
+    return counts
+
+
+def _split_faces(indices, offsets):
+    """Split a flat array of vertex indices into a list of faces.
+
+    This is the inverse of :func:`_flatten_faces`.
+    """
+    return [
+        indices[start:end]
+        for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())
+    ]
+
+
+def _neighbors_from_pairs(first, second, num_faces):
+    """Convert pairs of neighboring faces into a list of neighbor arrays.
+
+    Sorting the directed pairs by the first face gives each face's neighbors
+    in increasing order.
+    """
+    sources = np.concatenate((first, second))
+    targets = np.concatenate((second, first))
+    order = np.lexsort((targets, sources))
+    offsets = np.concatenate(
+        ([0], np.cumsum(np.bincount(sources, minlength=num_faces)))
+    )
+    return _split_faces(targets[order], offsets)
+
+
+def _planes_close(first, second, atol, rtol):
+    """Check which pairs of plane equations describe the same plane.
+
+    This is a vectorized, symmetric version of comparing each pair of
+    equations with :func:`numpy.allclose`, also accepting equations that
+    differ only in sign.
+
+    Args:
+        first, second (:math:`(N, 4)` :class:`numpy.ndarray`):
+            The plane equations to compare.
+        atol (float):
+            Absolute tolerance.
+        rtol (float):
+            Relative tolerance.
+
+    Returns:
+        :math:`(N, )` :class:`numpy.ndarray` of bool:
+            Whether each pair of planes should be considered equal.
+    """
+
+    def allclose(a, b):
+        return np.all(np.abs(a - b) <= atol + rtol * np.abs(b), axis=-1)
+
+    return (
+        allclose(first, second)
+        | allclose(second, first)
+        | allclose(first, -second)
+        | allclose(-second, first)
+    )
+
+
+def _sort_convex_faces(vertices, indices, face_ids, offsets, return_nonconvex=False):
+    """Sort the vertices of many convex faces counterclockwise.
+
+    Each face is sorted counterclockwise about the normal defined by its first
+    three vertices (the same normal chosen by :class:`~.Polygon`), keeping the
+    first vertex in place. The sort key is the angle about the face centroid,
+    with ties broken by the distance from the centroid. This reproduces the
+    ordering of :meth:`~.Polygon.reorder_verts` for all faces at once without
+    constructing polygons.
+
+    Sorting by angle only yields the boundary of a face if all of its
+    vertices are extreme points, so faces containing interior points are
+    rejected, just as :class:`~.ConvexPolygon` rejects nonconvex vertices.
+    Alternatively, the faces that are not convex can be reported.
 
     Args:
-        face (array-like):
-            A face composed of vertex indices.
-        reverse (bool):
-            Whether to return the edges in reverse.
+        vertices (:math:`(N, 3)` :class:`numpy.ndarray`):
+            The vertices of the polyhedron.
+        indices, face_ids, offsets (:class:`numpy.ndarray`):
+            The flat face representation returned by :func:`_flatten_faces`.
+        return_nonconvex (bool):
+            Whether to return which faces are not convex instead of raising
+            an error (Default value: False).
 
     Returns:
-        list[tuple[int, int]]:
-            A list of edges where each is a tuple of a pair of vertices.
+        :class:`numpy.ndarray` or tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`):
+            The permutation of ``indices`` that sorts the vertices of each
+            face. If ``return_nonconvex`` is True, also whether each face is
+            not convex.
+
+    Raises:
+        ValueError: If the vertices of a face do not form a convex polygon and
+            ``return_nonconvex`` is False.
     """
-    shift = 1 if reverse else -1
-    return list(zip(*np.stack((face, np.roll(face, shift)))))
+    starts = offsets[:-1]
+    counts = np.diff(offsets)
+    points = vertices[indices]
+    centers = np.add.reduceat(points, starts) / counts[:, np.newaxis]
+    relative = points - centers[face_ids]
+
+    normals = np.cross(
+        points[starts + 2] - points[starts + 1], points[starts] - points[starts + 1]
+    )
+    norms = np.linalg.norm(normals, axis=1)
+
+    # If the first three vertices of a face are collinear they do not define a
+    # normal, so we fall back to the cross product of the first vertex with
+    # the vertex that is furthest from being collinear with it.
+    degenerate = norms <= 1e-10 * np.max(np.abs(relative), initial=1)
+    if np.any(degenerate):
+        crosses = np.cross(relative[starts][face_ids], relative)
+        magnitudes = np.linalg.norm(crosses, axis=1)
+        best = np.lexsort((-magnitudes, face_ids))[starts]
+        normals[degenerate] = crosses[best[degenerate]]
+        norms[degenerate] = magnitudes[best[degenerate]]
+    normals /= norms[:, np.newaxis]
+
+    # Measure angles in an in-plane coordinate system whose x axis points from
+    # the centroid towards the first vertex of the face.
+    x_axes = relative[starts]
+    x_axes /= np.linalg.norm(x_axes, axis=1)[:, np.newaxis]
+    y_axes = np.cross(normals, x_axes)
+    x = np.sum(relative * x_axes[face_ids], axis=1)
+    y = np.sum(relative * y_axes[face_ids], axis=1)
+    angles = np.mod(np.arctan2(y, x), 2 * np.pi)
+    angles[starts] = 0
+    distances = np.hypot(x, y)
+    order = np.lexsort((distances, angles, face_ids))
+
+    radii = np.maximum.reduceat(distances, starts)
+    reflex = (
+        _vertex_heights(relative[order], face_ids, normals) < -1e-6 * radii[face_ids]
+    )
+    if return_nonconvex:
+        nonconvex = np.zeros(len(starts), dtype=bool)
+        nonconvex[face_ids[reflex]] = True
+        return order, nonconvex
+    if np.any(reflex):
+        raise ValueError("The vertices of a face do not form a convex polygon.")
+    return order
+
+
+def _vertex_heights(points, face_ids, normals):
+    """Compute the heights of the vertices of sorted faces above their neighbors.
+
+    The height of a vertex is its distance from the line through its two
+    neighbors, which is positive if the face turns counterclockwise about its
+    normal at the vertex, zero if the vertex is collinear with its neighbors,
+    and negative if the vertex is reflex.
+
+    Args:
+        points (:math:`(N, 3)` :class:`numpy.ndarray`):
+            The sorted vertices of all faces.
+        face_ids (:math:`(N,)` :class:`numpy.ndarray`):
+            The (nondecreasing) face index of each vertex.
+        normals (:math:`(N_{faces}, 3)` :class:`numpy.ndarray`):
+            The unit normals about which the faces are sorted.
+
+    Returns:
+        :math:`(N,)` :class:`numpy.ndarray`: The height of each vertex.
+    """
+    offsets = np.searchsorted(face_ids, np.arange(len(normals) + 1))
+    starts = offsets[:-1]
+    next_positions = np.arange(1, len(points) + 1)
+    next_positions[offsets[1:] - 1] = starts
+    previous_positions = np.arange(-1, len(points) - 1)
+    previous_positions[starts] = offsets[1:] - 1
+    previous_points = points[previous_positions]
+    chords = points[next_positions] - previous_points
+    return np.einsum(
+        "ij,ij->i", np.cross(points - previous_points, chords), normals[face_ids]
+    ) / np.maximum(np.linalg.norm(chords, axis=1), 1e-300)
+
+
+def _orient_faces(vertices, indices, face_ids, offsets, normals):
+    """Reverse the sorted faces that are clockwise about their outward normals.
+
+    The orientation of each face is determined by its vector area.
+
+    Args:
+        vertices (:math:`(N, 3)` :class:`numpy.ndarray`):
+            The vertices of the polyhedron.
+        indices, face_ids, offsets (:class:`numpy.ndarray`):
+            The flat representation of the sorted faces.
+        normals (:math:`(N_{faces}, 3)` :class:`numpy.ndarray`):
+            The outward normals of the faces.
+
+    Returns:
+        :class:`numpy.ndarray`: The vertex indices of the oriented faces.
+    """
+    points = vertices[indices]
+    next_positions = np.arange(1, len(indices) + 1)
+    next_positions[offsets[1:] - 1] = offsets[:-1]
+    areas = np.add.reduceat(np.cross(points, points[next_positions]), offsets[:-1])
+    flip = np.sum(areas * normals, axis=1) < 0
+    positions = np.arange(len(indices))
+    reverse = flip[face_ids]
+    positions[reverse] = (
+        offsets[:-1][face_ids] + offsets[1:][face_ids] - 1 - positions
+    )[reverse]
+    return indices[positions]
+
+
+def _cross_section_segments(vertices, faces, normal, offsets):
+    """Find the boundary segments of the cross sections of a polyhedron.
+
+    Each edge crosses the planes whose offsets lie between the heights of its
+    vertices, which are found for all edges at once by binary search in the
+    sorted offsets. A vertex at the height of a plane is treated as lying
+    below it, so that each face crosses each plane an even number of times.
+    Along the line in which a face meets a plane, the section lies inside the
+    face between a crossing of an edge going down and the next crossing of an
+    edge going up, so the crossings of each face are paired after sorting
+    them along this line. The direction of the line is determined by the
+    vector area of the face, which points along the outward normal even for
+    nonconvex faces.
+
+    Args:
+        vertices (:math:`(N_{vertices}, 3)` :class:`numpy.ndarray`):
+            The vertices of the polyhedron.
+        faces (list(:class:`numpy.ndarray`)):
+            The faces of the polyhedron, ordered counterclockwise.
+        normal (:math:`(3, )` :class:`numpy.ndarray`):
+            The unit normal of the planes.
+        offsets (:math:`(N_{planes}, )` :class:`numpy.ndarray`):
+            The sorted offsets of the planes.
+
+    Returns:
+        tuple(:class:`numpy.ndarray`, ...):
+            The start and end points of the segments, which run
+            counterclockwise about ``normal`` around the sections, the plane
+            of each segment, and keys identifying the plane and the edge of
+            the polyhedron on which each segment starts and ends. The
+            segments are sorted by plane.
+    """
+    indices, face_ids, face_offsets, next_positions = _flatten_faces(faces)
+    normals = np.add.reduceat(
+        np.cross(vertices[indices], vertices[indices[next_positions]]),
+        face_offsets[:-1],
+    )
+    heights = vertices @ normal
+    tails, heads = indices, indices[next_positions]
+    upward = heights[tails] < heights[heads]
+    lows = np.where(upward, tails, heads)
+    highs = np.where(upward, heads, tails)
+
+    # Each edge crosses the planes with offsets in [low, high).
+    first = np.searchsorted(offsets, heights[lows], side="left")
+    counts = np.searchsorted(offsets, heights[highs], side="left") - first
+    edges = np.repeat(np.arange(len(indices)), counts)
+    planes = np.arange(len(edges)) + np.repeat(
+        first - np.cumsum(counts) + counts, counts
+    )
+
+    below, above = lows[edges], highs[edges]
+    fractions = (offsets[planes] - heights[below]) / (heights[above] - heights[below])
+    points = vertices[below] + fractions[:, np.newaxis] * (
+        vertices[above] - vertices[below]
+    )
+    edge_keys = planes * len(vertices) ** 2 + lows[edges] * len(vertices) + highs[edges]
+    crossing_faces = face_ids[edges]
+    up = upward[edges]
+    positions = np.einsum("ij,ij->i", points, np.cross(normal, normals)[crossing_faces])
+
+    # Crossings at the same point (at vertices lying in a plane) are ordered
+    # such that crossings going down and up alternate within each face.
+    order = np.lexsort((up, positions, crossing_faces, planes))
+    index = np.arange(len(order))
+    new_group = np.ones(len(order), dtype=bool)
+    new_group[1:] = (np.diff(planes[order]) != 0) | (
+        np.diff(crossing_faces[order]) != 0
+    )
+    new_tie = new_group.copy()
+    new_tie[1:] |= np.diff(positions[order]) != 0
+    new_type = new_tie.copy()
+    new_type[1:] |= np.diff(up[order]) != 0
+    group_starts, tie_starts, type_starts = (
+        np.maximum.accumulate(np.where(new, index, 0))
+        for new in (new_group, new_tie, new_type)
+    )
+    parity = (tie_starts - group_starts) % 2
+    ranks = 2 * (index - type_starts) + (up[order] ^ parity)
+    order = order[np.lexsort((ranks, tie_starts))]
+
+    starts, ends = order[0::2], order[1::2]
+    return (
+        points[starts],
+        points[ends],
+        planes[starts],
+        edge_keys[starts],
+        edge_keys[ends],
+    )
+
+
+def _cycle_order(successors):
+    """Order the elements of a permutation along its cycles.
+
+    The position of each element in its cycle is found by pointer jumping,
+    i.e. by repeatedly doubling the number of steps that each element looks
+    ahead, so that long cycles require only logarithmically many passes.
+
+    Args:
+        successors (:math:`(N, )` :class:`numpy.ndarray`):
+            The element following each element.
+
+    Returns:
+        tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`):
+            The permutation ordering the elements by cycle and along each
+            cycle, and the position of the first element of each cycle in
+            this ordering followed by the total number of elements.
+
+    Raises:
+        ValueError: If ``successors`` is not a permutation.
+    """
+    index = np.arange(len(successors))
+    if not np.array_equal(np.sort(successors), index):
+        raise ValueError("The successors of the elements must be a permutation.")
+    num_cycles, labels = connected_components(
+        coo_matrix(
+            (np.ones(len(successors)), (index, successors)),
+            shape=(len(successors),) * 2,
+        ),
+        connection="weak",
+    )
+    _, roots = np.unique(labels, return_index=True)
+
+    # Break each cycle before its first element and find the distance of each
+    # element to the end of the resulting chain.
+    ends = np.isin(successors, roots)
+    jumps = np.where(ends, index, successors)
+    distances = (~ends).astype(int)
+    while not np.all(ends[jumps]):
+        distances = distances + distances[jumps]
+        jumps = jumps[jumps]
+
+    order = np.lexsort((-distances, labels))
+    offsets = np.concatenate(
+        ([0], np.cumsum(np.bincount(labels, minlength=num_cycles)))
+    )
+    return order, offsets
 
 
 class Polyhedron(Shape3D):
@@ -82,9 +685,8 @@ class Polyhedron(Shape3D):
         {'type': 'Mesh', 'vertices': [[1.0, 1.0, 1.0], [1.0, -1.0, 1.0],
         [1.0, 1.0, -1.0], [1.0, -1.0, -1.0], [-1.0, 1.0, 1.0],
         [-1.0, -1.0, 1.0], [-1.0, 1.0, -1.0], [-1.0, -1.0, -1.0]], 'faces':
-        [array([4, 5, 1, 0], dtype=int32), array([0, 2, 6, 4], dtype=int32),
-        array([6, 7, 5, 4], dtype=int32), array([0, 1, 3, 2], dtype=int32),
-        array([5, 7, 3, 1], dtype=int32), array([2, 3, 7, 6], dtype=int32)]}
+        [[4, 5, 1, 0], [0, 2, 6, 4], [6, 7, 5, 4], [0, 1, 3, 2], [5, 7, 3, 1],
+        [2, 3, 7, 6]]}
         >>> assert np.allclose(
         ...   cube.inertia_tensor,
         ...   np.diag([16. / 3., 16. / 3., 16. / 3.]))
@@ -126,29 +728,59 @@ class Polyhedron(Shape3D):
         self._find_equations()
         self._find_neighbors()
 
+    def __getstate__(self):
+        # Lists of many small arrays are slow to pickle, so the faces and
+        # neighbors are packed into contiguous arrays. Contiguous arrays are
+        # also transferred out-of-band (e.g. through shared memory) when
+        # pickling with protocol 5.
+        state = self.__dict__.copy()
+        state.pop("_fan_triangle_cache", None)
+        state.pop("_mass_property_cache", None)
+        state.pop("_sampler_cache", None)
+        state["_faces"] = _pack_arrays(self._faces)
+        state["_neighbors"] = _pack_arrays(self._neighbors)
+        return state
+
+    def __setstate__(self, state):
+        state = state.copy()
+        state["_faces"] = _split_faces(*state["_faces"])
+        state["_neighbors"] = _split_faces(*state["_neighbors"])
+        self.__dict__.update(state)
+
     def _find_equations(self):
         """Find the plane equations of the polyhedron faces."""
+        indices, _, offsets, _ = _flatten_faces(self.faces)
+        starts = offsets[:-1]
+        v0, v1, v2 = (self.vertices[indices[starts + k]] for k in range(3))
+
+        # The direction of the normal is selected such that vertices that
+        # are already ordered counterclockwise will point outward.
+        normals = np.cross(v2 - v1, v0 - v1)
+        normals /= np.linalg.norm(normals, axis=1)[:, np.newaxis]
         self._equations = np.empty((len(self.faces), 4))
-        for i, face in enumerate(self.faces):
-            # The direction of the normal is selected such that vertices that
-            # are already ordered counterclockwise will point outward.
-            normal = np.cross(
-                self.vertices[face[2]] - self.vertices[face[1]],
-                self.vertices[face[0]] - self.vertices[face[1]],
-            )
-            normal /= np.linalg.norm(normal)
-            self._equations[i, :3] = normal
-            # Sign conventions chosen to match scipy.spatial.ConvexHull
-            # We use ax + by + cz + d = 0 (not ax + by + cz = d)
-            self._equations[i, 3] = -normal.dot(self.vertices[face[0]])
+        self._equations[:, :3] = normals
+        # Sign conventions chosen to match scipy.spatial.ConvexHull
+        # We use ax + by + cz + d = 0 (not ax + by + cz = d)
+        self._equations[:, 3] = -np.sum(normals * v0, axis=1)
 
     def _find_neighbors(self):
         """Find neighbors of faces."""
-        self._neighbors = [[] for _ in range(self.num_faces)]
-        for i, j, _ in self._get_face_intersections():
-            self._neighbors[i].append(j)
-            self._neighbors[j].append(i)
-        self._neighbors = [np.array(neigh) for neigh in self._neighbors]
+        first, second, _ = self._find_face_intersections()
+        self._neighbors = _neighbors_from_pairs(first, second, self.num_faces)
+
+    def _find_face_intersections(self):
+        """Get pairs of neighboring faces and their common edges as arrays.
+
+        Returns:
+            tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`):
+                The indices of the first and second face of each pair (with
+                the first index always smaller than the second), and the
+                :math:`(N_{pairs}, 2)` array of vertex indices of the common
+                edges.
+        """  # noqa: E501
+        indices, face_ids, _, next_positions = _flatten_faces(self.faces)
+        first, second, edges, _ = _find_shared_edges(indices, face_ids, next_positions)
+        return first, second, edges
 
     def _get_face_intersections(self):
         """Get pairs of faces and their common edges.
@@ -157,21 +789,9 @@ class Polyhedron(Shape3D):
         (vertex1, vertex2)) indicating neighboring faces and their common
         edge.
         """
-        # First enumerate all edges of each neighbor. We include both
-        # directions of the edges for comparison.
-        face_edges = [
-            set(_face_to_edges(f) + _face_to_edges(f, True)) for f in self.faces
-        ]
-
-        for i in range(self.num_faces):
-            for j in range(i + 1, self.num_faces):
-                common_edges = face_edges[i].intersection(face_edges[j])
-                if len(common_edges) > 0:
-                    # Can never have multiple intersections, but we should have
-                    # the same edge show up twice (forward and reverse).
-                    assert len(common_edges) == 2
-                    common_edge = list(common_edges)[0]
-                    yield (i, j, (common_edge[0], common_edge[1]))
+        first, second, edges = self._find_face_intersections()
+        for i, j, edge in zip(first.tolist(), second.tolist(), edges.tolist()):
+            yield (i, j, tuple(edge))
 
     @property
     def gsd_shape_spec(self):
@@ -179,7 +799,7 @@ class Polyhedron(Shape3D):
         return {
             "type": "Mesh",
             "vertices": self._vertices.tolist(),
-            "faces": self._faces,
+            "faces": [np.asarray(face).tolist() for face in self._faces],
         }
 
     def merge_faces(self, atol=1e-8, rtol=1e-5):
@@ -207,25 +827,28 @@ class Polyhedron(Shape3D):
                 "for nonconvex faces."
             )
 
-        # Construct a graph where connectivity indicates merging, then identify
-        # connected components to merge.
-        merge_graph = np.zeros((self.num_faces, self.num_faces))
-        for i in range(self.num_faces):
-            for j in self._neighbors[i]:
-                eq1, eq2 = self._equations[[i, j]]
-                if np.allclose(eq1, eq2, atol=atol, rtol=rtol) or np.allclose(
-                    eq1, -eq2, atol=atol, rtol=rtol
-                ):
-                    merge_graph[i, j] = 1
-
-        _, labels = connected_components(
+        # Construct a sparse graph where connectivity indicates merging, then
+        # identify connected components to merge.
+        first, second, _ = self._find_face_intersections()
+        merge = _planes_close(
+            self._equations[first], self._equations[second], atol, rtol
+        )
+        merge_graph = coo_matrix(
+            (np.ones(np.count_nonzero(merge)), (first[merge], second[merge])),
+            shape=(self.num_faces, self.num_faces),
+        )
+        num_merged, labels = connected_components(
             merge_graph, directed=False, return_labels=True
         )
-        new_faces = [set() for _ in range(len(np.unique(labels)))]
-        for i, face in enumerate(self.faces):
-            new_faces[labels[i]].update(face)
 
-        self._faces = [np.asarray(list(f)) for f in new_faces]
+        # Each merged face consists of the unique vertices of its components.
+        indices, face_ids, _, _ = _flatten_faces(self.faces)
+        keys = np.unique(
+            labels[face_ids].astype(np.int64) * self.num_vertices + indices
+        )
+        merged_labels, merged_indices = np.divmod(keys, self.num_vertices)
+        offsets = np.searchsorted(merged_labels, np.arange(num_merged + 1))
+        self._faces = _split_faces(merged_indices.astype(indices.dtype), offsets)
         self.sort_faces()
 
     @property
@@ -253,7 +876,7 @@ class Polyhedron(Shape3D):
         """int: Get the number of faces."""
         return len(self.faces)
 
-    def sort_faces(self):  # noqa: C901
+    def sort_faces(self):
         """Sort faces of the polyhedron.
 
         This method ensures that all faces are ordered such that the normals
@@ -266,6 +889,9 @@ class Polyhedron(Shape3D):
         orientation of the first face.  Finally, it computes the signed volume
         to determine whether or not all the normals need to be flipped.
 
+        All steps operate on flat arrays of the vertex indices of all faces,
+        so the cost of sorting scales nearly linearly with the number of faces.
+
         .. note::
             This method can only be called for polyhedra whose faces are all
             convex (i.e. constructed with ``faces_are_convex=True``).
@@ -279,60 +905,56 @@ class Polyhedron(Shape3D):
             )
 
         # We first ensure that face vertices are sequentially ordered by
-        # constructing a Polygon and updating the face (in place), which
-        # enables finding neighbors.
-        for face in self.faces:
-            polygon = ConvexPolygon(self.vertices[face], planar_tolerance=1e-4)
-            if _is_convex(polygon.vertices, polygon.normal):
-                face[:] = np.asarray(
-                    [
-                        np.where(np.all(self.vertices == vertex, axis=1))[0][0]
-                        for vertex in polygon.vertices
-                    ]
-                )
-            elif not _is_simple(polygon.vertices):
-                raise ValueError(
-                    "The vertices of each face must be provided "
-                    "in counterclockwise order relative to the "
-                    "face normal unless the face is a convex "
-                    "polygon."
-                )
-        self._find_neighbors()
+        # sorting them by angle about the face centroid, exactly as
+        # ConvexPolygon.reorder_verts would, but directly on the indices.
+        indices, face_ids, offsets, next_positions = _flatten_faces(self.faces)
+        indices = indices[_sort_convex_faces(self.vertices, indices, face_ids, offsets)]
 
-        # The initial face sets the order of the others.
-        visited_faces = []
-        remaining_faces = [0]
-        while len(remaining_faces):
-            current_face = remaining_faces[-1]
-            visited_faces.append(current_face)
-            remaining_faces.pop()
-
-            # Search for common edges between pairs of faces, then check the
-            # ordering of the edge to determine relative face orientation.
-            current_edges = _face_to_edges(self.faces[current_face])
-            for neighbor in self._neighbors[current_face]:
-                if neighbor in visited_faces:
-                    continue
-                remaining_faces.append(neighbor)
-
-                # Two faces can only share a single edge (otherwise they would
-                # be coplanar), so we can break as soon as we find the
-                # neighbor. Flip the neighbor if the edges are identical.
-                for edge in _face_to_edges(self.faces[neighbor]):
-                    if edge in current_edges:
-                        self._faces[neighbor] = self._faces[neighbor][::-1]
-                        break
-                    elif edge[::-1] in current_edges:
-                        break
-                visited_faces.append(neighbor)
-
-        # Now compute the signed area and flip all the orderings if the area is
-        # negative.
+        first, second, _, same_direction = _find_shared_edges(
+            indices, face_ids, next_positions
+        )
+        self._neighbors = _neighbors_from_pairs(first, second, self.num_faces)
+
+        # The initial face sets the order of the others. A face must be flipped
+        # relative to its parent in a breadth-first search tree if the two
+        # traverse their common edge in the same direction.
+        adjacency = coo_matrix(
+            (
+                np.concatenate((same_direction, same_direction)) + 1,
+                (np.concatenate((first, second)), np.concatenate((second, first))),
+            ),
+            shape=(self.num_faces, self.num_faces),
+        ).tocsr()
+        order, parents = breadth_first_order(
+            adjacency, 0, directed=False, return_predecessors=True
+        )
+        children = order[1:]
+        flip = np.zeros(self.num_faces, dtype=bool)
+        flip[children] = np.asarray(adjacency[parents[children], children]).ravel() == 2
+
+        # Accumulate the relative flips along the path to the initial face by
+        # pointer jumping, which takes a logarithmic number of vectorized steps
+        # in the depth of the tree. Faces unreachable from the initial face are
+        # left as they are.
+        parents[parents < 0] = np.flatnonzero(parents < 0)
+        while np.any(parents[parents] != parents):
+            flip ^= flip[parents]
+            parents = parents[parents]
+
+        # Reverse the flipped faces directly in the flat array.
+        positions = np.arange(len(indices))
+        flipped = flip[face_ids]
+        positions[flipped] = (offsets[:-1] + offsets[1:] - 1)[
+            face_ids[flipped]
+        ] - positions[flipped]
+        self._faces = _split_faces(indices[positions], offsets)
+
+        # Now compute the signed volume and flip all the orderings if the
+        # volume is negative.
         self._find_equations()
-        if self.volume < 0:
-            for i in range(len(self.faces)):
-                self._faces[i] = self._faces[i][::-1]
-                self._equations[i] *= -1
+        if np.sum(-self._equations[:, 3] * self.get_face_area()) < 0:
+            self._faces = [face[::-1] for face in self._faces]
+            self._equations *= -1
 
     @property
     def vertices(self):
@@ -347,8 +969,7 @@ class Polyhedron(Shape3D):
     @property
     def volume(self):
         """float: Get or set the polyhedron's volume."""
-        ds = -self._equations[:, 3]
-        return np.sum(ds * self.get_face_area()) / 3
+        return self._get_mass_properties()[0]
 
     @volume.setter
     def volume(self, value):
@@ -385,28 +1006,159 @@ class Polyhedron(Shape3D):
         elif type(faces) is int:
             faces = [faces]
 
-        areas = np.empty(len(faces))
-        for i, face_index in enumerate(faces):
-            face = self.faces[face_index]
-            poly = ConvexPolygon(self.vertices[face], planar_tolerance=1e-4)
-            areas[i] = poly.area
-
-        return areas
+        # The area of a planar polygon is half the magnitude of the sum of the
+        # cross products of consecutive vertices, which can be computed for
+        # all faces at once from the flattened representation.
+        indices, _, offsets, next_positions = _flatten_faces(
+            [self.faces[i] for i in faces]
+        )
+        if len(indices) == 0:
+            return np.empty(0)
+        crosses = np.cross(
+            self.vertices[indices], self.vertices[indices[next_positions]]
+        )
+        return np.linalg.norm(np.add.reduceat(crosses, offsets[:-1]), axis=1) / 2
 
     @property
     def surface_area(self):
         """float: Get the surface area."""
         return np.sum(self.get_face_area())
 
-    def _surface_triangulation(self):
-        """Generate a triangulation of the surface of the polyhedron.
+    def _get_fan_triangles(self):
+        """Get the fan triangulation of the faces, computing it if needed.
 
-        This algorithm constructs Polygons from each of the faces and then
-        triangulates each of these to provide a total triangulation.
+        The triangulation only depends on the faces, so it is cached until
+        the list of faces is replaced.
         """
-        for face in self.faces:
-            poly = Polygon(self.vertices[face], planar_tolerance=1e-4)
-            yield from poly._triangulation()
+        cache = self.__dict__.get("_fan_triangle_cache")
+        if cache is None or cache[0] is not self._faces:
+            cache = (self._faces, _fan_triangles(self._faces))
+            self._fan_triangle_cache = cache
+        return cache[1]
+
+    def _get_mass_properties(self):
+        """Get the volume, centroid, and second moments about the centroid.
+
+        All three quantities are computed together in a single pass over the
+        fan triangulation and cached until the vertices or faces change.
+        """
+        cache = self.__dict__.get("_mass_property_cache")
+        if (
+            cache is None
+            or cache[0] is not self._faces
+            or not np.array_equal(cache[1], self._vertices)
+        ):
+            properties = _mass_properties(self._vertices, self._get_fan_triangles())
+            cache = (self._faces, self._vertices.copy(), properties)
+            self._mass_property_cache = cache
+        return cache[2]
+
+    def _get_surface_triangles(self):
+        """Triangulate the surface with triangles oriented like their faces.
+
+        Returns:
+            :math:`(N_{triangles}, 3, 3)` :class:`numpy.ndarray`:
+                The vertices of the triangles.
+        """
+        if self._faces_are_convex:
+            return self._vertices[self._get_fan_triangles()]
+
+        # The fans of nonconvex faces overlap, so those faces are triangulated
+        # as polygons instead.
+        triangles = []
+        for face in self._faces:
+            face_vertices = self._vertices[face]
+            normal = np.sum(
+                np.cross(face_vertices, np.roll(face_vertices, shift=-1, axis=0)),
+                axis=0,
+            )
+            polygon = Polygon.from_trusted_vertices(face_vertices, normal)
+            face_triangles = np.array(list(polygon._triangulation()), dtype=np.float64)
+            flipped = (
+                np.cross(
+                    face_triangles[:, 1] - face_triangles[:, 0],
+                    face_triangles[:, 2] - face_triangles[:, 0],
+                )
+                @ normal
+                < 0
+            )
+            face_triangles[flipped] = face_triangles[flipped, ::-1]
+            triangles.append(face_triangles)
+        return np.concatenate(triangles)
+
+    def _get_sampler(self, filled):
+        """Get a sampler for the interior or the surface of the polyhedron.
+
+        The interior is decomposed into the tetrahedra formed by the surface
+        triangles and the mean of the vertices. If the polyhedron is not
+        star-shaped with respect to that point, some tetrahedra are inverted,
+        in which case the sampler is returned along with the tetrahedra of
+        both orientations for use in rejection sampling.
+        """
+
+        def build():
+            triangles = self._get_surface_triangles()
+            if not filled:
+                areas = (
+                    np.linalg.norm(
+                        np.cross(
+                            triangles[:, 1] - triangles[:, 0],
+                            triangles[:, 2] - triangles[:, 0],
+                        ),
+                        axis=1,
+                    )
+                    / 2
+                )
+                return _PieceSampler([(areas, _sample_simplices, (triangles,))])
+
+            reference = np.mean(self._vertices, axis=0)
+            tetrahedra = np.concatenate(
+                (np.broadcast_to(reference, (len(triangles), 1, 3)), triangles), axis=1
+            )
+            relative = triangles - reference
+            volumes = (
+                np.einsum(
+                    "ij,ij->i",
+                    relative[:, 0],
+                    np.cross(relative[:, 1], relative[:, 2]),
+                )
+                / 6
+            )
+            if np.sum(volumes) < 0:
+                volumes = -volumes
+            tolerance = 1e-10 * np.max(np.abs(volumes))
+            positive = volumes > tolerance
+            negative = volumes < -tolerance
+            sampler = _PieceSampler(
+                [(volumes[positive], _sample_simplices, (tetrahedra[positive],))]
+            )
+            return sampler, tetrahedra[positive], tetrahedra[negative]
+
+        name = "volume" if filled else "surface"
+        return _get_cached_sampler(self, name, (self._faces, self._vertices), build)
+
+    def sample_volume(self, n, rng=None):  # noqa: D102
+        # Use the parent docstring.
+        rng = np.random.default_rng(rng)
+        sampler, positive, negative = self._get_sampler(True)
+        if len(negative) == 0:
+            return sampler.sample(n, rng)
+
+        def propose(num_proposals):
+            # Points are proposed from the positive tetrahedra, so a point
+            # covered by several of them is proposed proportionally more
+            # often. Points are accepted by their winding number (one inside
+            # the polyhedron and zero outside) relative to that coverage.
+            points = sampler.sample(num_proposals, rng)
+            coverage = np.maximum(_count_containing_tetrahedra(points, positive), 1)
+            winding = coverage - _count_containing_tetrahedra(points, negative)
+            return points, np.clip(winding, 0, None) / coverage
+
+        return _sample_by_rejection(n, rng, propose)
+
+    def sample_surface(self, n, rng=None):  # noqa: D102
+        # Use the parent docstring.
+        return self._get_sampler(False).sample(n, np.random.default_rng(rng))
 
     def _point_plane_distances(self, points):
         """Compute the distances from a set of points to each plane.
@@ -422,6 +1174,175 @@ class Polyhedron(Shape3D):
         distances = dots + self._equations[:, 3]
         return distances
 
+    def _make_cross_section(self, vertices, normal):
+        """Construct a polygon from the ordered vertices of a cross section."""
+        return Polygon.from_trusted_vertices(vertices, normal)
+
+    def get_cross_sections(self, normal, offsets, return_shapes=True):
+        r"""Get the cross sections of the polyhedron with parallel planes.
+
+        The cross sections are the intersections of the polyhedron with the
+        planes :math:`\hat{n} \cdot \vec{r} = d` for a normal
+        :math:`\hat{n}` and many offsets :math:`d`. All sections are computed
+        in a single sweep: the planes crossed by each edge are found by
+        binary search in the sorted offsets, and the crossings within each
+        face are paired into the segments bounding the sections. The areas,
+        perimeters, and moments of the sections are computed directly from
+        these segments, while polygons are only constructed if requested.
+        Since the segments are already ordered, the polygons are constructed
+        without any validation.
+
+        A plane containing a face of the polyhedron yields the section just
+        above it, i.e. in the direction of :math:`\hat{n}`.
+
+        Args:
+            normal (sequence of length 3):
+                The normal of the planes, which need not be normalized.
+            offsets (float or :math:`(N_{planes}, )` array-like):
+                The offsets of the planes along the normalized normal.
+            return_shapes (bool):
+                If False, only the areas, perimeters, centroids, and inertia
+                tensors of the sections are computed (Default value: True).
+
+        Returns:
+            list(list(:class:`~.Polygon`)) or tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`):
+                For each plane, the polygons bounding the cross section,
+                whose vertices are ordered counterclockwise about the normal.
+                Holes are bounded by clockwise polygons with negative signed
+                areas. If ``return_shapes`` is False, the :math:`(N_{planes},
+                )` areas and perimeters, the :math:`(N_{planes}, 3)`
+                centroids, and the :math:`(N_{planes}, 3, 3)` inertia tensors
+                of the sections about their centroids (see
+                :func:`~.polygon_moments_batch`) are returned instead. If
+                ``offsets`` is a scalar, the results for the single plane
+                are returned.
+
+        Example:
+            >>> cube = coxeter.shapes.ConvexPolyhedron(
+            ...   [[1, 1, 1], [1, -1, 1], [1, 1, -1], [1, -1, -1],
+            ...    [-1, 1, 1], [-1, -1, 1], [-1, 1, -1], [-1, -1, -1]])
+            >>> octahedron = coxeter.shapes.Polyhedron(
+            ...   [[1, 0, 0], [-1, 0, 0], [0, 1, 0], [0, -1, 0], [0, 0, 1],
+            ...    [0, 0, -1]],
+            ...   [[0, 2, 4], [2, 1, 4], [1, 3, 4], [3, 0, 4],
+            ...    [2, 0, 5], [1, 2, 5], [3, 1, 5], [0, 3, 5]])
+            >>> areas, perimeters, centroids, inertia_tensors = (
+            ...   octahedron.get_cross_sections(
+            ...     [0, 0, 1], [-0.5, 0, 0.5], return_shapes=False))
+            >>> areas
+            array([0.5, 2. , 0.5])
+            >>> sections = cube.get_cross_sections([1, 1, 1], 0)
+            >>> len(sections), len(sections[0].vertices)
+            (1, 6)
+
+        """  # noqa: E501
+        normal = np.asarray(normal, dtype=np.float64)
+        normal = normal / np.linalg.norm(normal)
+        single = np.ndim(offsets) == 0
+        offsets = np.atleast_1d(np.asarray(offsets, dtype=np.float64))
+        sorting = np.argsort(offsets, kind="stable")
+        sorted_offsets = offsets[sorting]
+        starts, ends, planes, start_keys, end_keys = _cross_section_segments(
+            self._vertices, self.faces, normal, sorted_offsets
+        )
+
+        if return_shapes:
+            # Each segment is followed by the segment starting where it ends.
+            sorter = np.argsort(start_keys)
+            successors = sorter[np.searchsorted(start_keys, end_keys, sorter=sorter)]
+            order, cycle_offsets = _cycle_order(successors)
+            cycle_planes = sorting[planes[order[cycle_offsets[:-1]]]]
+
+            # Segments of zero length occur at vertices lying in a plane.
+            lengths = np.linalg.norm(ends - starts, axis=1)[order]
+            keep = lengths > 1e-10 * np.max(np.ptp(self._vertices, axis=0))
+            cycle_lengths = _segment_sum(keep.astype(int), cycle_offsets)
+            points = starts[order[keep]]
+            cycle_offsets = np.concatenate(([0], np.cumsum(cycle_lengths, dtype=int)))
+
+            sections = [[] for _ in sorting]
+            for plane, start, end in zip(
+                cycle_planes, cycle_offsets[:-1], cycle_offsets[1:]
+            ):
+                if end - start >= 3:
+                    sections[plane].append(
+                        self._make_cross_section(points[start:end], normal)
+                    )
+            return sections[0] if single else sections
+
+        # The moments are computed relative to the projection of the center
+        # of the vertices onto each plane.
+        center = np.mean(self._vertices, axis=0)
+        references = center + np.outer(sorted_offsets - center @ normal, normal)
+        starts = starts - references[planes]
+        ends = ends - references[planes]
+        offsets = np.concatenate(
+            ([0], np.cumsum(np.bincount(planes, minlength=len(sorted_offsets))))
+        )
+        areas, centroids, inertia_tensors = _edge_moments(
+            starts, ends, np.cross(starts, ends) @ normal, offsets
+        )
+        perimeters = _segment_sum(np.linalg.norm(ends - starts, axis=1), offsets)
+
+        results = []
+        for values in (areas, perimeters, centroids + references, inertia_tensors):
+            unsorted = np.empty_like(values)
+            unsorted[sorting] = values
+            results.append(unsorted[0] if single else unsorted)
+        return tuple(results)
+
+    def get_descriptor(self, degree=10):
+        r"""Get a rotation-invariant descriptor of the shape of the polyhedron.
+
+        The descriptor is a vector of features that are invariant to
+        rotations, reflections, translations, and scaling of the polyhedron,
+        so that similar shapes have nearby descriptors. It consists of
+
+        - the principal moments of inertia in ascending order, divided by
+          :math:`V^{5/3}`, and
+        - the rotation-invariant power spectrum of the extended Gaussian
+          image :cite:`Horn1984` of the polyhedron, i.e. the distribution of
+          its face areas over the sphere of normal directions, for the
+          degrees :math:`l = 2, \ldots, l_{max}` :cite:`Kazhdan2003`.
+
+        With the expansion :math:`\sum_f A_f \delta(\hat{n} - \hat{n}_f) =
+        \sum_{l, m} a_{lm} Y_l^m(\hat{n})` of the face areas :math:`A_f` and
+        normals :math:`\hat{n}_f`, the spectrum entries are
+
+        .. math::
+
+            \frac{1}{S} \sqrt{\frac{4 \pi}{2l + 1} \sum_{m=-l}^{l}
+            |a_{lm}|^2}
+            = \frac{1}{S} \sqrt{\sum_{f, g} A_f A_g
+            P_l(\hat{n}_f \cdot \hat{n}_g)},
+
+        which lie between 0 and 1, where :math:`S` is the surface area. The
+        degrees :math:`l = 0` and :math:`l = 1` are omitted since they are
+        the same for all closed polyhedra. For a convex polyhedron, the
+        extended Gaussian image determines the shape up to translation.
+
+        See :func:`~coxeter.shapes.shape_descriptors` to compute the
+        descriptors of many polyhedra at once.
+
+        Args:
+            degree (int):
+                The largest degree :math:`l_{max} \geq 2` of the spectrum
+                (Default value: 10).
+
+        Returns:
+            :math:`(l_{max} + 2, )` :class:`numpy.ndarray`:
+                The descriptor.
+
+        Example:
+            >>> cube = coxeter.families.PlatonicFamily.get_shape("Cube")
+            >>> descriptor = cube.get_descriptor(degree=4)
+            >>> np.allclose(
+            ...   descriptor, [1 / 6, 1 / 6, 1 / 6, 0, 0, np.sqrt(21) / 6])
+            True
+
+        """
+        return _polyhedron_descriptors([self], degree)[0]
+
     @property
     def inertia_tensor(self):
         """:math:`(3, 3)` :class:`numpy.ndarray`: Get the inertia tensor.
@@ -434,8 +1355,9 @@ class Polyhedron(Shape3D):
             center of mass and then shifted rather than directly computed in
             the global frame.
         """
-        it = self._compute_inertia_tensor()
-        return translate_inertia_tensor(self.center, it, self.volume)
+        volume, centroid, second_moments = self._get_mass_properties()
+        it = np.trace(second_moments) * np.eye(3) - second_moments
+        return translate_inertia_tensor(centroid, it, volume)
 
     def _compute_inertia_tensor(self, centered=True):
         """Compute the inertia tensor.
@@ -443,37 +1365,25 @@ class Polyhedron(Shape3D):
         Internal function for computing the inertia tensor that supports both
         centered and uncentered calculations. Primarily of use for testing and
         validation purposes.
-        """
-        simplices = np.array(list(self._surface_triangulation()))
-        if centered:
-            simplices -= self.center
-
-        volumes = np.abs(np.linalg.det(simplices) / 6)
-
-        def triangle_integrate(f):
-            r"""Integrate f over the simplices.
 
-            This function computes integrals of the form
-            :math:`\int\int\int f(x, y, z) dx dy dz` over a set of triangles.
-            """
-            fv1 = f(simplices[:, 0, :])
-            fv2 = f(simplices[:, 1, :])
-            fv3 = f(simplices[:, 2, :])
-            fvsum = f(simplices[:, 0, :] + simplices[:, 1, :] + simplices[:, 2, :])
-            return np.sum((volumes / 20) * (fv1 + fv2 + fv3 + fvsum))
-
-        i_xx = triangle_integrate(lambda t: t[:, 1] ** 2 + t[:, 2] ** 2)
-        i_xy = triangle_integrate(lambda t: -t[:, 0] * t[:, 1])
-        i_xz = triangle_integrate(lambda t: -t[:, 0] * t[:, 2])
-        i_yy = triangle_integrate(lambda t: t[:, 0] ** 2 + t[:, 2] ** 2)
-        i_yz = triangle_integrate(lambda t: -t[:, 1] * t[:, 2])
-        i_zz = triangle_integrate(lambda t: t[:, 0] ** 2 + t[:, 1] ** 2)
-
-        return np.array([[i_xx, i_xy, i_xz], [i_xy, i_yy, i_yz], [i_xz, i_yz, i_zz]])
+        Args:
+            centered (bool):
+                If True, the inertia tensor is computed about the center of
+                mass. Otherwise, it is computed about the origin (Default
+                value: True).
+        """
+        volume, centroid, second_moments = self._get_mass_properties()
+        if not centered:
+            second_moments = second_moments + volume * np.outer(centroid, centroid)
+        return np.trace(second_moments) * np.eye(3) - second_moments
 
     @property
     def center(self):
-        """:math:`(3, )` :class:`numpy.ndarray` of float: Get or set the centroid of the shape."""  # noqa: E501
+        """:math:`(3, )` :class:`numpy.ndarray` of float: Get or set the center of the shape.
+
+        The center is the mean of the vertices. See :attr:`centroid` for the
+        center of mass.
+        """  # noqa: E501
         return np.mean(self.vertices, axis=0)
 
     @center.setter
@@ -481,6 +1391,26 @@ class Polyhedron(Shape3D):
         self._vertices += np.asarray(value) - self.center
         self._find_equations()
 
+    @property
+    def centroid(self):
+        """:math:`(3, )` :class:`numpy.ndarray` of float: Get the center of mass.
+
+        The center of mass is computed in the same pass over the faces as the
+        volume and inertia tensor, so querying all three costs no more than
+        querying one of them.
+
+        Example:
+            >>> pyramid = coxeter.shapes.Polyhedron(
+            ...   [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 1]],
+            ...   [[0, 3, 2, 1], [0, 1, 4], [1, 2, 4], [2, 3, 4], [3, 0, 4]])
+            >>> pyramid.centroid
+            array([0.375, 0.375, 0.25 ])
+            >>> pyramid.center
+            array([0.4, 0.4, 0.2])
+
+        """
+        return self._get_mass_properties()[1].copy()
+
     @property
     def bounding_sphere(self):
         """:class:`~.Sphere`: Get the center and radius of the bounding sphere."""
@@ -594,7 +1524,8 @@ class Polyhedron(Shape3D):
 
         The principal axes of a shape are defined by the eigenvectors of the inertia
         tensor. This method computes the inertia tensor of the shape, diagonalizes it,
-        and then rotates the shape by the corresponding orthogonal transformation.
+        and then rotates the shape by the corresponding rotation. Use
+        :func:`~.diagonalize_inertia_batch` to orient many shapes at once.
 
         Example:
             >>> cube = coxeter.shapes.ConvexPolyhedron(
@@ -614,8 +1545,7 @@ class Polyhedron(Shape3D):
                    [-1., -1., -1.]])
 
         """
-        principal_moments, principal_axes = np.linalg.eigh(self.inertia_tensor)
-        self._vertices = np.dot(self._vertices, principal_axes)
+        diagonalize_inertia_batch([self])
 
     def compute_form_factor_amplitude(self, q, density=1.0):  # noqa: D102
         """Calculate the form factor intensity.
@@ -664,7 +1594,9 @@ class Polyhedron(Shape3D):
             # distance in the line below due to our equation sign convention (see
             # _find_equations).
             face_normal, d = eqn[:3], -eqn[3]
-            face_polygon = Polygon(self.vertices[face], face_normal)
+            face_polygon = Polygon.from_trusted_vertices(
+                self.vertices[face], face_normal
+            )
             face_form_factors = face_polygon.compute_form_factor_amplitude(q[~zero_q])
 
             # Translate the calculation into the reference frame of the polyhedron.
@@ -675,3 +1607,243 @@ class Polyhedron(Shape3D):
             ) / q_sqs[~zero_q]
 
         return form_factor
+
+
+def diagonalize_inertia_batch(polyhedra):
+    """Orient many polyhedra along their principal axes at once.
+
+    This is a batched version of :meth:`Polyhedron.diagonalize_inertia`. The
+    inertia tensors of all polyhedra are computed in a single pass over all
+    of their faces and diagonalized together, after which the vertices and
+    face normals of each polyhedron are rotated in place. The rotations are
+    always proper, so the orientations of the faces are preserved.
+
+    Args:
+        polyhedra (sequence of :class:`~.Polyhedron`):
+            The polyhedra to orient.
+
+    Returns:
+        :math:`(N_{polyhedra}, 4)` :class:`numpy.ndarray`:
+            The quaternions of the rotations applied to each polyhedron,
+            such that ``rowan.rotate(q, old_vertices)`` gives the new
+            vertices.
+
+    Example:
+        >>> import rowan
+        >>> box = coxeter.shapes.ConvexPolyhedron(
+        ...   [[1, 2, 3], [1, -2, 3], [1, 2, -3], [1, -2, -3],
+        ...    [-1, 2, 3], [-1, -2, 3], [-1, 2, -3], [-1, -2, -3]])
+        >>> rotation = rowan.from_axis_angle([1, 1, 0], np.pi / 3)
+        >>> rotated_box = coxeter.shapes.ConvexPolyhedron(
+        ...   rowan.rotate(rotation, box.vertices))
+        >>> quaternions = coxeter.shapes.diagonalize_inertia_batch(
+        ...   [box, rotated_box])
+        >>> np.allclose(rotated_box.inertia_tensor, box.inertia_tensor)
+        True
+
+    """
+    polyhedra = list(polyhedra)
+    if len(polyhedra) == 0:
+        return np.empty((0, 4))
+
+    vertices, vertex_offsets, triangles, triangle_offsets = _stack_triangulations(
+        polyhedra
+    )
+    vertex_counts = np.diff(vertex_offsets)
+    volumes, centroids, second_moments = _mass_properties_batch(
+        vertices, vertex_offsets, triangles, triangle_offsets
+    )
+
+    # The inertia tensors about the origin.
+    moments = second_moments + volumes[:, np.newaxis, np.newaxis] * (
+        centroids[:, :, np.newaxis] * centroids[:, np.newaxis, :]
+    )
+    inertia_tensors = (
+        np.trace(moments, axis1=1, axis2=2)[:, np.newaxis, np.newaxis] * np.eye(3)
+        - moments
+    )
+    _, principal_axes = np.linalg.eigh(inertia_tensors)
+    # Flip an axis of improper rotations, which would invert the faces.
+    principal_axes[np.linalg.det(principal_axes) < 0, :, 2] *= -1
+
+    rotated_vertices = np.einsum(
+        "ni,nij->nj", vertices, np.repeat(principal_axes, vertex_counts, axis=0)
+    )
+    face_counts = [len(poly._equations) for poly in polyhedra]
+    rotated_normals = np.einsum(
+        "ni,nij->nj",
+        np.concatenate([poly._equations[:, :3] for poly in polyhedra]),
+        np.repeat(principal_axes, face_counts, axis=0),
+    )
+    rotated_centroids = np.einsum("ni,nij->nj", centroids, principal_axes)
+    rotated_second_moments = np.einsum(
+        "nki,nkl,nlj->nij", principal_axes, second_moments, principal_axes
+    )
+
+    face_offsets = np.concatenate([[0], np.cumsum(face_counts)])
+    for i, poly in enumerate(polyhedra):
+        # The plane offsets are invariant to rotations about the origin, so
+        # only the normals need to be rotated.
+        poly._vertices[:] = rotated_vertices[vertex_offsets[i] : vertex_offsets[i + 1]]
+        poly._equations[:, :3] = rotated_normals[face_offsets[i] : face_offsets[i + 1]]
+        poly._mass_property_cache = (
+            poly._faces,
+            poly._vertices.copy(),
+            (volumes[i], rotated_centroids[i], rotated_second_moments[i]),
+        )
+
+    # Row vectors are rotated by right multiplication with the principal
+    # axes, which is a rotation by the transposed matrix.
+    return rowan.from_matrix(np.transpose(principal_axes, (0, 2, 1)))
+
+
+def _spherical_harmonics(directions, degree):
+    r"""Evaluate the spherical harmonics of nonnegative order at directions.
+
+    The orthonormal spherical harmonics :math:`Y_l^m` are computed from the
+    standard recurrences of the normalized associated Legendre functions,
+    which are stable to high degrees. Harmonics of negative order follow
+    from :math:`Y_l^{-m} = (-1)^m \overline{Y_l^m}`.
+
+    Args:
+        directions (:math:`(N, 3)` :class:`numpy.ndarray`):
+            The unit vectors at which to evaluate the harmonics.
+        degree (int):
+            The largest degree.
+
+    Returns:
+        :math:`(N, (l_{max} + 1)(l_{max} + 2) / 2)` :class:`numpy.ndarray`:
+            The complex harmonics ordered by degree :math:`l` and then by
+            order :math:`0 \leq m \leq l`.
+    """
+    cosines = directions[:, 2]
+    sines = np.hypot(directions[:, 0], directions[:, 1])
+    # The azimuthal phases, which are arbitrary along the polar axis.
+    phases = (directions[:, 0] + 1j * directions[:, 1]) / np.where(sines > 0, sines, 1)
+    phases[sines == 0] = 1
+
+    legendre = {(0, 0): np.full(len(directions), np.sqrt(1 / (4 * np.pi)))}
+    for m in range(1, degree + 1):
+        legendre[m, m] = (
+            -np.sqrt((2 * m + 1) / (2 * m)) * sines * legendre[m - 1, m - 1]
+        )
+    for m in range(degree):
+        legendre[m + 1, m] = np.sqrt(2 * m + 3) * cosines * legendre[m, m]
+        for l in range(m + 2, degree + 1):  # noqa: E741
+            a = np.sqrt((4 * l ** 2 - 1) / (l ** 2 - m ** 2))
+            b = np.sqrt(((l - 1) ** 2 - m ** 2) / (4 * (l - 1) ** 2 - 1))
+            legendre[l, m] = a * (cosines * legendre[l - 1, m] - b * legendre[l - 2, m])
+
+    phase_powers = [np.ones_like(phases)]
+    for m in range(1, degree + 1):
+        phase_powers.append(phase_powers[-1] * phases)
+    harmonics = np.empty(
+        (len(directions), (degree + 1) * (degree + 2) // 2), dtype=np.complex128
+    )
+    column = 0
+    for l in range(degree + 1):  # noqa: E741
+        for m in range(l + 1):
+            np.multiply(legendre[l, m], phase_powers[m], out=harmonics[:, column])
+            column += 1
+    return harmonics
+
+
+def _polyhedron_descriptors(polyhedra, degree):
+    """Compute the rotation-invariant descriptors of many polyhedra.
+
+    See :meth:`Polyhedron.get_descriptor` for the definition of the
+    descriptors. The extended Gaussian images are accumulated over the faces
+    of all polyhedra at once.
+
+    Args:
+        polyhedra (sequence of :class:`Polyhedron`):
+            The polyhedra.
+        degree (int):
+            The largest degree of the spectra.
+
+    Returns:
+        :math:`(N_{polyhedra}, l_{max} + 2)` :class:`numpy.ndarray`:
+            The descriptors.
+    """
+    if degree < 2:
+        raise ValueError("The degree of the descriptors must be at least 2.")
+    polyhedra = list(polyhedra)
+    if len(polyhedra) == 0:
+        return np.empty((0, degree + 2))
+
+    vertices, vertex_offsets, triangles, triangle_offsets = _stack_triangulations(
+        polyhedra
+    )
+    volumes, _, second_moments = _mass_properties_batch(
+        vertices, vertex_offsets, triangles, triangle_offsets
+    )
+    volumes = np.abs(volumes)
+    inertia_tensors = (
+        np.trace(second_moments, axis1=1, axis2=2)[:, np.newaxis, np.newaxis]
+        * np.eye(3)
+        - second_moments
+    )
+    moments = np.abs(np.linalg.eigvalsh(inertia_tensors)) / volumes[:, np.newaxis] ** (
+        5 / 3
+    )
+
+    # The fan triangles of each face are consecutive, so the signed vector
+    # areas of the faces are sums over runs of triangles. Inverted triangles
+    # of nonconvex faces cancel, which makes the areas and normals of the
+    # faces independent of the vertex at which each face starts. Reversing
+    # all normals only changes the signs of the odd degree coefficients.
+    face_sizes = np.fromiter(
+        (len(face) for poly in polyhedra for face in poly._faces), dtype=np.intp
+    )
+    face_offsets = np.concatenate(
+        [[0], np.cumsum([len(poly._faces) for poly in polyhedra])]
+    ).astype(np.intp)
+    triangle_vector_areas = (
+        np.cross(
+            vertices[triangles[:, 1]] - vertices[triangles[:, 0]],
+            vertices[triangles[:, 2]] - vertices[triangles[:, 0]],
+        )
+        / 2
+    )
+    vector_areas = np.add.reduceat(
+        triangle_vector_areas, np.cumsum(face_sizes - 2) - (face_sizes - 2)
+    )
+    areas = np.linalg.norm(vector_areas, axis=1)
+    directions = vector_areas / np.where(areas > 0, areas, 1)[:, np.newaxis]
+
+    # The harmonics are evaluated for blocks of polyhedra to limit memory use.
+    num_harmonics = (degree + 1) * (degree + 2) // 2
+    block_size = max(1, _MAX_ELEMENTS_PER_BLOCK // num_harmonics)
+    powers = np.empty((len(polyhedra), num_harmonics))
+    begin = 0
+    while begin < len(polyhedra):
+        end = max(
+            begin + 1,
+            np.searchsorted(
+                face_offsets, face_offsets[begin] + block_size, side="right"
+            )
+            - 1,
+        )
+        block = slice(face_offsets[begin], face_offsets[end])
+        harmonics = _spherical_harmonics(directions[block], degree)
+        harmonics *= areas[block, np.newaxis]
+        # The real and imaginary parts are summed as interleaved columns.
+        coefficients = _segment_sum(
+            harmonics.view(np.float64),
+            face_offsets[begin : end + 1] - face_offsets[begin],
+        )
+        powers[begin:end] = np.sum(
+            (coefficients ** 2).reshape(end - begin, num_harmonics, 2), axis=2
+        )
+        begin = end
+
+    # Sum over the orders of each degree, counting the negative orders
+    # through the positive ones.
+    degrees = np.concatenate([np.full(n + 1, n) for n in range(degree + 1)])
+    orders = np.concatenate([np.arange(n + 1) for n in range(degree + 1)])
+    powers *= np.where(orders > 0, 2, 1)
+    spectra = powers @ (degrees[:, np.newaxis] == np.arange(degree + 1))
+    spectra *= 4 * np.pi / (2 * np.arange(degree + 1) + 1)
+    surface_areas = _segment_sum(areas, face_offsets)
+    spectra = np.sqrt(spectra[:, 2:]) / surface_areas[:, np.newaxis]
+    return np.concatenate((moments, spectra), axis=1)
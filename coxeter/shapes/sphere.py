@@ -3,7 +3,7 @@
 import numpy as np
 
 from .base_classes import Shape3D
-from .utils import translate_inertia_tensor
+from .utils import _sample_directions, translate_inertia_tensor
 
 
 class Sphere(Shape3D):
@@ -89,6 +89,15 @@ class Sphere(Shape3D):
         else:
             raise ValueError("Surface area must be greater than zero.")
 
+    @property
+    def mean_curvature(self):
+        """float: The integrated, normalized mean curvature.
+
+        With the normalization used by :attr:`.ConvexPolyhedron.mean_curvature`,
+        this is the radius of the sphere.
+        """
+        return self.radius
+
     @property
     def inertia_tensor(self):
         """float: Get the inertia tensor. Assumes constant density of 1."""
@@ -130,6 +139,17 @@ class Sphere(Shape3D):
         points = np.atleast_2d(points) - self.center
         return np.linalg.norm(points, axis=-1) <= self.radius
 
+    def sample_volume(self, n, rng=None):  # noqa: D102
+        # Use the parent docstring.
+        rng = np.random.default_rng(rng)
+        distances = self.radius * np.cbrt(rng.random((n, 1)))
+        return self.center + distances * _sample_directions(n, rng)
+
+    def sample_surface(self, n, rng=None):  # noqa: D102
+        # Use the parent docstring.
+        rng = np.random.default_rng(rng)
+        return self.center + self.radius * _sample_directions(n, rng)
+
     def compute_form_factor_amplitude(self, q, density=1.0):  # noqa: D102
         # Use the parent docstring.
 
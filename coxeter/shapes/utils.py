@@ -8,6 +8,11 @@ utility is in the context of the shape classes.
 
 import numpy as np
 
+# The maximum number of elements of the temporary arrays created for a single
+# block of a batched computation, which bounds the memory used by vectorized
+# operations over many shapes or orientations.
+_MAX_ELEMENTS_PER_BLOCK = 2 ** 22
+
 
 def translate_inertia_tensor(displacement, inertia_tensor, volume):
     """Apply the generalized parallel axis theorem for 3D inertia tensors."""
@@ -24,6 +29,284 @@ def rotate_order2_tensor(rotation, tensor):
     return rotation @ tensor @ rotation.T
 
 
+def _segment_sum(values, offsets):
+    """Sum consecutive segments of an array, allowing empty segments."""
+    totals = np.zeros((len(offsets) - 1,) + values.shape[1:])
+    nonempty = np.flatnonzero(np.diff(offsets))
+    if len(nonempty):
+        totals[nonempty] = np.add.reduceat(values, offsets[nonempty], axis=0)
+    return totals
+
+
+def _alias_table(weights):
+    """Build an alias table for sampling indices proportionally to weights.
+
+    Uses Vose's variant of Walker's alias method, so that each sample
+    requires only a constant number of operations regardless of the number
+    of weights.
+
+    Args:
+        weights (:math:`(N, )` :class:`numpy.ndarray`):
+            The nonnegative weights, which must not all be zero.
+
+    Returns:
+        tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`):
+            The probability of keeping each index and the alias to use
+            otherwise.
+    """
+    probabilities = np.asarray(weights, dtype=np.float64)
+    probabilities = probabilities * (len(probabilities) / np.sum(probabilities))
+    aliases = np.arange(len(probabilities))
+    small = list(np.flatnonzero(probabilities < 1))
+    large = list(np.flatnonzero(probabilities >= 1))
+    while small and large:
+        less, more = small.pop(), large.pop()
+        aliases[less] = more
+        probabilities[more] -= 1 - probabilities[less]
+        (small if probabilities[more] < 1 else large).append(more)
+    # Any remaining entries differ from one only by rounding errors.
+    probabilities[small + large] = 1
+    return probabilities, aliases
+
+
+def _sample_alias(table, n, rng):
+    """Sample indices from an alias table built by :func:`_alias_table`."""
+    probabilities, aliases = table
+    indices = rng.integers(len(probabilities), size=n)
+    return np.where(rng.random(n) < probabilities[indices], indices, aliases[indices])
+
+
+def _sample_directions(n, rng, dimensions=3):
+    """Sample unit vectors uniformly distributed over all directions."""
+    directions = rng.normal(size=(n, dimensions))
+    return directions / np.linalg.norm(directions, axis=-1, keepdims=True)
+
+
+def _sample_simplices(indices, rng, corners):
+    """Sample points uniformly from simplices.
+
+    Args:
+        indices (:math:`(N, )` :class:`numpy.ndarray`):
+            The simplex from which to draw each point.
+        rng (:class:`numpy.random.Generator`):
+            The random number generator.
+        corners (:math:`(N_{simplices}, N_{corners}, 3)` :class:`numpy.ndarray`):
+            The corners of the simplices, e.g. two for segments, three for
+            triangles, and four for tetrahedra.
+
+    Returns:
+        :math:`(N, 3)` :class:`numpy.ndarray`: The sampled points.
+    """
+    # Normalized exponential variates are uniformly distributed barycentric
+    # coordinates.
+    weights = rng.exponential(size=(len(indices), corners.shape[1]))
+    weights /= np.sum(weights, axis=1, keepdims=True)
+    return np.einsum("ij,ijk->ik", weights, corners[indices])
+
+
+def _sample_prisms(indices, rng, corners, directions, height, filled):
+    """Sample points from simplices swept along a direction.
+
+    Args:
+        indices (:math:`(N, )` :class:`numpy.ndarray`):
+            The prism from which to draw each point.
+        rng (:class:`numpy.random.Generator`):
+            The random number generator.
+        corners (:math:`(N_{prisms}, N_{corners}, 3)` :class:`numpy.ndarray`):
+            The corners of the base simplices.
+        directions (:math:`(N_{prisms}, 3)` :class:`numpy.ndarray`):
+            The unit directions along which the bases are swept.
+        height (float):
+            The distance by which the bases are swept.
+        filled (bool):
+            If True, points are sampled from the volume of the prisms.
+            Otherwise, they are sampled from the swept copies of the bases.
+
+    Returns:
+        :math:`(N, 3)` :class:`numpy.ndarray`: The sampled points.
+    """
+    offsets = height * (rng.random(len(indices)) if filled else 1)
+    return (
+        _sample_simplices(indices, rng, corners)
+        + np.reshape(offsets, (-1, 1)) * directions[indices]
+    )
+
+
+def _sample_wedges(indices, rng, corners, first, second, angles, radius, filled):
+    """Sample points from circular sectors swept along segments.
+
+    The sector of each wedge starts at the unit vector ``first`` and rotates
+    towards the perpendicular unit vector ``second`` by the wedge's angle.
+
+    Args:
+        indices (:math:`(N, )` :class:`numpy.ndarray`):
+            The wedge from which to draw each point.
+        rng (:class:`numpy.random.Generator`):
+            The random number generator.
+        corners (:math:`(N_{wedges}, N_{corners}, 3)` :class:`numpy.ndarray`):
+            The segments (or single points) along which the sectors are
+            swept.
+        first, second (:math:`(N_{wedges}, 3)` :class:`numpy.ndarray`):
+            Orthonormal vectors spanning the plane of each sector.
+        angles (:math:`(N_{wedges}, )` :class:`numpy.ndarray`):
+            The opening angle of each sector.
+        radius (float):
+            The radius of the sectors.
+        filled (bool):
+            If True, points are sampled from the volume of the wedges.
+            Otherwise, they are sampled from their curved surfaces.
+
+    Returns:
+        :math:`(N, 3)` :class:`numpy.ndarray`: The sampled points.
+    """
+    phis = angles[indices] * rng.random(len(indices))
+    distances = radius * (np.sqrt(rng.random(len(indices))) if filled else 1)
+    directions = (
+        np.cos(phis)[:, np.newaxis] * first[indices]
+        + np.sin(phis)[:, np.newaxis] * second[indices]
+    )
+    return (
+        _sample_simplices(indices, rng, corners)
+        + np.reshape(distances, (-1, 1)) * directions
+    )
+
+
+def _sample_vertex_balls(indices, rng, vertices, radius, filled):
+    """Sample points from the rounded vertices of a spheropolyhedron.
+
+    The normal cones of the vertices of a convex polyhedron partition the
+    sphere of directions, so the rounded vertex regions together form a ball.
+    Each sampled direction is assigned to the vertex in whose normal cone it
+    lies, which is the vertex furthest along that direction.
+
+    Args:
+        indices (:math:`(N, )` :class:`numpy.ndarray`):
+            Only the number of indices is used.
+        rng (:class:`numpy.random.Generator`):
+            The random number generator.
+        vertices (:math:`(N_{vertices}, 3)` :class:`numpy.ndarray`):
+            The vertices of the convex polyhedron.
+        radius (float):
+            The rounding radius.
+        filled (bool):
+            If True, points are sampled from the volume of the rounded
+            vertices. Otherwise, they are sampled from their surfaces.
+
+    Returns:
+        :math:`(N, 3)` :class:`numpy.ndarray`: The sampled points.
+    """
+    directions = _sample_directions(len(indices), rng)
+    distances = radius * (np.cbrt(rng.random(len(indices))) if filled else 1)
+    supports = vertices[np.argmax(directions @ vertices.T, axis=1)]
+    return supports + np.reshape(distances, (-1, 1)) * directions
+
+
+def _sample_by_rejection(n, rng, propose):
+    """Draw samples by accepting proposals with given probabilities.
+
+    Args:
+        n (int):
+            The number of samples.
+        rng (:class:`numpy.random.Generator`):
+            The random number generator.
+        propose (callable):
+            A function ``propose(m)`` returning ``m`` proposed points and the
+            probability of accepting each of them.
+
+    Returns:
+        :math:`(n, 3)` :class:`numpy.ndarray`: The accepted points.
+    """
+    samples = []
+    remaining = n
+    acceptance = 1
+    while remaining > 0:
+        # Oversample according to the acceptance rate observed so far.
+        num_proposals = int(np.ceil(1.1 * remaining / acceptance)) + 16
+        points, probabilities = propose(num_proposals)
+        accepted = points[rng.random(num_proposals) < probabilities][:remaining]
+        acceptance = max(np.mean(probabilities), 1e-3)
+        samples.append(accepted)
+        remaining -= len(accepted)
+    return np.concatenate(samples) if samples else np.empty((0, 3))
+
+
+class _PieceSampler:
+    """Sample points uniformly from a union of disjoint pieces.
+
+    The pieces are organized into groups sharing a sampling function. Pieces
+    are selected proportionally to their measure with a single alias table,
+    after which the points of each group are generated in one vectorized
+    call. Sampling functions must be module level functions so that samplers
+    can be pickled along with the shapes caching them.
+
+    Args:
+        groups (list(tuple)):
+            Tuples ``(weights, function, args)`` where ``weights`` are the
+            measures of the pieces in the group and ``function(indices, rng,
+            *args)`` samples points from the pieces with the given indices.
+    """
+
+    def __init__(self, groups):
+        groups = [
+            (np.asarray(weights, dtype=np.float64), function, args)
+            for weights, function, args in groups
+        ]
+        weights = np.concatenate([group[0] for group in groups])
+        self.measure = np.sum(weights)
+        self._groups = [group[1:] for group in groups]
+        self._offsets = np.cumsum([0] + [len(group[0]) for group in groups])
+        self._table = _alias_table(weights) if self.measure > 0 else None
+
+    def sample(self, n, rng):
+        if self._table is None:
+            raise ValueError("Cannot sample points from a shape of zero measure.")
+        indices = _sample_alias(self._table, n, rng)
+        group_ids = np.searchsorted(self._offsets, indices, side="right") - 1
+        points = np.empty((n, 3))
+        for group_id, (function, args) in enumerate(self._groups):
+            selected = group_ids == group_id
+            if np.any(selected):
+                points[selected] = function(
+                    indices[selected] - self._offsets[group_id], rng, *args
+                )
+        return points
+
+
+def _get_cached_sampler(shape, name, state, build):
+    """Get a sampler cached on a shape, rebuilding it if the shape changed.
+
+    Args:
+        shape (:class:`~.Shape`):
+            The shape on which to cache the sampler.
+        name (str):
+            The name of the sampler.
+        state (tuple):
+            The attributes the sampler depends on. Arrays are compared by
+            value, numbers by equality, and all other objects by identity.
+        build (callable):
+            A function constructing the sampler.
+
+    Returns:
+        :class:`_PieceSampler`: The sampler.
+    """
+
+    def unchanged(old, new):
+        if isinstance(new, np.ndarray):
+            return np.array_equal(old, new)
+        if isinstance(new, (int, float, np.number)):
+            return old == new
+        return old is new
+
+    cache = shape.__dict__.setdefault("_sampler_cache", {})
+    entry = cache.get(name)
+    if entry is None or not all(map(unchanged, entry[0], state)):
+        state = tuple(
+            value.copy() if isinstance(value, np.ndarray) else value for value in state
+        )
+        entry = cache[name] = (state, build())
+    return entry[1]
+
+
 def _generate_ax(ax=None, axes3d=False):
     """Create an instance of :class:`matplotlib.axes.Axes` if needed.
 
@@ -0,0 +1,467 @@
+r"""Compute excluded volumes and second virial coefficients of convex shapes.
+
+The excluded volume of two convex shapes :math:`K` and :math:`L` at a fixed
+relative orientation is the volume of the set of positions of :math:`L`
+relative to :math:`K` at which the two shapes overlap, which is the volume of
+the Minkowski sum :math:`K \oplus (-L)`. By the theory of mixed volumes, this
+volume is
+
+.. math::
+
+    V_{ex} = V_K + V_L + \int_{S^2} h_{-L} \, dS_K + \int_{S^2} h_K \, dS_{-L},
+
+where :math:`h` denotes the support function of a shape and :math:`dS` its
+surface area measure. Averaging over all orientations of :math:`L` gives the
+closed form :math:`V_K + V_L + R_K S_L + R_L S_K` in terms of the volumes
+:math:`V`, surface areas :math:`S`, and normalized mean curvatures :math:`R`
+of the shapes, and the second virial coefficient of a hard particle fluid is
+half of this orientationally averaged excluded volume :cite:`Irrgang2017`.
+
+Excluded volumes of (rounded) polyhedra and spheres at fixed orientations are
+computed exactly: the surface area measure of a polyhedron is concentrated on
+its face normals, and the surface area of the Minkowski sum of two polyhedra
+follows from the edges whose arcs on the Gauss sphere cross. Whenever an
+ellipsoid is involved, the integrals over its surface area measure and the
+rounded edges of the other shape are evaluated with Gaussian quadrature.
+"""
+
+import numpy as np
+import rowan
+
+from .convex_polyhedron import ConvexPolyhedron
+from .convex_spheropolyhedron import ConvexSpheropolyhedron
+from .ellipsoid import Ellipsoid
+from .minkowski import _TIE_BREAKING_ROTATION, _arc_crossings
+from .sphere import Sphere
+from .utils import _MAX_ELEMENTS_PER_BLOCK, _sample_directions
+
+
+class _ConvexBody:
+    """The data of a convex shape needed to compute its mixed volumes.
+
+    Every supported shape is represented either as an ellipsoid or as a
+    convex polyhedron rounded by a sphere, where spheres are represented by
+    a polyhedron consisting of a single vertex. All quantities are expressed
+    relative to the center of the shape.
+
+    Args:
+        shape (:class:`~.Shape3D`):
+            A :class:`~.ConvexPolyhedron`, :class:`~.ConvexSpheropolyhedron`,
+            :class:`~.Ellipsoid`, or :class:`~.Sphere`.
+    """
+
+    def __init__(self, shape):
+        self.axes = None
+        self.radius = 0
+        if isinstance(shape, Ellipsoid):
+            self.axes = np.array([shape.a, shape.b, shape.c], dtype=np.float64)
+            self.volume = shape.volume
+            self.surface_area = shape.surface_area
+            self.mean_curvature = shape.mean_curvature
+            return
+        elif isinstance(shape, Sphere):
+            self.radius = shape.radius
+            polyhedron = None
+        elif isinstance(shape, ConvexSpheropolyhedron):
+            self.radius = shape.radius
+            polyhedron = shape.polyhedron
+        elif isinstance(shape, ConvexPolyhedron):
+            polyhedron = shape
+        else:
+            raise TypeError(
+                "Excluded volumes can only be computed for convex polyhedra, "
+                "convex spheropolyhedra, ellipsoids, and spheres."
+            )
+
+        if polyhedron is None:
+            self.vertices = np.zeros((1, 3))
+            self.normals = np.empty((0, 3))
+            self.areas = np.empty(0)
+            self.edges = np.empty((0, 3))
+            self.arc_starts = np.empty((0, 3))
+            self.arc_ends = np.empty((0, 3))
+            self.core_volume = 0
+            self.core_surface_area = 0
+            self.core_mean_curvature = 0
+        else:
+            self.vertices = polyhedron._vertices - polyhedron.center
+            self.normals = polyhedron._equations[:, :3]
+            self.areas = polyhedron.get_face_area()
+            first, second, edges = polyhedron._find_face_intersections()
+            self.edges = self.vertices[edges[:, 1]] - self.vertices[edges[:, 0]]
+            # The outward normals of the faces adjacent to each edge bound an
+            # arc on the Gauss sphere.
+            self.arc_starts = self.normals[first]
+            self.arc_ends = self.normals[second]
+            self.core_volume = polyhedron.volume
+            self.core_surface_area = np.sum(self.areas)
+            self.core_mean_curvature = polyhedron.mean_curvature
+
+        # Rounding by a sphere follows the Steiner formula.
+        r = self.radius
+        self.volume = (
+            self.core_volume
+            + self.core_surface_area * r
+            + 4 * np.pi * self.core_mean_curvature * r ** 2
+            + 4 / 3 * np.pi * r ** 3
+        )
+        self.surface_area = (
+            self.core_surface_area
+            + 8 * np.pi * self.core_mean_curvature * r
+            + 4 * np.pi * r ** 2
+        )
+        self.mean_curvature = self.core_mean_curvature + r
+
+    def support(self, directions):
+        """Evaluate the support function for unit vectors in the body frame."""
+        if self.axes is not None:
+            return np.linalg.norm(directions * self.axes, axis=-1)
+        return np.max(directions @ self.vertices.T, axis=-1) + self.radius
+
+    def surface_measure(self, order):
+        """Discretize the surface area measure of the shape.
+
+        The measure is returned as unit normals and weights such that the
+        integral of a function over the measure is approximated by the
+        weighted sum of its values at the normals. The contribution of the
+        rounding sphere, which is proportional to the uniform measure on the
+        sphere, is not included; instead, its prefactor is returned, since
+        the integral of a support function over the sphere is known exactly.
+
+        Args:
+            order (int):
+                The number of Gauss-Legendre nodes in each dimension.
+
+        Returns:
+            tuple(:math:`(N, 3)` :class:`numpy.ndarray`, :math:`(N, )` :class:`numpy.ndarray`, float):
+                The normals, the weights, and the prefactor of the uniform
+                measure on the sphere.
+        """  # noqa: E501
+        if self.axes is not None:
+            # Parametrize the surface by the unit sphere stretched along the
+            # axes. The normal at the image of a point on the sphere is the
+            # point scaled by the inverse axes, and the area element is
+            # scaled by the length of the point scaled by the cofactors.
+            directions, weights = _sphere_quadrature(order)
+            cofactors = np.prod(self.axes) / self.axes
+            normals = directions / self.axes
+            normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+            weights = weights * np.linalg.norm(directions * cofactors, axis=1)
+            return normals, weights, 0
+
+        if len(self.edges) == 0 or self.radius == 0:
+            return self.normals, self.areas, self.radius ** 2
+
+        # The rounded edges contribute an arc on the Gauss sphere weighted by
+        # the edge length times the rounding radius.
+        nodes, node_weights = np.polynomial.legendre.leggauss(order)
+        cosines = np.clip(np.sum(self.arc_starts * self.arc_ends, axis=1), -1, 1)
+        angles = np.arccos(cosines)
+        perpendicular = self.arc_ends - cosines[:, np.newaxis] * self.arc_starts
+        norms = np.linalg.norm(perpendicular, axis=1, keepdims=True)
+        perpendicular /= np.where(norms > 0, norms, 1)
+        t = np.outer(angles, nodes + 1) / 2
+        arc_normals = (
+            np.cos(t)[..., np.newaxis] * self.arc_starts[:, np.newaxis]
+            + np.sin(t)[..., np.newaxis] * perpendicular[:, np.newaxis]
+        )
+        arc_weights = (
+            self.radius
+            * np.linalg.norm(self.edges, axis=1)[:, np.newaxis]
+            * angles[:, np.newaxis]
+            / 2
+            * node_weights
+        )
+        return (
+            np.concatenate((self.normals, arc_normals.reshape(-1, 3))),
+            np.concatenate((self.areas, arc_weights.ravel())),
+            self.radius ** 2,
+        )
+
+
+def _sphere_quadrature(order):
+    """Get a product Gauss quadrature rule on the unit sphere.
+
+    The rule combines Gauss-Legendre nodes in :math:`z` with equally spaced
+    nodes in the azimuthal angle.
+
+    Args:
+        order (int):
+            The number of Gauss-Legendre nodes.
+
+    Returns:
+        tuple(:math:`(2 N^2, 3)` :class:`numpy.ndarray`, :math:`(2 N^2, )` :class:`numpy.ndarray`):
+            The nodes and weights.
+    """  # noqa: E501
+    z, z_weights = np.polynomial.legendre.leggauss(order)
+    phi = np.pi * np.arange(2 * order) / order
+    z, phi = np.meshgrid(z, phi, indexing="ij")
+    rho = np.sqrt(1 - z ** 2)
+    nodes = np.stack((rho * np.cos(phi), rho * np.sin(phi), z), axis=-1)
+    weights = np.repeat(z_weights * np.pi / order, 2 * order)
+    return nodes.reshape(-1, 3), weights
+
+
+def _polyhedral_excluded_volumes(first, second, transforms):
+    """Compute exact excluded volumes of rounded polyhedra.
+
+    The excluded volume is the volume of the Minkowski sum :math:`P` of the
+    underlying polyhedra rounded by the sum of the rounding radii, which
+    follows from the volume, surface area, and mean curvature of :math:`P`
+    via the Steiner formula. The volume of :math:`P` follows from the mixed
+    volumes of the polyhedra, its surface area consists of the faces of the
+    polyhedra and a parallelogram for each pair of edges whose arcs on the
+    Gauss sphere cross, and its mean curvature is the sum of those of the
+    polyhedra.
+
+    Args:
+        first (:class:`_ConvexBody`):
+            The fixed shape.
+        second (:class:`_ConvexBody`):
+            The transformed shape.
+        transforms (:math:`(N, 3, 3)` :class:`numpy.ndarray`):
+            The orthogonal transformations applied to the second shape.
+
+    Returns:
+        :math:`(N, )` :class:`numpy.ndarray`: The excluded volumes.
+    """
+    vertices = np.einsum("nij,vj->nvi", transforms, second.vertices)
+    normals = np.einsum("nij,fj->nfi", transforms, second.normals)
+    edges = np.einsum("nij,ej->nei", transforms, second.edges)
+    tie_breaking = transforms @ _TIE_BREAKING_ROTATION
+    arc_starts = np.einsum("nij,ej->nei", tie_breaking, second.arc_starts)
+    arc_ends = np.einsum("nij,ej->nei", tie_breaking, second.arc_ends)
+
+    # The mixed volumes are integrals of each support function over the
+    # faces of the other polyhedron.
+    volume = first.core_volume + second.core_volume
+    if len(first.normals):
+        support = np.max(np.einsum("fi,nvi->nfv", first.normals, vertices), axis=-1)
+        volume = volume + support @ first.areas
+    if len(second.normals):
+        support = np.max(np.einsum("nfi,vi->nfv", normals, first.vertices), axis=-1)
+        volume = volume + support @ second.areas
+
+    # The faces of the sum spanned by pairs of edges are parallelograms.
+    area = first.core_surface_area + second.core_surface_area
+    if len(first.edges) and len(second.edges):
+        crossing = _arc_crossings(
+            first.arc_starts, first.arc_ends, arc_starts, arc_ends
+        )
+        parallelograms = np.linalg.norm(
+            np.cross(first.edges[np.newaxis, :, np.newaxis], edges[:, np.newaxis]),
+            axis=-1,
+        )
+        area = area + np.sum((crossing != 0) * parallelograms, axis=(1, 2))
+
+    mean_curvature = (
+        4 * np.pi * (first.core_mean_curvature + second.core_mean_curvature)
+    )
+    radius = first.radius + second.radius
+    return (
+        volume
+        + area * radius
+        + mean_curvature * radius ** 2
+        + 4 / 3 * np.pi * radius ** 3
+    )
+
+
+def _quadrature_excluded_volumes(
+    first, second, transforms, first_measure, second_measure
+):
+    """Compute excluded volumes by integrating over surface area measures.
+
+    Args:
+        first (:class:`_ConvexBody`):
+            The fixed shape.
+        second (:class:`_ConvexBody`):
+            The transformed shape.
+        transforms (:math:`(N, 3, 3)` :class:`numpy.ndarray`):
+            The orthogonal transformations applied to the second shape.
+        first_measure (tuple):
+            The discretized surface area measure of the first shape.
+        second_measure (tuple):
+            The discretized surface area measure of the second shape.
+
+    Returns:
+        :math:`(N, )` :class:`numpy.ndarray`: The excluded volumes.
+    """
+    # The support function of the transformed shape at u is the support
+    # function of the original shape at the inverse transform of u.
+    normals, weights, sphere_weight = first_measure
+    support = second.support(np.einsum("nji,mj->nmi", transforms, normals))
+    first_integral = support @ weights + sphere_weight * 4 * np.pi * (
+        second.mean_curvature
+    )
+
+    normals, weights, sphere_weight = second_measure
+    support = first.support(np.einsum("nij,mj->nmi", transforms, normals))
+    second_integral = support @ weights + sphere_weight * 4 * np.pi * (
+        first.mean_curvature
+    )
+    return first.volume + second.volume + first_integral + second_integral
+
+
+def excluded_volume(shape, other=None, orientations=None, quadrature_order=32):
+    r"""Compute the excluded volume of two convex shapes.
+
+    Without orientations, the excluded volume is averaged uniformly over all
+    relative orientations of the shapes, which gives
+    :math:`V_K + V_L + R_K S_L + R_L S_K` in terms of the volumes :math:`V`,
+    surface areas :math:`S`, and mean curvatures :math:`R` of the shapes
+    :math:`K` and :math:`L` (see :attr:`.ConvexPolyhedron.mean_curvature`).
+    For identical shapes, this is :math:`2V + 2RS`.
+
+    Otherwise, the excluded volume is computed for each of the given
+    orientations of ``other`` relative to ``shape``. The result is exact
+    (up to floating point errors) for convex polyhedra, convex
+    spheropolyhedra, and spheres. If either shape is an ellipsoid, integrals
+    over the surface of the ellipsoid and the rounded edges of the other
+    shape are evaluated by Gaussian quadrature, which converges rapidly with
+    ``quadrature_order`` unless the ellipsoid is paired with a polyhedron.
+
+    The positions of the shapes do not affect their excluded volume.
+
+    Args:
+        shape (:class:`~.Shape3D`):
+            A :class:`~.ConvexPolyhedron`, :class:`~.ConvexSpheropolyhedron`,
+            :class:`~.Ellipsoid`, or :class:`~.Sphere`.
+        other (:class:`~.Shape3D`, optional):
+            The second shape, which must be of one of the same types. If
+            None, the excluded volume of ``shape`` with itself is computed
+            (Default value: None).
+        orientations (:math:`(N, 4)` :class:`numpy.ndarray`, optional):
+            Quaternions of the orientations of ``other`` relative to
+            ``shape``. If None, the orientationally averaged excluded volume
+            is computed (Default value: None).
+        quadrature_order (int):
+            The number of Gauss-Legendre nodes per dimension used by the
+            quadrature rules for ellipsoids (Default value: 32).
+
+    Returns:
+        float or :math:`(N, )` :class:`numpy.ndarray`:
+            The orientationally averaged excluded volume, or the excluded
+            volume at each orientation.
+
+    Example:
+        >>> sphere = coxeter.shapes.Sphere(1.0)
+        >>> volume = coxeter.shapes.excluded_volume(sphere)
+        >>> assert np.isclose(volume, 8 * sphere.volume)
+        >>> cube = coxeter.shapes.ConvexPolyhedron(
+        ...   [[1, 1, 1], [1, -1, 1], [1, 1, -1], [1, -1, -1],
+        ...    [-1, 1, 1], [-1, -1, 1], [-1, 1, -1], [-1, -1, -1]])
+        >>> coxeter.shapes.excluded_volume(cube, orientations=[[1, 0, 0, 0]])
+        array([64.])
+
+    """
+    if other is None:
+        other = shape
+    first, second = _ConvexBody(shape), _ConvexBody(other)
+    if orientations is None:
+        return (
+            first.volume
+            + second.volume
+            + first.mean_curvature * second.surface_area
+            + second.mean_curvature * first.surface_area
+        )
+
+    # The excluded volume is the volume of the sum of the first shape and
+    # the rotated second shape reflected through its center.
+    transforms = -rowan.to_matrix(np.asarray(orientations, dtype=np.float64))
+    if first.axes is None and second.axes is None:
+        sizes = (
+            len(first.normals) * len(second.vertices),
+            len(second.normals) * len(first.vertices),
+            len(first.edges) * len(second.edges),
+        )
+
+        def compute(block):
+            return _polyhedral_excluded_volumes(first, second, block)
+
+    else:
+        first_measure = first.surface_measure(quadrature_order)
+        second_measure = second.surface_measure(quadrature_order)
+        # Evaluating the support function of an ellipsoid requires the same
+        # temporary storage as a polyhedron with three vertices.
+        sizes = (
+            len(first_measure[0])
+            * (3 if second.axes is not None else len(second.vertices)),
+            len(second_measure[0])
+            * (3 if first.axes is not None else len(first.vertices)),
+        )
+
+        def compute(block):
+            return _quadrature_excluded_volumes(
+                first, second, block, first_measure, second_measure
+            )
+
+    block_size = max(1, _MAX_ELEMENTS_PER_BLOCK // max(*sizes, 1))
+    result = np.empty(len(transforms))
+    for start in range(0, len(transforms), block_size):
+        result[start : start + block_size] = compute(
+            transforms[start : start + block_size]
+        )
+    return result
+
+
+def second_virial_coefficient(shape, other=None):
+    r"""Compute the second virial coefficient of hard convex shapes.
+
+    The second virial coefficient :math:`B_2` is half of the orientationally
+    averaged excluded volume, i.e. :math:`V + RS` for a single component
+    fluid :cite:`Irrgang2017`. For two different shapes, this is the cross
+    coefficient :math:`B_{2, KL}` of a binary mixture.
+
+    Args:
+        shape (:class:`~.Shape3D`):
+            A :class:`~.ConvexPolyhedron`, :class:`~.ConvexSpheropolyhedron`,
+            :class:`~.Ellipsoid`, or :class:`~.Sphere`.
+        other (:class:`~.Shape3D`, optional):
+            The second shape. If None, the coefficient of ``shape`` with
+            itself is computed (Default value: None).
+
+    Returns:
+        float: The second virial coefficient.
+
+    Example:
+        >>> sphere = coxeter.shapes.Sphere(1.0)
+        >>> b2 = coxeter.shapes.second_virial_coefficient(sphere)
+        >>> assert np.isclose(b2, 4 * sphere.volume)
+
+    """
+    return excluded_volume(shape, other) / 2
+
+
+def sample_excluded_volume(shape, other=None, n=1000, rng=None, quadrature_order=32):
+    """Estimate the orientationally averaged excluded volume by sampling.
+
+    The excluded volume is computed at uniformly distributed random
+    orientations using :func:`excluded_volume`, which provides a Monte Carlo
+    check of the closed form average.
+
+    Args:
+        shape (:class:`~.Shape3D`):
+            A :class:`~.ConvexPolyhedron`, :class:`~.ConvexSpheropolyhedron`,
+            :class:`~.Ellipsoid`, or :class:`~.Sphere`.
+        other (:class:`~.Shape3D`, optional):
+            The second shape. If None, ``shape`` is used (Default value:
+            None).
+        n (int):
+            The number of orientations to sample (Default value: 1000).
+        rng (:class:`numpy.random.Generator`, int, or None):
+            The random number generator, or a seed used to create one with
+            :func:`numpy.random.default_rng` (Default value: None).
+        quadrature_order (int):
+            The number of Gauss-Legendre nodes per dimension used by the
+            quadrature rules for ellipsoids (Default value: 32).
+
+    Returns:
+        tuple(float, float):
+            The mean excluded volume over the sampled orientations and its
+            standard error.
+    """
+    # Uniformly distributed unit quaternions give uniformly distributed
+    # rotations.
+    orientations = _sample_directions(n, np.random.default_rng(rng), dimensions=4)
+    volumes = excluded_volume(shape, other, orientations, quadrature_order)
+    return np.mean(volumes), np.std(volumes, ddof=1) / np.sqrt(n)
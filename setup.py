@@ -48,7 +48,7 @@ setup(
     author_email="vramasub@umich.edu",
     packages=find_packages(),
     package_data={"coxeter": DATA},
-    install_requires=["numpy", "rowan>=1.2", "scipy"],
+    install_requires=["numpy", "rowan>=1.2", "scipy>=1.8"],
     tests_require=test_deps,
     extras_require=extras,
     zip_safe=False,
@@ -45,6 +45,14 @@ def make_sphero_cube(radius=0):
     return ConvexSpheropolyhedron(get_cube_points(), radius)
 
 
+@pytest.fixture(autouse=True, scope="session")
+def binary_cache_dir(tmp_path_factory):
+    """Keep binary caches of shape families out of the user's cache directory."""
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("COXETER_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+        yield
+
+
 @pytest.fixture
 def cube_points():
     return get_cube_points()
@@ -109,3 +109,17 @@ def test_invalid_radius_setter():
     circle = Circle(1)
     with pytest.raises(ValueError):
         circle.radius = -1
+
+
+def test_sample():
+    circle = Circle(2, center=(1, 2, 3))
+    points = circle.sample_volume(100000, rng=0)
+    assert points.shape == (100000, 3)
+    assert np.allclose(points[:, 2], 3)
+    distances = np.linalg.norm(points - circle.center, axis=1)
+    assert np.all(distances <= 2)
+    assert np.mean(distances < 1) == approx(1 / 4, abs=0.01)
+
+    points = circle.sample_surface(100000, rng=0)
+    assert np.allclose(np.linalg.norm(points - circle.center, axis=1), 2)
+    assert np.allclose(np.mean(points, axis=0), circle.center, atol=0.02)
@@ -0,0 +1,190 @@
+import numpy as np
+import pytest
+import rowan
+from hypothesis import given, settings
+from hypothesis.strategies import floats, integers
+from scipy.optimize import linprog
+from scipy.spatial import ConvexHull, HalfspaceIntersection
+
+from coxeter.families import PlatonicFamily
+from coxeter.shapes import (
+    ConvexPolyhedron,
+    Polyhedron,
+    clip_polyhedron,
+    intersect_polyhedra,
+)
+
+
+def intersect_halfspaces(equations, size=0):
+    """Get the volume and surface area of an intersection of half-spaces.
+
+    Like the clipping, intersections with a volume of at most
+    :math:`10^{-10} L^3` for a shape of extent :math:`L` are empty.
+    """
+    equations = np.asarray(equations, dtype=np.float64)
+    norms = np.linalg.norm(equations[:, :3], axis=1)
+    # Find the center of the largest inscribed sphere.
+    result = linprog(
+        [0, 0, 0, -1],
+        A_ub=np.column_stack((equations[:, :3], norms)),
+        b_ub=-equations[:, 3],
+        bounds=[(None, None)] * 3 + [(0, None)],
+    )
+    if result.status != 0 or result.x[3] < 1e-9:
+        return 0, 0
+    hull = ConvexHull(HalfspaceIntersection(equations, result.x[:3]).intersections)
+    if hull.volume <= 1e-10 * size ** 3:
+        return 0, 0
+    return hull.volume, hull.area
+
+
+@settings(deadline=1000)
+@given(integers(0, 2 ** 31), integers(1, 5))
+def test_clip(seed, num_planes):
+    rng = np.random.default_rng(seed)
+    shape = ConvexPolyhedron(rng.normal(size=(20, 3)))
+    planes = np.column_stack(
+        (rng.normal(size=(num_planes, 3)), 0.5 * rng.normal(size=num_planes))
+    )
+    volume, area = intersect_halfspaces(
+        np.concatenate((shape._equations, planes)), np.ptp(shape.vertices, axis=0).max()
+    )
+
+    clipped = clip_polyhedron(shape, planes)
+    if clipped is None:
+        assert volume == 0
+    else:
+        assert np.isclose(clipped.volume, volume)
+        assert np.isclose(clipped.surface_area, area)
+    assert np.allclose(
+        clip_polyhedron(shape, planes, return_shapes=False), (volume, area)
+    )
+
+
+@settings(deadline=1000)
+@given(integers(0, 2 ** 31))
+def test_clip_batch(seed):
+    rng = np.random.default_rng(seed)
+    shape = ConvexPolyhedron(rng.normal(size=(20, 3)))
+    planes = np.concatenate(
+        (rng.normal(size=(6, 2, 3)), 0.5 * rng.normal(size=(6, 2, 1))), axis=-1
+    )
+    size = np.ptp(shape.vertices, axis=0).max()
+    expected = np.array(
+        [
+            intersect_halfspaces(np.concatenate((shape._equations, equations)), size)
+            for equations in planes
+        ]
+    )
+    volumes, areas = clip_polyhedron(shape, planes, return_shapes=False)
+    assert np.allclose(volumes, expected[:, 0])
+    assert np.allclose(areas, expected[:, 1])
+
+    shapes = clip_polyhedron(shape, planes)
+    assert len(shapes) == len(planes)
+    for clipped, volume in zip(shapes, expected[:, 0]):
+        assert np.isclose(0 if clipped is None else clipped.volume, volume)
+
+
+@given(floats(-1, 1))
+def test_slab_heights(height):
+    """Clipping a cube at a height leaves a box."""
+    cube = PlatonicFamily.get_shape("Cube")
+    volume, area = clip_polyhedron(cube, [0, 0, 2, -2 * height], return_shapes=False)
+    box_height = np.clip(height + 0.5, 0, 1)
+    if box_height < 1e-9:
+        assert volume == area == 0
+    else:
+        assert np.isclose(volume, box_height)
+        assert np.isclose(area, 2 + 4 * box_height)
+
+
+@pytest.mark.parametrize(
+    "plane, volume",
+    [
+        ([0, 0, 1, -0.5], 1),
+        ([0, 0, -1, -0.5], 1),
+        ([0, 0, 1, 0.5], 0),
+        ([1, 1, 0, 0], 0.5),
+        ([1, 1, 1, 0], 0.5),
+    ],
+)
+def test_degenerate_planes(plane, volume):
+    """Test planes containing faces, edges, or vertices of the shape."""
+    cube = PlatonicFamily.get_shape("Cube")
+    clipped = clip_polyhedron(cube, plane)
+    if volume == 0:
+        assert clipped is None
+    else:
+        assert np.isclose(clipped.volume, volume)
+        assert np.isclose(
+            clipped.surface_area,
+            intersect_halfspaces(np.concatenate((cube._equations, [plane])))[1],
+        )
+
+
+@settings(deadline=1000)
+@given(integers(0, 2 ** 31), integers(4, 20))
+def test_intersect(seed, num_vertices):
+    rng = np.random.default_rng(seed)
+    first = ConvexPolyhedron(rng.normal(size=(12, 3)))
+    second = ConvexPolyhedron(rng.normal(size=(num_vertices, 3)))
+    orientations = rowan.normalize(rng.normal(size=(4, 4)))
+    positions = 0.7 * rng.normal(size=(4, 3))
+
+    expected = []
+    for orientation, position in zip(orientations, positions):
+        transformed = ConvexPolyhedron(
+            rowan.rotate(orientation, second.vertices) + position
+        )
+        expected.append(
+            intersect_halfspaces(
+                np.concatenate((first._equations, transformed._equations))
+            )
+        )
+    expected = np.array(expected)
+
+    volumes, areas = intersect_polyhedra(
+        first, second, orientations, positions, return_shapes=False
+    )
+    assert np.allclose(volumes, expected[:, 0])
+    assert np.allclose(areas, expected[:, 1])
+
+    shapes = intersect_polyhedra(first, second, orientations, positions)
+    for shape, volume in zip(shapes, expected[:, 0]):
+        assert np.isclose(0 if shape is None else shape.volume, volume)
+
+
+def test_intersect_cubes():
+    cube = PlatonicFamily.get_shape("Cube")
+    shape = intersect_polyhedra(cube, cube)
+    assert np.isclose(shape.volume, 1)
+    assert shape.num_faces == 6
+
+    positions = [[0, 0, 0], [0.5, 0, 0], [0.5, 0.5, 0.5], [1, 0, 0], [2, 0, 0]]
+    volumes, areas = intersect_polyhedra(
+        cube, cube, positions=positions, return_shapes=False
+    )
+    assert np.allclose(volumes, [1, 0.5, 0.125, 0, 0])
+    assert np.allclose(areas, [6, 4, 1.5, 0, 0])
+
+    # A single orientation is broadcast against all positions.
+    volumes, _ = intersect_polyhedra(
+        cube,
+        cube,
+        orientations=[rowan.from_axis_angle([0, 0, 1], np.pi / 4)],
+        positions=positions,
+        return_shapes=False,
+    )
+    assert len(volumes) == len(positions)
+    assert np.isclose(volumes[0], 2 * (np.sqrt(2) - 1))
+
+
+def test_invalid_arguments():
+    cube = PlatonicFamily.get_shape("Cube")
+    with pytest.raises(TypeError):
+        clip_polyhedron(Polyhedron(cube.vertices, cube.faces), [0, 0, 1, 0])
+    with pytest.raises(TypeError):
+        intersect_polyhedra(cube, Polyhedron(cube.vertices, cube.faces))
+    with pytest.raises(ValueError):
+        clip_polyhedron(cube, [0, 0, 1])
@@ -0,0 +1,281 @@
+import numpy as np
+import pytest
+import rowan
+from hypothesis import given, settings
+from hypothesis.strategies import floats, integers
+from scipy.spatial import ConvexHull
+from scipy.special import eval_legendre
+
+from coxeter.families import PlatonicFamily
+from coxeter.shapes import (
+    ConvexPolygon,
+    ConvexPolyhedron,
+    Polygon,
+    Polyhedron,
+    find_duplicate_shapes,
+    hausdorff_distance,
+    nearest_shapes,
+    shape_descriptors,
+)
+
+
+def random_polygon(rng, num_vertices=8):
+    points = rng.normal(size=(num_vertices, 2))
+    return ConvexPolygon(points[ConvexHull(points).vertices])
+
+
+def support_function_distance(first, second, num_directions=200000, seed=0):
+    """Get a lower bound of the Hausdorff distance of two convex shapes.
+
+    The Hausdorff distance between convex bodies is the largest difference
+    of their support functions.
+    """
+    directions = np.random.default_rng(seed).normal(size=(num_directions, 3))
+    directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+    return np.max(
+        np.abs(
+            np.max(directions @ first.T, axis=1) - np.max(directions @ second.T, axis=1)
+        )
+    )
+
+
+@settings(deadline=500)
+@given(integers(0, 2 ** 31), floats(0.1, 10))
+def test_polyhedron_invariance(seed, scale):
+    rng = np.random.default_rng(seed)
+    shape = ConvexPolyhedron(rng.normal(size=(20, 3)))
+    orientation = rowan.normalize(rng.normal(size=4))
+    transformed = ConvexPolyhedron(
+        scale * rowan.rotate(orientation, shape.vertices) + rng.normal(size=3)
+    )
+    mirrored = ConvexPolyhedron(shape.vertices * [1, 1, -1])
+
+    descriptor = shape.get_descriptor()
+    assert descriptor.shape == (12,)
+    assert np.allclose(transformed.get_descriptor(), descriptor)
+    assert np.allclose(mirrored.get_descriptor(), descriptor)
+
+
+@settings(deadline=500)
+@given(integers(0, 2 ** 31), integers(2, 12))
+def test_polyhedron_spectrum(seed, degree):
+    """The spectra agree with the addition theorem of spherical harmonics."""
+    shape = ConvexPolyhedron(np.random.default_rng(seed).normal(size=(15, 3)))
+    areas = shape.get_face_area()
+    normals = shape.normals / np.linalg.norm(shape.normals, axis=1, keepdims=True)
+    cosines = np.clip(normals @ normals.T, -1, 1)
+    expected = [
+        np.sqrt(max(areas @ eval_legendre(l, cosines) @ areas, 0)) / np.sum(areas)
+        for l in range(2, degree + 1)  # noqa: E741
+    ]
+
+    descriptor = shape.get_descriptor(degree)
+    assert np.allclose(descriptor[3:], expected)
+    assert np.allclose(
+        descriptor[:3],
+        np.linalg.eigvalsh(shape.inertia_tensor - _centroid_shift(shape))
+        / shape.volume ** (5 / 3),
+    )
+
+
+def _centroid_shift(shape):
+    """Get the inertia tensor of a point mass at the centroid."""
+    centroid = shape.centroid
+    return shape.volume * (
+        np.dot(centroid, centroid) * np.eye(3) - np.outer(centroid, centroid)
+    )
+
+
+def test_platonic_solids():
+    cube = PlatonicFamily.get_shape("Cube")
+    assert np.allclose(
+        cube.get_descriptor(4), [1 / 6, 1 / 6, 1 / 6, 0, 0, np.sqrt(21) / 6]
+    )
+
+    # All Platonic solids are distinguished, even though their inertia
+    # tensors are all isotropic.
+    shapes = [PlatonicFamily.get_shape(name) for name in PlatonicFamily.data]
+    descriptors = shape_descriptors(shapes)
+    assert len(find_duplicate_shapes(descriptors, 1e-3)) == 0
+
+    # Faces of any size and orientation give the same descriptors.
+    triangulated = Polyhedron(
+        cube.vertices,
+        [face[[0, i, i + 1]] for face in cube.faces for i in range(1, len(face) - 1)],
+    )
+    reversed_faces = Polyhedron(cube.vertices, [face[::-1] for face in cube.faces])
+    assert triangulated.num_faces == 12
+    assert np.allclose(triangulated.get_descriptor(), cube.get_descriptor())
+    assert np.allclose(reversed_faces.get_descriptor(), cube.get_descriptor())
+
+
+def test_nonconvex_faces():
+    """The descriptor does not depend on the first vertex of a nonconvex face."""
+    ring = np.array(
+        [[0, 0], [3, 0], [3, 3], [2, 3], [2, 1], [1, 1], [1, 3], [0, 3]], dtype=float
+    )
+    vertices = np.concatenate(
+        [np.column_stack((ring, np.full(len(ring), z))) for z in (0, 1.5)]
+    )
+    sides = [[i, (i + 1) % 8, (i + 1) % 8 + 8, i + 8] for i in range(8)]
+    bottom, top = np.arange(7, -1, -1), np.arange(8, 16)
+
+    descriptors = []
+    for shift in range(8):
+        shape = Polyhedron(
+            vertices, [np.roll(bottom, shift), np.roll(top, shift)] + sides
+        )
+        assert np.isclose(shape.surface_area, 38)
+        descriptors.append(shape.get_descriptor())
+    assert np.allclose(descriptors, descriptors[0])
+    assert np.allclose(shape_descriptors([shape]), descriptors[-1])
+
+
+@settings(deadline=500)
+@given(integers(0, 2 ** 31), floats(0.1, 10))
+def test_polygon_invariance(seed, scale):
+    rng = np.random.default_rng(seed)
+    polygon = random_polygon(rng)
+    orientation = rowan.normalize(rng.normal(size=4))
+    transformed = Polygon(
+        scale * rowan.rotate(orientation, polygon.vertices)[::-1] + rng.normal(size=3)
+    )
+    mirrored = Polygon(polygon.vertices * [1, -1, 1])
+
+    descriptor = polygon.get_descriptor()
+    assert descriptor.shape == (11,)
+    assert np.allclose(transformed.get_descriptor(), descriptor)
+    assert np.allclose(mirrored.get_descriptor(), descriptor)
+
+
+def test_regular_polygons():
+    """Only multiples of the number of edges appear in the Fourier spectrum."""
+    for num_vertices in range(3, 8):
+        angles = np.linspace(0, 2 * np.pi, num_vertices, endpoint=False)
+        polygon = ConvexPolygon(np.column_stack((np.cos(angles), np.sin(angles))))
+        descriptor = polygon.get_descriptor(12)
+        frequencies = np.arange(2, 13)
+        assert np.allclose(descriptor[2:], frequencies % num_vertices == 0)
+        assert np.isclose(descriptor[0], descriptor[1])
+
+
+@settings(deadline=1000)
+@given(integers(0, 2 ** 31))
+def test_batch(seed):
+    rng = np.random.default_rng(seed)
+    polyhedra = [
+        ConvexPolyhedron(rng.normal(size=(rng.integers(5, 20), 3))) for _ in range(10)
+    ]
+    assert np.allclose(
+        shape_descriptors(polyhedra, 6),
+        [shape.get_descriptor(6) for shape in polyhedra],
+    )
+    polygons = [random_polygon(rng, rng.integers(3, 10)) for _ in range(10)]
+    assert np.allclose(
+        shape_descriptors(polygons, 6),
+        [shape.get_descriptor(6) for shape in polygons],
+    )
+
+
+def test_search():
+    rng = np.random.default_rng(0)
+    shapes = [ConvexPolyhedron(rng.normal(size=(12, 3))) for _ in range(20)]
+    # Add a rotated, translated, and scaled copy of every other shape.
+    copies = [
+        ConvexPolyhedron(
+            2 * rowan.rotate(rowan.normalize(rng.normal(size=4)), shape.vertices) + 1
+        )
+        for shape in shapes[::2]
+    ]
+    descriptors = shape_descriptors(shapes + copies)
+
+    duplicates = find_duplicate_shapes(descriptors)
+    expected = np.column_stack((np.arange(0, 20, 2), np.arange(20, 30)))
+    assert np.array_equal(duplicates, expected)
+
+    distances, indices = nearest_shapes(descriptors, k=2)
+    assert distances.shape == indices.shape == (30, 2)
+    assert np.all(indices != np.arange(30)[:, np.newaxis])
+    assert np.all(np.diff(distances, axis=1) >= 0)
+    assert np.array_equal(indices[20:, 0], np.arange(0, 20, 2))
+    assert np.array_equal(indices[:20:2, 0], np.arange(20, 30))
+
+    distances, indices = nearest_shapes(descriptors[:20], descriptors[20:], k=3)
+    assert indices.shape == (10, 3)
+    assert np.array_equal(indices[:, 0], np.arange(0, 20, 2))
+    assert np.allclose(distances[:, 0], 0)
+
+
+@settings(deadline=1000)
+@given(integers(0, 2 ** 31))
+def test_hausdorff_distance(seed):
+    rng = np.random.default_rng(seed)
+    first = ConvexPolyhedron(rng.normal(size=(12, 3)))
+    second = ConvexPolyhedron(rng.normal(size=(8, 3)) + 0.5 * rng.normal(size=3))
+    orientations = rowan.normalize(rng.normal(size=(3, 4)))
+
+    distances = hausdorff_distance(first, second, orientations)
+    assert distances.shape == (3,)
+    for distance, orientation in zip(distances, orientations):
+        bound = support_function_distance(
+            first.vertices, rowan.rotate(orientation, second.vertices)
+        )
+        assert bound <= distance + 1e-12
+        assert np.isclose(bound, distance, rtol=1e-2)
+
+    assert np.isclose(hausdorff_distance(first, first), 0)
+    # Swapping the shapes inverts their relative orientation.
+    assert np.isclose(
+        hausdorff_distance(second, first, rowan.conjugate(orientations[:1]))[0],
+        distances[0],
+    )
+
+
+def test_hausdorff_distance_known():
+    cube = PlatonicFamily.get_shape("Cube")
+    assert np.isclose(hausdorff_distance(cube, cube), 0)
+    assert np.isclose(
+        hausdorff_distance(cube, cube, [rowan.from_axis_angle([0, 0, 1], np.pi / 2)]),
+        0,
+    )
+    large_cube = ConvexPolyhedron(2 * cube.vertices)
+    assert np.isclose(hausdorff_distance(cube, large_cube), np.sqrt(3) / 2)
+    assert np.isclose(hausdorff_distance(large_cube, cube), np.sqrt(3) / 2)
+
+    # The distance of a vertex of the rotated square from the closest edge
+    # is attained in the interior of the edge.
+    square = ConvexPolygon([[-0.5, -0.5], [0.5, -0.5], [0.5, 0.5], [-0.5, 0.5]])
+    distance = hausdorff_distance(
+        square, square, [rowan.from_axis_angle([0, 0, 1], np.pi / 4)]
+    )
+    assert np.isclose(distance, np.sqrt(2) / 2 - 0.5)
+
+    # The vertices of the triangle are closest to the interior of the square,
+    # while the corners of the square are farthest from the triangle.
+    triangle = ConvexPolygon([[0, 0, 1], [0.1, 0, 1], [0, 0.1, 1]])
+    assert np.isclose(hausdorff_distance(square, triangle), np.sqrt(1.5))
+
+
+def test_hausdorff_distance_polygons():
+    rng = np.random.default_rng(1)
+    for _ in range(5):
+        first = random_polygon(rng)
+        second = random_polygon(rng, 5)
+        assert np.isclose(
+            hausdorff_distance(first, second),
+            support_function_distance(first.vertices, second.vertices),
+            rtol=1e-3,
+        )
+
+
+def test_invalid_arguments():
+    cube = PlatonicFamily.get_shape("Cube")
+    square = ConvexPolygon([[0, 0], [1, 0], [1, 1], [0, 1]])
+    with pytest.raises(TypeError):
+        shape_descriptors([cube, square])
+    with pytest.raises(ValueError):
+        cube.get_descriptor(1)
+    with pytest.raises(TypeError):
+        hausdorff_distance(cube, Polyhedron(cube.vertices, cube.faces))
+    with pytest.raises(TypeError):
+        hausdorff_distance(cube, square)
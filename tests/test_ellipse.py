@@ -126,3 +126,20 @@ def test_center():
     center = (1, 1, 1)
     ellipse.center = center
     assert all(ellipse.center == center)
+
+
+def test_sample():
+    ellipse = Ellipse(1, 3, center=(1, 2, 0))
+    points = ellipse.sample_volume(100000, rng=0) - ellipse.center
+    assert np.all((points[:, 0] / 1) ** 2 + (points[:, 1] / 3) ** 2 <= 1)
+    # The fraction of the area with |y| > b / 2.
+    expected = 1 - 2 * (np.sqrt(3) / 4 + np.pi / 6) / np.pi
+    assert np.mean(np.abs(points[:, 1]) > 1.5) == approx(expected, abs=0.01)
+
+    points = ellipse.sample_surface(100000, rng=0) - ellipse.center
+    assert np.allclose((points[:, 0] / 1) ** 2 + (points[:, 1] / 3) ** 2, 1)
+    # Compare to the mean of |x| over the arc length of the ellipse.
+    t = np.linspace(0, 2 * np.pi, 100001)[:-1]
+    speeds = np.hypot(np.sin(t), 3 * np.cos(t))
+    expected = np.sum(np.abs(np.cos(t)) * speeds) / np.sum(speeds)
+    assert np.mean(np.abs(points[:, 0])) == approx(expected, abs=0.01)
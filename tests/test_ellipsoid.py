@@ -163,3 +163,48 @@ def test_center():
     center = (1, 1, 1)
     ellipsoid.center = center
     assert all(ellipsoid.center == center)
+
+
+def test_sample():
+    ellipsoid = Ellipsoid(1, 2, 3, center=(1, 2, 3))
+    points = ellipsoid.sample_volume(100000, rng=0)
+    assert np.all(ellipsoid.is_inside(points))
+    assert np.allclose(np.mean(points, axis=0), ellipsoid.center, atol=0.03)
+    # The fraction of the volume with |z| > c / 2.
+    assert np.mean(np.abs(points[:, 2] - 3) > 1.5) == approx(5 / 16, abs=0.01)
+
+    points = ellipsoid.sample_surface(100000, rng=0) - ellipsoid.center
+    assert np.allclose(np.sum((points / [1, 2, 3]) ** 2, axis=1), 1)
+    # Compare to the mean of |z| over the surface, integrated numerically
+    # using the area element of the parametrized surface.
+    theta, phi = np.meshgrid(
+        np.linspace(0, np.pi, 1001)[1:-1:2], np.linspace(0, 2 * np.pi, 1001)[:-1]
+    )
+    directions = np.stack(
+        (np.sin(theta) * np.cos(phi), np.sin(theta) * np.sin(phi), np.cos(theta))
+    )
+    areas = np.sin(theta) * np.linalg.norm(
+        directions * np.array([6, 3, 2])[:, np.newaxis, np.newaxis], axis=0
+    )
+    expected = np.sum(np.abs(3 * directions[2]) * areas) / np.sum(areas)
+    assert np.mean(np.abs(points[:, 2])) == approx(expected, abs=0.02)
+
+
+@given(floats(0.1, 10), floats(0.1, 10), floats(0.1, 10))
+def test_mean_curvature(a, b, c):
+    ellipsoid = Ellipsoid(a, b, c)
+    # The normalized mean curvature is the mean of the support function over
+    # all directions.
+    theta, phi = np.meshgrid(
+        np.linspace(0, np.pi, 1001)[1:-1:2], np.linspace(0, 2 * np.pi, 1001)[:-1]
+    )
+    directions = np.stack(
+        (np.sin(theta) * np.cos(phi), np.sin(theta) * np.sin(phi), np.cos(theta))
+    )
+    support = np.linalg.norm(
+        directions * np.array([a, b, c])[:, np.newaxis, np.newaxis], axis=0
+    )
+    expected = np.sum(support * np.sin(theta)) / np.sum(np.sin(theta))
+    assert ellipsoid.mean_curvature == approx(expected, rel=1e-4)
+
+    assert Ellipsoid(a, a, a).mean_curvature == approx(a)
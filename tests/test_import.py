@@ -0,0 +1,58 @@
+import subprocess
+import sys
+
+import pytest
+
+# Modules that are expensive to import and must only be loaded on demand.
+HEAVY_MODULES = [
+    "numpy",
+    "rowan",
+    "scipy",
+    "scipy.sparse.csgraph",
+    "scipy.spatial",
+    "scipy.special",
+]
+
+
+def run_python(code):
+    """Run code in a fresh interpreter and return its output."""
+    return subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+
+
+def test_import_is_lazy():
+    output = run_python(
+        "import sys, coxeter; "
+        "print(*sorted(m for m in {} if m in sys.modules))".format(HEAVY_MODULES)
+    )
+    assert output.split() == []
+
+
+@pytest.mark.parametrize(
+    "name, unused_modules",
+    [
+        ("shapes.Sphere", ["rowan", "scipy"]),
+        ("shapes.Ellipsoid", ["rowan", "scipy.spatial"]),
+        ("families", []),
+        ("from_gsd_type_shapes", []),
+    ],
+)
+def test_lazy_attributes(name, unused_modules):
+    output = run_python(
+        "import sys, coxeter; "
+        "print(coxeter.{}.__name__); "
+        "print(*sorted(m for m in {} if m in sys.modules))".format(name, unused_modules)
+    )
+    lines = output.split("\n")
+    assert lines[0] == name.split(".")[-1] or lines[0] == "coxeter." + name
+    assert lines[1].split() == []
+
+
+def test_platonic_family_is_lazy():
+    output = run_python(
+        "import coxeter.families; "
+        "print('PlatonicFamily' in vars(coxeter.families.common)); "
+        "print(coxeter.families.PlatonicFamily.get_shape('Cube').num_vertices)"
+    )
+    assert output.split() == ["False", "8"]
@@ -0,0 +1,154 @@
+import io
+
+import numpy as np
+import pytest
+
+from coxeter.families import PlatonicFamily, RegularNGonFamily
+from coxeter.io import (
+    load_shapes,
+    read_ndjson,
+    read_packed,
+    save_shapes,
+    write_ndjson,
+    write_packed,
+)
+from coxeter.shapes import (
+    ConvexSpheropolygon,
+    ConvexSpheropolyhedron,
+    Ellipsoid,
+    Polygon,
+    Polyhedron,
+    Sphere,
+    diagonalize_inertia_batch,
+)
+
+
+def make_shapes():
+    cube = PlatonicFamily.get_shape("Cube")
+    return [
+        cube,
+        Polyhedron(cube.vertices, cube.faces),
+        ConvexSpheropolyhedron(cube.vertices, 0.5),
+        RegularNGonFamily.get_shape(5),
+        Polygon([[0, 0], [1, 0], [1, 1], [0.5, 0.5], [0, 1]]),
+        ConvexSpheropolygon([[0, 0], [1, 0], [1, 1], [0, 1]], 0.25),
+        Sphere(2),
+        Ellipsoid(1, 2, 3),
+    ]
+
+
+def check_specs(specs, shapes):
+    specs = list(specs)
+    assert len(specs) == len(shapes)
+    for spec, shape in zip(specs, shapes):
+        expected = shape.gsd_shape_spec
+        assert spec.keys() == expected.keys()
+        for key, value in expected.items():
+            if key == "vertices":
+                assert np.array_equal(spec[key], value)
+            elif key == "faces":
+                assert len(spec[key]) == len(value)
+                for face, expected_face in zip(spec[key], value):
+                    assert np.array_equal(face, expected_face)
+            else:
+                assert spec[key] == value
+
+
+@pytest.mark.parametrize(
+    "write, read, buffer_type",
+    [(write_ndjson, read_ndjson, io.StringIO), (write_packed, read_packed, io.BytesIO)],
+)
+def test_roundtrip(write, read, buffer_type, tmp_path):
+    shapes = make_shapes()
+
+    buffer = buffer_type()
+    assert write(iter(shapes), buffer) == len(shapes)
+    buffer.seek(0)
+    check_specs(read(buffer, return_specs=True), shapes)
+
+    # Specs can be written directly, and shapes are read lazily from files.
+    filename = tmp_path / "shapes"
+    write((shape.gsd_shape_spec for shape in shapes), filename)
+    reader = read(filename)
+    first = next(reader)
+    assert type(first) is type(shapes[0])
+    assert np.isclose(first.volume, shapes[0].volume)
+    rest = list(reader)
+    assert [type(shape) for shape in rest] == [type(shape) for shape in shapes[1:]]
+    check_specs((shape.gsd_shape_spec for shape in rest), shapes[1:])
+    check_specs(read(filename, return_specs=True), shapes)
+
+
+def test_packed_arrays():
+    buffer = io.BytesIO()
+    write_packed(make_shapes()[:2], buffer)
+    buffer.seek(0)
+    cube, mesh = read_packed(buffer, return_specs=True)
+    assert cube["vertices"].dtype == np.float64
+    assert all(face.dtype == np.int64 for face in mesh["faces"])
+
+
+def test_packed_invalid():
+    with pytest.raises(ValueError):
+        next(read_packed(io.BytesIO(b"not a shape file")))
+
+    buffer = io.BytesIO()
+    write_packed(make_shapes()[:1], buffer)
+    with pytest.raises(ValueError):
+        list(read_packed(io.BytesIO(buffer.getvalue()[:-1])))
+
+
+def test_save_load_shapes(tmp_path):
+    shapes = [
+        shape for shape in make_shapes() if not isinstance(shape, (Sphere, Ellipsoid))
+    ]
+    assert save_shapes(iter(shapes), tmp_path) == len(shapes)
+    loaded = load_shapes(tmp_path)
+    assert len(loaded) == len(shapes)
+    for shape, expected in zip(loaded, shapes):
+        assert type(shape) is type(expected)
+        assert shape.gsd_shape_spec == expected.gsd_shape_spec
+        base = getattr(shape, "polygon", getattr(shape, "polyhedron", shape))
+        expected = getattr(
+            expected, "polygon", getattr(expected, "polyhedron", expected)
+        )
+        if isinstance(base, Polyhedron):
+            assert np.isclose(base.volume, expected.volume)
+            assert base.num_faces == expected.num_faces
+            for face, expected_face in zip(base.faces, expected.faces):
+                assert np.array_equal(face, expected_face)
+            for neighbors, expected_neighbors in zip(
+                base.neighbors, expected.neighbors
+            ):
+                assert np.array_equal(neighbors, expected_neighbors)
+            assert np.array_equal(base.normals, expected.normals)
+        else:
+            assert np.isclose(base.area, expected.area)
+            assert np.array_equal(base.normal, expected.normal)
+
+    # Shapes are views into the memory-mapped archive, but modifying them
+    # does not modify the file.
+    cube = loaded[0]
+    assert isinstance(cube.vertices.base, np.memmap)
+    cube.volume = 8
+    assert np.isclose(loaded[2].polyhedron.volume, 1)
+    assert np.isclose(load_shapes(tmp_path)[0].volume, 1)
+
+    # Copies do not share memory.
+    copied = load_shapes(tmp_path, mmap_mode=None, copy=True)
+    first, second = copied[0], copied[0]
+    first.volume = 8
+    assert np.isclose(second.volume, 1)
+    assert [type(s) for s in copied[-2:]] == [type(s) for s in shapes[-2:]]
+
+    # Read-only memory maps require copies, which can be modified in place.
+    with pytest.raises(ValueError):
+        load_shapes(tmp_path, mmap_mode="r")
+    cube = load_shapes(tmp_path, mmap_mode="r", copy=True)[0]
+    diagonalize_inertia_batch([cube])
+    assert np.isclose(cube.volume, 1)
+
+
+def test_save_unsupported_shape(tmp_path):
+    with pytest.raises(TypeError):
+        save_shapes([Sphere(1)], tmp_path)
@@ -0,0 +1,184 @@
+import numpy as np
+import pytest
+import rowan
+from hypothesis import given, settings
+from hypothesis.strategies import floats, integers
+from scipy.spatial import ConvexHull
+
+from coxeter.families import PlatonicFamily
+from coxeter.shapes import (
+    ConvexPolygon,
+    ConvexPolyhedron,
+    ConvexSpheropolygon,
+    ConvexSpheropolyhedron,
+    Polyhedron,
+    minkowski_sum,
+)
+
+
+def pairwise_sums(first, second):
+    """Get all sums of pairs of vertices of two sets of points."""
+    return (first[:, np.newaxis] + second[np.newaxis]).reshape(-1, first.shape[1])
+
+
+def regular_polygon(n, radius=1, center=(0, 0, 0)):
+    angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    vertices = radius * np.column_stack([np.cos(angles), np.sin(angles)])
+    return ConvexPolygon(np.column_stack([vertices, np.zeros(n)]) + center)
+
+
+@settings(deadline=500)
+@given(integers(0, 2 ** 31))
+def test_polyhedra(seed):
+    rng = np.random.default_rng(seed)
+    first = ConvexPolyhedron(rng.normal(size=(10, 3)))
+    second = ConvexPolyhedron(rng.normal(size=(8, 3)) + 5)
+    orientations = rowan.normalize(rng.normal(size=(5, 4)))
+
+    shapes = minkowski_sum(first, second, orientations)
+    assert len(shapes) == len(orientations)
+    for shape, orientation in zip(shapes, orientations):
+        hull = ConvexHull(
+            pairwise_sums(first.vertices, rowan.rotate(orientation, second.vertices))
+        )
+        assert np.isclose(shape.volume, hull.volume)
+        assert np.isclose(shape.surface_area, hull.area)
+        assert len(shape.vertices) == len(hull.vertices)
+        assert np.allclose(
+            np.sort(shape.vertices, axis=0),
+            np.sort(hull.points[hull.vertices], axis=0),
+        )
+
+        # The faces and neighbors agree with a freshly constructed polyhedron.
+        reference = Polyhedron(shape.vertices, shape.faces)
+        assert [sorted(n) for n in shape.neighbors] == [
+            sorted(n) for n in reference.neighbors
+        ]
+
+
+def test_single_orientation():
+    cube = PlatonicFamily.get_shape("Cube")
+    octahedron = PlatonicFamily.get_shape("Octahedron")
+    shape = minkowski_sum(cube, octahedron)
+    assert isinstance(shape, ConvexPolyhedron)
+    hull = ConvexHull(pairwise_sums(cube.vertices, octahedron.vertices))
+    assert np.isclose(shape.volume, hull.volume)
+    assert len(shape.vertices) == len(hull.vertices)
+
+
+CUBE = ConvexPolyhedron([[x, y, z] for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)])
+OCTAHEDRON = ConvexPolyhedron(np.concatenate((np.eye(3), -np.eye(3))))
+TETRAHEDRON = ConvexPolyhedron([[1, 1, 1], [1, -1, -1], [-1, 1, -1], [-1, -1, 1]])
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [(CUBE, CUBE), (OCTAHEDRON, TETRAHEDRON), (TETRAHEDRON, TETRAHEDRON)],
+)
+@pytest.mark.parametrize(
+    "orientation",
+    [
+        [1, 0, 0, 0],
+        rowan.from_axis_angle([0, 0, 1], np.pi / 2),
+        rowan.from_axis_angle([0, 0, 1], np.pi / 4),
+        rowan.from_axis_angle([1, 1, 1], 2 * np.pi / 3),
+        rowan.from_axis_angle([1, 1, 1], np.pi / 3),
+    ],
+)
+def test_degenerate_orientations(first, second, orientation):
+    """Test orientations at which faces and edges of the shapes are parallel."""
+    shape = minkowski_sum(first, second, [orientation])[0]
+    hull = ConvexHull(
+        pairwise_sums(first.vertices, rowan.rotate(orientation, second.vertices))
+    )
+    assert np.isclose(shape.volume, hull.volume)
+    assert np.isclose(shape.surface_area, hull.area)
+    assert len(shape.vertices) == len(hull.vertices)
+    reference = Polyhedron(shape.vertices, shape.faces)
+    assert [sorted(n) for n in shape.neighbors] == [
+        sorted(n) for n in reference.neighbors
+    ]
+
+
+@pytest.mark.parametrize("name", ["Tetrahedron", "Cube", "Dodecahedron"])
+def test_degenerate_orientations_family(name):
+    """Test degenerate orientations of shapes whose vertices are inexact."""
+    first = PlatonicFamily.get_shape("Octahedron")
+    second = PlatonicFamily.get_shape(name)
+    orientations = [
+        rowan.from_axis_angle([0, 0, 1], np.pi / 4),
+        rowan.from_axis_angle([1, 1, 1], 2 * np.pi / 3),
+    ]
+    for shape, orientation in zip(
+        minkowski_sum(first, second, orientations), orientations
+    ):
+        hull = ConvexHull(
+            pairwise_sums(first.vertices, rowan.rotate(orientation, second.vertices))
+        )
+        assert np.isclose(shape.volume, hull.volume)
+        assert np.isclose(shape.surface_area, hull.area)
+
+
+@given(integers(3, 10), integers(3, 10), floats(0, 2 * np.pi))
+def test_polygons(n1, n2, angle):
+    first = regular_polygon(n1, 1, (1, 2, 0))
+    second = regular_polygon(n2, 0.5)
+
+    shape = minkowski_sum(first, second, [angle])[0]
+    rotated = rowan.rotate(rowan.from_axis_angle([0, 0, 1], angle), second.vertices)
+    hull = ConvexHull(pairwise_sums(first.vertices, rotated)[:, :2])
+    assert np.isclose(shape.area, hull.volume)
+    assert np.isclose(shape.perimeter, hull.area)
+
+    # Nearly parallel edges are merged within the tolerance for degeneracy.
+    edges = hull.points[np.roll(hull.vertices, -1)] - hull.points[hull.vertices]
+    edges /= np.linalg.norm(edges, axis=1, keepdims=True)
+    turns = np.arcsin(np.clip(np.cross(np.roll(edges, 1, axis=0), edges), -1, 1))
+    assert len(shape.vertices) == np.count_nonzero(turns > 1e-9)
+
+
+def test_antiparallel_polygons():
+    first = regular_polygon(4)
+    second = ConvexPolygon(regular_polygon(3).vertices[::-1])
+    assert np.allclose(second.normal, [0, 0, -1])
+
+    shape = minkowski_sum(first, second)
+    hull = ConvexHull(pairwise_sums(first.vertices, second.vertices)[:, :2])
+    assert np.isclose(shape.area, hull.volume)
+    assert len(shape.vertices) == len(hull.vertices)
+
+
+def test_rounded_shapes():
+    cube = PlatonicFamily.get_shape("Cube")
+    octahedron = PlatonicFamily.get_shape("Octahedron")
+    shape = minkowski_sum(
+        ConvexSpheropolyhedron(cube.vertices, 0.25),
+        ConvexSpheropolyhedron(octahedron.vertices, 0.5),
+    )
+    assert isinstance(shape, ConvexSpheropolyhedron)
+    assert shape.radius == 0.75
+    assert np.isclose(
+        shape.volume,
+        ConvexSpheropolyhedron(
+            pairwise_sums(cube.vertices, octahedron.vertices), 0.75
+        ).volume,
+    )
+
+    shape = minkowski_sum(
+        ConvexSpheropolygon(regular_polygon(4).vertices, 0.1), regular_polygon(3)
+    )
+    assert isinstance(shape, ConvexSpheropolygon)
+    assert shape.radius == 0.1
+    assert len(shape.polygon.vertices) == 7
+
+
+def test_invalid_shapes():
+    cube = PlatonicFamily.get_shape("Cube")
+    with pytest.raises(TypeError):
+        minkowski_sum(cube, Polyhedron(cube.vertices, cube.faces))
+    with pytest.raises(TypeError):
+        minkowski_sum(cube, regular_polygon(3))
+
+    tilted = ConvexPolygon([[0, 0, 0], [1, 0, 0], [0, 1, 1]])
+    with pytest.raises(ValueError):
+        minkowski_sum(regular_polygon(3), tilted)
@@ -8,9 +8,10 @@ from hypothesis.strategies import floats
 from scipy.spatial import ConvexHull
 
 from conftest import EllipseSurfaceStrategy
+from coxeter.bentley_ottmann import is_simple_batch, poly_point_isect
 from coxeter.families import RegularNGonFamily
 from coxeter.shapes.convex_polygon import ConvexPolygon
-from coxeter.shapes.polygon import Polygon
+from coxeter.shapes.polygon import Polygon, polygon_moments_batch
 
 
 def polygon_from_hull(verts):
@@ -183,6 +184,91 @@ def test_inertia_tensor(square):
         )
 
 
+def test_inertia_tensor_no_side_effects(square):
+    vertices = square.vertices.copy()
+    normal = square.normal.copy()
+    square.inertia_tensor
+    assert np.array_equal(square.vertices, vertices)
+    assert np.array_equal(square.normal, normal)
+
+
+@settings(deadline=1000)
+@given(EllipseSurfaceStrategy)
+def test_polygon_moments_batch(points):
+    hull = ConvexHull(points[:, :2])
+    vertices = points[hull.vertices, :2]
+    polygons = [vertices, vertices[::-1] + [1, -2], vertices[:3]]
+    areas, centroids, tensors = polygon_moments_batch(polygons)
+
+    for polygon, area, centroid, tensor in zip(polygons, areas, centroids, tensors):
+        poly = Polygon(np.insert(polygon, 2, 0, axis=1))
+        assert np.isclose(area, poly.area)
+        poly.center = np.append(poly.center[:2] - centroid, 0)
+        i_x, i_y, i_xy = poly.planar_moments_inertia
+        assert np.allclose(np.diag(tensor), [i_x, i_y])
+        assert np.isclose(abs(tensor[0, 1]), i_xy)
+        assert np.isclose(tensor[0, 1], tensor[1, 0])
+
+    # Translating a polygon only moves its centroid.
+    assert np.allclose(centroids[1], centroids[0] + [1, -2])
+    assert np.allclose(tensors[1], tensors[0])
+
+    # A padded array gives the same results as a ragged sequence.
+    padded = np.zeros((3, len(vertices), 2))
+    for i, polygon in enumerate(polygons):
+        padded[i, : len(polygon)] = polygon
+    for expected, result in zip(
+        (areas, centroids, tensors),
+        polygon_moments_batch(padded, lengths=[len(p) for p in polygons]),
+    ):
+        assert np.allclose(expected, result)
+
+    # Embedding the polygons in 3D gives the inertia tensor of a lamina.
+    rotation = rowan.random.rand()
+    embedded = [rowan.rotate(rotation, np.insert(p, 2, 0, axis=1)) for p in polygons]
+    embedded_areas, embedded_centroids, embedded_tensors = polygon_moments_batch(
+        embedded
+    )
+    matrix = rowan.to_matrix(rotation)
+    assert np.allclose(embedded_areas, areas)
+    assert np.allclose(
+        embedded_centroids,
+        rowan.rotate(rotation, np.insert(centroids, 2, 0, axis=1)),
+    )
+    for tensor, embedded_tensor in zip(tensors, embedded_tensors):
+        lamina_tensor = np.zeros((3, 3))
+        lamina_tensor[:2, :2] = tensor
+        lamina_tensor[2, 2] = np.trace(tensor)
+        assert np.allclose(embedded_tensor, matrix @ lamina_tensor @ matrix.T)
+
+    # Providing normals, in either direction, gives the same results.
+    normals = np.tile(rowan.rotate(rotation, [0, 0, 1]), (3, 1)) * [[1], [-1], [1]]
+    for expected, result in zip(
+        (embedded_areas, embedded_centroids, embedded_tensors),
+        polygon_moments_batch(embedded, normals=normals),
+    ):
+        assert np.allclose(expected, result)
+
+
+def test_polygon_moments_batch_nonconvex():
+    # An L shape composed of a 2x1 and a 1x1 rectangle.
+    vertices = [[0, 0], [2, 0], [2, 1], [1, 1], [1, 2], [0, 2]]
+    areas, centroids, tensors = polygon_moments_batch([vertices])
+    assert np.isclose(areas[0], 3)
+    assert np.allclose(centroids[0], [5 / 6, 5 / 6])
+    # The second moments about the origin are the sums of those of the two
+    # rectangles, which are then shifted to the centroid.
+    moments = np.array([[8 / 3, 1], [1, 2 / 3]]) + np.array(
+        [[1 / 3, 3 / 4], [3 / 4, 7 / 3]]
+    )
+    moments -= 3 * np.outer(centroids[0], centroids[0])
+    expected = np.trace(moments) * np.eye(2) - moments
+    assert np.allclose(tensors[0], expected)
+
+    with pytest.raises(ValueError):
+        polygon_moments_batch([vertices[:2]])
+
+
 def test_nonplanar(square_points):
     """Ensure that nonplanar vertices raise an error."""
     with pytest.raises(ValueError):
@@ -376,3 +462,74 @@ def test_perimeter(num_sides):
     assert np.isclose(
         num_sides * unit_area_regular_n_gon_side_length(num_sides), poly.perimeter
     )
+
+
+def test_nonsimple(square_points):
+    """Ensure that self-intersecting vertices raise an error."""
+    with pytest.raises(ValueError):
+        Polygon(square_points[[0, 2, 1, 3]])
+
+
+@pytest.mark.parametrize("max_vectorized_vertices", [0, 64])
+def test_is_simple_batch(max_vectorized_vertices):
+    """Compare batched simplicity checks to the Bentley-Ottmann sweep."""
+    np.random.seed(0)
+    polygons = [np.random.rand(n, 2) for n in np.random.randint(3, 12, size=200)]
+
+    # Random points sorted by angle always define simple star-shaped polygons.
+    for n in range(3, 12):
+        theta = np.sort(np.random.rand(n)) * 2 * np.pi
+        radii = np.random.rand(n) + 0.5
+        polygons.append(
+            radii[:, np.newaxis] * np.array([np.cos(theta), np.sin(theta)]).T
+        )
+
+    expected = [len(poly_point_isect.isect_polygon(p)) == 0 for p in polygons]
+    simple = is_simple_batch(polygons, max_vectorized_vertices)
+    npt.assert_array_equal(simple, expected)
+    assert np.any(simple) and not np.all(simple)
+
+    # Stacks of equally sized polygons may be provided as a single array.
+    stacked = np.stack([p for p in polygons if len(p) == 5])
+    npt.assert_array_equal(
+        is_simple_batch(stacked, max_vectorized_vertices),
+        is_simple_batch(list(stacked), max_vectorized_vertices),
+    )
+
+
+def test_from_trusted_vertices(square_points):
+    """Ensure that trusted construction matches validated construction."""
+    square = ConvexPolygon(square_points)
+    trusted = ConvexPolygon.from_trusted_vertices(square.vertices, square.normal)
+    assert type(trusted) is ConvexPolygon
+    npt.assert_equal(trusted.vertices, square.vertices)
+    npt.assert_equal(trusted.normal, square.normal)
+    assert trusted.area == square.area
+
+    # The normal defaults to the same one computed by the constructor.
+    trusted = Polygon.from_trusted_vertices(square_points[:, :2])
+    npt.assert_equal(trusted.normal, Polygon(square_points).normal)
+
+    # No validation is performed, so even a self-intersecting polygon is accepted.
+    Polygon.from_trusted_vertices(square_points[[0, 2, 1, 3]])
+
+
+def test_sample():
+    # An L shape composed of a 2x1 and a 1x1 square.
+    polygon = Polygon([[0, 0], [2, 0], [2, 1], [1, 1], [1, 2], [0, 2]])
+    points = polygon.sample_volume(100000, rng=0)
+    assert np.allclose(points[:, 2], 0)
+    outside = (points[:, 0] > 1) & (points[:, 1] > 1)
+    assert not np.any(outside)
+    assert np.allclose(np.mean(points, axis=0), [5 / 6, 5 / 6, 0], atol=0.01)
+
+    # The perimeter has length 8, with 2 units along each axis.
+    points = polygon.sample_surface(100000, rng=0)
+    on_axes = np.isclose(points[:, 0], 0) | np.isclose(points[:, 1], 0)
+    assert np.mean(on_axes) == pytest.approx(1 / 2, abs=0.01)
+    assert np.allclose(np.mean(points, axis=0), [7 / 8, 7 / 8, 0], atol=0.01)
+
+    # The samplers follow changes to the vertices.
+    polygon.center = (10, 0, 0)
+    points = polygon.sample_volume(1000, rng=0)
+    assert np.all(points[:, 0] >= polygon.center[0] - 1)
@@ -1,4 +1,5 @@
 import os
+import pickle
 
 import numpy as np
 import pytest
@@ -14,7 +15,14 @@ from conftest import (
     get_oriented_cube_normals,
 )
 from coxeter.families import DOI_SHAPE_REPOSITORIES, PlatonicFamily
+from coxeter.shapes.convex_polygon import ConvexPolygon
 from coxeter.shapes.convex_polyhedron import ConvexPolyhedron
+from coxeter.shapes.polygon import polygon_moments_batch
+from coxeter.shapes.polyhedron import (
+    Polyhedron,
+    _cycle_order,
+    diagonalize_inertia_batch,
+)
 from coxeter.shapes.utils import rotate_order2_tensor, translate_inertia_tensor
 from utils import compute_inertia_mc
 
@@ -69,6 +77,148 @@ def test_merge_faces(convex_cube):
     assert len(convex_cube.faces) == 6
 
 
+def test_merge_faces_prism():
+    """Check that the triangulated caps of a prism are merged into one face."""
+    num_sides = 200
+    theta = np.linspace(0, 2 * np.pi, num_sides, endpoint=False)
+    base = np.column_stack((np.cos(theta), np.sin(theta)))
+    vertices = np.concatenate(
+        (
+            np.column_stack((base, np.zeros(num_sides))),
+            np.column_stack((base, np.ones(num_sides))),
+        )
+    )
+    hull = ConvexHull(vertices)
+    poly = Polyhedron(vertices, hull.simplices, True)
+    poly.merge_faces()
+    assert poly.num_faces == num_sides + 2
+    assert sorted(len(face) for face in poly.faces)[-2:] == [num_sides, num_sides]
+    assert np.isclose(poly.volume, hull.volume)
+    assert np.isclose(poly.surface_area, hull.area)
+
+
+@pytest.mark.parametrize("num_points", [4, 20, 500])
+def test_convex_polyhedron_matches_merged_hull(num_points):
+    """Check that building faces from the hull matches merging simplices."""
+    np.random.seed(num_points)
+    points = np.random.normal(size=(num_points, 3))
+    hull = ConvexHull(points)
+    expected = Polyhedron(points, hull.simplices, True)
+    expected.merge_faces()
+    poly = ConvexPolyhedron(points)
+    assert poly.num_faces == expected.num_faces
+    for face, expected_face in zip(poly.faces, expected.faces):
+        assert np.array_equal(face, expected_face)
+    for neighbors, expected_neighbors in zip(poly.neighbors, expected.neighbors):
+        assert np.array_equal(neighbors, expected_neighbors)
+    assert np.allclose(poly.normals, expected.normals)
+    assert np.isclose(poly.volume, hull.volume)
+
+
+def test_convex_polyhedron_nearly_coplanar_point(convex_cube):
+    """A point merged into a face without being one of its corners is dropped."""
+    orientation = rowan.normalize([1, 0.3, 0.5, 0.2])
+    points = rowan.rotate(
+        orientation,
+        np.concatenate((2 * convex_cube.vertices - 1, [[0.3, 0.2, 1 + 1e-6]])),
+    )
+    poly = ConvexPolyhedron(points)
+    assert poly.num_faces == 6
+    assert all(len(face) == 4 and 8 not in face for face in poly.faces)
+    assert np.isclose(poly.volume, 8)
+    assert np.isclose(poly.surface_area, 24)
+    assert np.all(poly.is_inside(0.999 * points))
+
+    # The same happens for the nearly coplanar facets of random hulls.
+    points = np.random.default_rng(1714547541).normal(size=(20, 3))
+    poly = ConvexPolyhedron(points)
+    hull = ConvexHull(points)
+    assert np.isclose(poly.volume, hull.volume)
+    assert np.isclose(poly.surface_area, hull.area)
+
+
+def test_convex_polyhedron_nonconvex_merged_facets():
+    """Nearly coplanar facets are not merged if they do not form a polygon."""
+    # The vertices of these shapes are only given to five digits, so the sum
+    # of the faces of the tetrahedron and the dodecahedron that are parallel
+    # at this orientation is not planar.
+    tetrahedron = PlatonicFamily.get_shape("Tetrahedron")
+    dodecahedron = PlatonicFamily.get_shape("Dodecahedron")
+    rotated = rowan.rotate(
+        rowan.from_axis_angle([0, 0, 1], np.pi / 4), dodecahedron.vertices
+    )
+    points = (tetrahedron.vertices[:, np.newaxis] + rotated).reshape(-1, 3)
+    poly = ConvexPolyhedron(points)
+    hull = ConvexHull(points)
+    assert np.isclose(poly.volume, hull.volume)
+    assert np.isclose(poly.surface_area, hull.area)
+    reference = Polyhedron(poly.vertices, poly.faces)
+    assert [sorted(n) for n in poly.neighbors] == [
+        sorted(n) for n in reference.neighbors
+    ]
+
+
+@pytest.mark.parametrize("protocol", [pickle.DEFAULT_PROTOCOL, 5])
+def test_pickle(protocol):
+    np.random.seed(0)
+    points = np.random.normal(size=(100, 3))
+    convex = ConvexPolyhedron(points)
+    for poly in (convex, Polyhedron(convex.vertices, convex.faces)):
+        # Cached mass properties are not pickled.
+        expected_inertia = poly.inertia_tensor
+        buffers = []
+        if protocol >= 5:
+            data = pickle.dumps(poly, protocol=5, buffer_callback=buffers.append)
+            # The packed arrays are transferred out-of-band.
+            assert len(buffers) > 0
+        else:
+            data = pickle.dumps(poly, protocol=protocol)
+        unpickled = pickle.loads(data, buffers=buffers)
+        assert type(unpickled) is type(poly)
+        assert np.array_equal(unpickled.vertices, poly.vertices)
+        assert unpickled.num_faces == poly.num_faces
+        for face, expected_face in zip(unpickled.faces, poly.faces):
+            assert np.array_equal(face, expected_face)
+        for neighbors, expected_neighbors in zip(unpickled.neighbors, poly.neighbors):
+            assert np.array_equal(neighbors, expected_neighbors)
+        assert np.array_equal(unpickled.normals, poly.normals)
+        assert np.isclose(unpickled.volume, poly.volume)
+        assert np.allclose(unpickled.inertia_tensor, expected_inertia)
+        assert "_mass_property_cache" not in pickle.loads(pickle.dumps(poly)).__dict__
+
+
+def test_sort_faces_large_hull():
+    """Check that sorting many shuffled triangles reproduces the hull."""
+    np.random.seed(0)
+    points = np.random.normal(size=(2000, 3))
+    points /= np.linalg.norm(points, axis=1)[:, np.newaxis]
+    hull = ConvexHull(points)
+
+    faces = [np.random.permutation(simplex) for simplex in hull.simplices]
+    poly = Polyhedron(points, faces, faces_are_convex=True)
+    poly.sort_faces()
+
+    assert np.allclose(poly.normals, hull.equations[:, :3])
+    assert np.isclose(poly.volume, hull.volume)
+    for face, simplex, neighbors, hull_neighbors in zip(
+        poly.faces, hull.simplices, poly.neighbors, hull.neighbors
+    ):
+        assert set(face) == set(simplex)
+        assert np.array_equal(neighbors, np.sort(hull_neighbors))
+
+
+def test_sort_faces_interior_point(convex_cube):
+    """Faces with vertices inside them cannot be sorted by angle."""
+    vertices = np.concatenate((convex_cube.vertices, [[0.3, 0.2, 0]]))
+    top = np.argmax(convex_cube.normals @ [0, 0, 1])
+    vertices[-1, 2] = vertices[convex_cube.faces[top][0], 2]
+    faces = [np.asarray(face) for face in convex_cube.faces]
+    faces[top] = np.append(faces[top], len(vertices) - 1)
+    poly = Polyhedron(vertices, faces, faces_are_convex=True)
+    with pytest.raises(ValueError):
+        poly.sort_faces()
+
+
 @settings(deadline=500)
 @given(EllipsoidSurfaceStrategy)
 def test_convex_volume(points):
@@ -244,9 +394,19 @@ def test_nonconvex_polyhedron():
     pass
 
 
-@pytest.mark.skip("Need test data")
 def test_nonconvex_polyhedron_with_nonconvex_polygon_face():
-    pass
+    """Test a prism whose base is an L-shaped (nonconvex) hexagon."""
+    base = np.array([[0, 0], [2, 0], [2, 1], [1, 1], [1, 2], [0, 2]])
+    vertices = np.vstack(
+        (np.hstack((base, np.zeros((6, 1)))), np.hstack((base, np.ones((6, 1)))))
+    )
+    faces = [np.arange(6)[::-1], np.arange(6, 12)] + [
+        np.array([i, (i + 1) % 6, (i + 1) % 6 + 6, i + 6]) for i in range(6)
+    ]
+    poly = Polyhedron(vertices, faces)
+    assert np.isclose(poly.volume, 3)
+    assert np.isclose(poly.surface_area, 14)
+    assert np.allclose(poly.get_face_area([0, 1]), 3)
 
 
 @pytest.mark.skip("Need test data")
@@ -421,6 +581,101 @@ def test_translate_inertia(translation):
     assert np.allclose(mc_tensor, translated_shape.inertia_tensor, atol=1e-2, rtol=1e-2)
 
 
+def _box_inertia(lower, upper):
+    """Compute the inertia tensor of an axis-aligned box about the origin."""
+    lower, upper = np.asarray(lower, dtype=float), np.asarray(upper, dtype=float)
+    lengths = upper - lower
+    volume = np.prod(lengths)
+    first = (upper ** 2 - lower ** 2) / 2 / lengths
+    second = (upper ** 3 - lower ** 3) / 3 / lengths
+    moments = volume * np.outer(first, first)
+    moments[np.diag_indices(3)] = volume * second
+    return np.trace(moments) * np.eye(3) - moments
+
+
+def test_inertia_nonconvex():
+    """Compare the inertia of an L-shaped prism to that of its two boxes."""
+    outline = np.array([[0, 0], [2, 0], [2, 1], [1, 1], [1, 2], [0, 2]])
+    offset = np.array([0.3, -0.7, 1.2])
+    vertices = np.concatenate(
+        [np.insert(outline, 2, 0, axis=1), np.insert(outline, 2, 1, axis=1)]
+    )
+    faces = [[5, 4, 3, 2, 1, 0], [6, 7, 8, 9, 10, 11]]
+    faces.extend([i, (i + 1) % 6, (i + 1) % 6 + 6, i + 6] for i in range(6))
+    poly = Polyhedron(vertices + offset, faces)
+
+    expected = _box_inertia(offset, offset + [2, 1, 1]) + _box_inertia(
+        offset + [0, 1, 0], offset + [1, 2, 1]
+    )
+    assert np.allclose(poly.inertia_tensor, expected)
+    assert np.allclose(poly._compute_inertia_tensor(False), expected)
+
+    # Reversing the orientation of all faces must not change the result.
+    reversed_poly = Polyhedron(vertices + offset, [face[::-1] for face in faces])
+    assert np.allclose(reversed_poly.inertia_tensor, expected)
+
+    # The tensor about the center of mass does not depend on the position.
+    assert np.allclose(
+        poly._compute_inertia_tensor(),
+        Polyhedron(vertices, faces)._compute_inertia_tensor(),
+    )
+
+
+def test_inertia_after_merging_faces():
+    """Ensure that the cached triangulation follows changes to the faces."""
+    cube = PlatonicFamily.get_shape("Cube")
+    cube.center = (0, 0, 0)
+    expected = cube.inertia_tensor
+    triangulated = Polyhedron(
+        cube.vertices, [t for t in ConvexHull(cube.vertices).simplices]
+    )
+    triangulated.inertia_tensor
+    triangulated.merge_faces()
+    assert len(triangulated.faces) == 6
+    assert np.allclose(triangulated.inertia_tensor, expected)
+
+
+@settings(deadline=500)
+@given(
+    arrays(np.float64, (3,), elements=floats(-10, 10, width=64)),
+    floats(0.1, 10),
+)
+def test_centroid(translation, volume):
+    # The vertex mean of a cube with one corner pushed inward differs from
+    # its center of mass.
+    cube = PlatonicFamily.get_shape("Cube")
+    cube.center = (0, 0, 0)
+    vertices = cube.vertices
+    corner = np.argmax(np.sum(vertices, axis=1))
+    vertices[corner] *= [0, 1, 1]
+    poly = ConvexPolyhedron(vertices + translation)
+
+    hull = ConvexHull(poly.vertices)
+    tetrahedra = poly.vertices[hull.simplices]
+    reference = np.mean(poly.vertices, axis=0)
+    tet_volumes = np.abs(np.linalg.det(tetrahedra - reference)) / 6
+    tet_centroids = (np.sum(tetrahedra, axis=1) + reference) / 4
+    expected = tet_volumes @ tet_centroids / np.sum(tet_volumes)
+    assert np.allclose(poly.centroid, expected)
+    assert not np.allclose(poly.centroid, poly.center)
+    assert np.isclose(poly.volume, hull.volume)
+
+    # Cached values follow changes to the vertices.
+    expected -= poly.center
+    poly.center = (0, 0, 0)
+    assert np.allclose(poly.centroid, expected)
+    scale = (volume / poly.volume) ** (1 / 3)
+    poly.volume = volume
+    assert np.isclose(poly.volume, volume)
+    assert np.allclose(poly.centroid, scale * expected)
+
+    centered_inertia = poly._compute_inertia_tensor()
+    assert np.allclose(
+        translate_inertia_tensor(poly.centroid, centered_inertia, poly.volume),
+        poly.inertia_tensor,
+    )
+
+
 @settings(deadline=500)
 @given(EllipsoidSurfaceStrategy)
 @example(
@@ -452,6 +707,34 @@ def test_diagonalize_inertia(points):
         assert np.allclose(np.diag(np.diag(it)), it)
 
 
+def test_diagonalize_inertia_batch():
+    np.random.seed(0)
+    polyhedra = [ConvexPolyhedron(np.random.rand(20, 3) + i) for i in range(10)]
+    polyhedra.append(Polyhedron(polyhedra[0].vertices, polyhedra[0].faces))
+    original_vertices = [poly.vertices.copy() for poly in polyhedra]
+    original_volumes = [poly.volume for poly in polyhedra]
+
+    quaternions = diagonalize_inertia_batch(polyhedra)
+    assert quaternions.shape == (len(polyhedra), 4)
+    for poly, vertices, volume, quaternion in zip(
+        polyhedra, original_vertices, original_volumes, quaternions
+    ):
+        assert np.allclose(rowan.rotate(quaternion, vertices), poly.vertices)
+        it = poly.inertia_tensor
+        assert np.allclose(np.diag(np.diag(it)), it)
+
+        # The faces keep their outward orientation and the normals match the
+        # rotated vertices.
+        reference = Polyhedron(poly.vertices, poly.faces)
+        assert np.allclose(poly.normals, reference.normals)
+        assert np.allclose(poly._equations, reference._equations)
+        assert np.isclose(poly.volume, volume)
+        assert np.allclose(it, reference.inertia_tensor)
+        assert np.allclose(poly.centroid, reference.centroid)
+
+    assert diagonalize_inertia_batch([]).shape == (0, 4)
+
+
 @pytest.mark.parametrize(
     "cube", ["convex_cube", "oriented_cube", "unoriented_cube"], indirect=True
 )
@@ -509,3 +792,206 @@ def test_form_factor(cube):
         ],
         atol=1e-7,
     )
+
+
+def test_sample_convex():
+    np.random.seed(0)
+    poly = ConvexPolyhedron(np.random.rand(30, 3))
+    points = poly.sample_volume(100000, rng=0)
+    assert np.all(poly.is_inside(points))
+    assert np.allclose(np.mean(points, axis=0), poly.centroid, atol=0.01)
+
+    points = poly.sample_surface(100000, rng=0)
+    distances = poly._point_plane_distances(points)
+    assert np.allclose(np.max(distances, axis=1), 0)
+    # Each face receives a share of the points proportional to its area.
+    face_ids = np.argmax(distances, axis=1)
+    counts = np.bincount(face_ids, minlength=poly.num_faces)
+    fractions = poly.get_face_area() / poly.surface_area
+    assert np.allclose(counts / len(points), fractions, atol=0.01)
+
+
+def test_sample_nonconvex():
+    """Sample an L-shaped prism that is not star-shaped about its vertex mean."""
+    outline = np.array([[0, 0], [10, 0], [10, 1], [1, 1], [1, 2], [0, 2]])
+    vertices = np.concatenate(
+        [np.insert(outline, 2, 0, axis=1), np.insert(outline, 2, 1, axis=1)]
+    )
+    faces = [[5, 4, 3, 2, 1, 0], [6, 7, 8, 9, 10, 11]]
+    faces.extend([i, (i + 1) % 6, (i + 1) % 6 + 6, i + 6] for i in range(6))
+    poly = Polyhedron(vertices, faces)
+
+    points = poly.sample_volume(100000, rng=0)
+    assert not np.any((points[:, 0] > 1) & (points[:, 1] > 1))
+    assert np.allclose(np.mean(points, axis=0), poly.centroid, atol=0.05)
+    assert np.mean(points[:, 1] > 1) == pytest.approx(1 / 11, abs=0.01)
+
+    points = poly.sample_surface(100000, rng=0)
+    on_top = np.isclose(points[:, 2], 1)
+    expected = poly.get_face_area(1)[0] / poly.surface_area
+    assert np.mean(on_top) == pytest.approx(expected, abs=0.01)
+
+
+@settings(deadline=500)
+@given(integers(0, 2 ** 31))
+def test_cross_sections_convex(seed):
+    rng = np.random.default_rng(seed)
+    poly = ConvexPolyhedron(rng.normal(size=(20, 3)))
+    normal = rng.normal(size=3)
+    normal /= np.linalg.norm(normal)
+    offsets = rng.normal(size=10)
+
+    # Compare with the hull of the intersections of the edges with each plane.
+    heights = poly.vertices @ normal
+    first, second = poly._find_face_intersections()[2].T
+    basis = np.linalg.svd(normal[np.newaxis])[2][1:]
+    expected = []
+    for offset in offsets:
+        crossing = (heights[first] - offset) * (heights[second] - offset) < 0
+        fractions = (offset - heights[first][crossing]) / (
+            heights[second][crossing] - heights[first][crossing]
+        )
+        points = poly.vertices[first][crossing] + fractions[:, np.newaxis] * (
+            poly.vertices[second][crossing] - poly.vertices[first][crossing]
+        )
+        if len(points) < 3:
+            expected.append((0, 0))
+        else:
+            hull = ConvexHull(points @ basis.T)
+            expected.append((hull.volume, hull.area))
+    expected = np.array(expected)
+
+    areas, perimeters, centroids, inertia_tensors = poly.get_cross_sections(
+        normal, offsets, return_shapes=False
+    )
+    assert np.allclose(areas, expected[:, 0])
+    assert np.allclose(perimeters, expected[:, 1])
+
+    sections = poly.get_cross_sections(normal, offsets)
+    for section, offset, area, centroid, inertia_tensor in zip(
+        sections, offsets, areas, centroids, inertia_tensors
+    ):
+        if area == 0:
+            assert section == []
+            continue
+        assert len(section) == 1
+        polygon = section[0]
+        assert isinstance(polygon, ConvexPolygon)
+        assert np.allclose(polygon.vertices @ normal, offset)
+        assert np.isclose(polygon.signed_area, area)
+        assert np.allclose(polygon.normal, normal)
+        _, expected_centroids, expected_tensors = polygon_moments_batch(
+            [polygon.vertices]
+        )
+        assert np.allclose(expected_centroids[0], centroid)
+        assert np.allclose(expected_tensors[0], inertia_tensor)
+
+
+def test_cross_sections_degenerate():
+    """Test planes through vertices and edges and containing faces."""
+    cube = PlatonicFamily.get_shape("Cube")
+    areas, perimeters, _, _ = cube.get_cross_sections(
+        [0, 0, 1], [-0.5, 0, 0.5], return_shapes=False
+    )
+    assert np.allclose(areas, [1, 1, 0])
+    assert np.allclose(perimeters, [4, 4, 0])
+
+    # The plane through three vertices cuts a triangle from the cube.
+    normal = np.ones(3) / np.sqrt(3)
+    section = cube.get_cross_sections(normal, 0.5 / np.sqrt(3))
+    assert len(section) == 1
+    assert len(section[0].vertices) == 3
+    assert np.isclose(section[0].area, np.sqrt(3) / 2)
+    assert cube.get_cross_sections(normal, -np.sqrt(3) / 2) == []
+
+    octahedron = Polyhedron(
+        [[1, 0, 0], [-1, 0, 0], [0, 1, 0], [0, -1, 0], [0, 0, 1], [0, 0, -1]],
+        [
+            [0, 2, 4],
+            [2, 1, 4],
+            [1, 3, 4],
+            [3, 0, 4],
+            [2, 0, 5],
+            [1, 2, 5],
+            [3, 1, 5],
+            [0, 3, 5],
+        ],
+    )
+    section = octahedron.get_cross_sections([0, 0, 1], 0)
+    assert len(section) == 1
+    assert len(section[0].vertices) == 4
+    assert np.isclose(section[0].signed_area, 2)
+
+
+def test_cross_sections_nonconvex():
+    """Slice a square frame, whose sections have holes or several parts."""
+    outer = [[-2, -2], [2, -2], [2, 2], [-2, 2]]
+    inner = [[-1, -1], [1, -1], [1, 1], [-1, 1]]
+    vertices = [point + [z] for z in (0, 1) for point in outer + inner]
+    faces = []
+    for i in range(4):
+        j = (i + 1) % 4
+        faces.append([8 + i, 8 + j, 12 + j, 12 + i])
+        faces.append([i, 4 + i, 4 + j, j])
+        faces.append([i, j, 8 + j, 8 + i])
+        faces.append([4 + i, 12 + i, 12 + j, 4 + j])
+    frame = Polyhedron(vertices, faces)
+
+    areas, perimeters, centroids, _ = frame.get_cross_sections(
+        [0, 0, 1], [0.5, 2], return_shapes=False
+    )
+    assert np.allclose(areas, [12, 0])
+    assert np.allclose(perimeters, [24, 0])
+    assert np.allclose(centroids[0], [0, 0, 0.5])
+    section = frame.get_cross_sections([0, 0, 1], 0.5)
+    assert sorted(polygon.signed_area for polygon in section) == [-4, 16]
+
+    # The plane through the middle cuts the frame into two parts.
+    section = frame.get_cross_sections([0, 1, 0], 0)
+    assert len(section) == 2
+    assert np.allclose([polygon.signed_area for polygon in section], [1, 1])
+
+    # The sections integrate to the volume.
+    offsets = np.linspace(-3, 3, 2001)
+    areas, _, _, _ = frame.get_cross_sections([1, 2, 3], offsets, return_shapes=False)
+    assert np.isclose(np.trapz(areas, offsets), frame.volume, rtol=1e-4)
+
+
+def test_cross_sections_nonconvex_faces():
+    """Slice a star prism, whose bottom face starts at a reflex vertex."""
+    angles = np.linspace(0, 2 * np.pi, 10, endpoint=False)
+    radii = np.where(np.arange(10) % 2, 0.4, 1)
+    ring = np.column_stack((radii * np.cos(angles), radii * np.sin(angles)))
+    vertices = np.concatenate([np.column_stack((ring, np.full(10, z))) for z in (0, 1)])
+    faces = [list(range(9, -1, -1)), list(range(10, 20))] + [
+        [i, (i + 1) % 10, (i + 1) % 10 + 10, i + 10] for i in range(10)
+    ]
+    star = Polyhedron(vertices, faces)
+
+    # The section at x = 0.2 is a union of rectangles spanning the height of
+    # the prism, whose widths are the intervals of the line x = 0.2 inside
+    # the star.
+    x0, y0 = ring.T
+    x1, y1 = np.roll(ring, -1, axis=0).T
+    crossing = (x0 - 0.2) * (x1 - 0.2) < 0
+    heights = np.sort((y0 + (0.2 - x0) / (x1 - x0) * (y1 - y0))[crossing])
+    width = np.sum(heights[1::2] - heights[0::2])
+
+    areas, perimeters, _, _ = star.get_cross_sections(
+        [1, 0, 0], [0.2], return_shapes=False
+    )
+    section = star.get_cross_sections([1, 0, 0], 0.2)
+    assert np.isclose(areas[0], width)
+    assert np.isclose(sum(polygon.signed_area for polygon in section), width)
+    assert np.isclose(perimeters[0], 2 * width + 2 * len(section))
+
+    areas, _, _, _ = star.get_cross_sections([0, 0, 1], [0.5], return_shapes=False)
+    assert np.isclose(areas[0], star.volume)
+
+
+def test_cycle_order():
+    order, offsets = _cycle_order(np.array([1, 2, 0, 4, 3]))
+    assert np.array_equal(offsets, [0, 3, 5])
+    assert np.array_equal(order, [0, 1, 2, 3, 4])
+    with pytest.raises(ValueError):
+        _cycle_order(np.array([1, 2, 1]))
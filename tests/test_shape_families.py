@@ -1,14 +1,24 @@
+import json
+import os
+
 import numpy as np
 import pytest
+from scipy.spatial import ConvexHull
 
+import coxeter
+from coxeter import from_gsd_type_shapes
 from coxeter.families import (
     DOI_SHAPE_REPOSITORIES,
     Family323Plus,
     Family423,
     Family523,
+    PlatonicFamily,
     RegularNGonFamily,
+    TabulatedGSDShapeFamily,
     TruncatedTetrahedronFamily,
+    common,
 )
+from coxeter.families.common import _DATA_FOLDER
 
 
 @pytest.mark.parametrize("n", range(3, 100))
@@ -100,3 +110,206 @@ def test_truncated_tetrahedron():
     tet = family.get_shape(1)
     assert len(tet.vertices) == 6
     assert len(tet.faces) == 8
+
+
+@pytest.mark.parametrize(
+    "family, a_range, b, c_range",
+    [
+        (Family323Plus, (1, 3), 1, (1, 3)),
+        (Family423, (1, 2), 2, (2, 3)),
+        (Family523, (1, Family523.s * np.sqrt(5)), 2, (Family523.S ** 2, 3)),
+    ],
+)
+def test_make_vertices_batch(family, a_range, b, c_range):
+    a, c = np.meshgrid(np.linspace(*a_range, 7), np.linspace(*c_range, 5))
+    batch = family.make_vertices_batch(a, b, c)
+    assert len(batch) == a.size
+    for vertices, a_value, c_value in zip(batch, a.ravel(), c.ravel()):
+        expected = family.make_vertices(a_value, b, c_value)
+        assert np.array_equal(vertices, expected)
+        # Every generated vertex must be a vertex of the convex hull.
+        assert len(ConvexHull(vertices).vertices) == len(vertices)
+
+
+@pytest.mark.parametrize(
+    "family, a_range, c_range",
+    [
+        (Family323Plus, (1, 3), (1, 3)),
+        (Family423, (1, 2), (2, 3)),
+        (Family523, (1, Family523.s * np.sqrt(5)), (Family523.S ** 2, 3)),
+    ],
+)
+def test_get_shapes(family, a_range, c_range):
+    a, c = np.meshgrid(np.linspace(*a_range, 9), np.linspace(*c_range, 9))
+    shapes = family.get_shapes(a, c)
+    assert len(shapes) == a.size
+    for shape, a_value, c_value in zip(shapes, a.ravel(), c.ravel()):
+        expected = family.get_shape(a_value, c_value)
+        assert shape.num_faces == expected.num_faces
+        assert np.isclose(shape.volume, expected.volume)
+        assert np.isclose(shape.surface_area, expected.surface_area)
+        assert np.isclose(shape.mean_curvature, expected.mean_curvature)
+
+    with pytest.raises(ValueError):
+        family.get_shapes([a_range[0], a_range[1] + 1], c_range[0])
+
+
+def test_truncated_tetrahedron_get_shapes():
+    truncations = np.linspace(0, 1, 11)
+    shapes = TruncatedTetrahedronFamily.get_shapes(truncations)
+    for shape, truncation in zip(shapes, truncations):
+        expected = TruncatedTetrahedronFamily.get_shape(truncation)
+        assert shape.num_faces == expected.num_faces
+        assert np.isclose(shape.volume, expected.volume)
+
+    with pytest.raises(ValueError):
+        TruncatedTetrahedronFamily.get_shapes([0.5, 1.5])
+
+
+@pytest.mark.parametrize(
+    "family, a_range, c_range",
+    [
+        (Family323Plus, (1, 3), (1, 3)),
+        (Family423, (1, 2), (2, 3)),
+        (Family523, (1, Family523.s * np.sqrt(5)), (Family523.S ** 2, 3)),
+    ],
+)
+def test_get_properties(family, a_range, c_range):
+    a, c = np.meshgrid(np.linspace(*a_range, 6), np.linspace(*c_range, 4))
+    properties = family.get_properties(a, c)
+    for key, values in properties.items():
+        assert values.shape == a.shape
+        expected = [
+            getattr(family.get_shape(a_value, c_value), key)
+            for a_value, c_value in zip(a.ravel(), c.ravel())
+        ]
+        assert np.allclose(values.ravel(), expected)
+
+
+def test_truncated_tetrahedron_get_properties():
+    truncations = np.linspace(0, 1, 11)
+    properties = TruncatedTetrahedronFamily.get_properties(truncations)
+    for i, truncation in enumerate(truncations):
+        expected = TruncatedTetrahedronFamily.get_shape(truncation)
+        assert np.isclose(properties["volume"][i], expected.volume)
+        assert np.isclose(properties["asphericity"][i], expected.asphericity)
+
+
+def test_shape_cache():
+    assert PlatonicFamily.cache_info() is None
+    PlatonicFamily.enable_cache(maxsize=2)
+    try:
+        cube = PlatonicFamily.get_shape("Cube")
+        cached_cube = PlatonicFamily.get_shape("Cube")
+        assert cube is not cached_cube
+        assert np.array_equal(cube.vertices, cached_cube.vertices)
+        assert PlatonicFamily.cache_info() == (1, 1, 2, 1)
+
+        # Modifying a returned shape must not affect the cache.
+        cube.volume = 27
+        assert np.isclose(PlatonicFamily.get_shape("Cube").volume, 1)
+
+        # The least recently used shape is evicted.
+        PlatonicFamily.get_shape("Octahedron")
+        PlatonicFamily.get_shape("Tetrahedron")
+        assert PlatonicFamily.cache_info() == (2, 3, 2, 2)
+        PlatonicFamily.get_shape("Cube")
+        assert PlatonicFamily.cache_info() == (2, 4, 2, 2)
+
+        PlatonicFamily.clear_cache()
+        assert PlatonicFamily.cache_info() == (0, 0, 2, 0)
+    finally:
+        PlatonicFamily.disable_cache()
+    assert PlatonicFamily.cache_info() is None
+
+
+def test_shape_cache_nested():
+    """Calls to a parent family's get_shape are not cached separately."""
+    TruncatedTetrahedronFamily.enable_cache()
+    try:
+        first = TruncatedTetrahedronFamily.get_shape(0.5)
+        second = TruncatedTetrahedronFamily.get_shape(0.5)
+        assert np.array_equal(first.vertices, second.vertices)
+        assert TruncatedTetrahedronFamily.cache_info() == (1, 1, 128, 1)
+        assert Family323Plus.cache_info() is None
+
+        # Equal arguments share cache entries, and arguments that cannot be
+        # hashed bypass the cache.
+        RegularNGonFamily.enable_cache()
+        RegularNGonFamily.get_shape(4)
+        RegularNGonFamily.get_shape(np.int64(4))
+        RegularNGonFamily.get_shape(np.array(4))
+        assert RegularNGonFamily.cache_info() == (1, 1, 128, 1)
+    finally:
+        TruncatedTetrahedronFamily.disable_cache()
+        RegularNGonFamily.disable_cache()
+
+
+def test_binary_cache(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("COXETER_CACHE_DIR", str(cache_dir))
+    with open(os.path.join(_DATA_FOLDER, "science1220869.json")) as f:
+        data = json.load(f)
+    # Add a shape that is not a convex polyhedron, which must not be cached.
+    data["sphere"] = {"type": "Sphere", "diameter": 2}
+    filename = tmp_path / "shapes.json"
+    with open(filename, "w") as f:
+        json.dump(data, f)
+
+    def check_family(family):
+        for key, params in data.items():
+            shape = family.get_shape(key)
+            expected = from_gsd_type_shapes(params)
+            assert type(shape) is type(expected)
+            if key == "sphere":
+                continue
+            assert np.array_equal(shape.vertices, expected.vertices)
+            assert len(shape.faces) == len(expected.faces)
+            for face, expected_face in zip(shape.faces, expected.faces):
+                assert np.array_equal(face, expected_face)
+            for neighbors, expected_neighbors in zip(
+                shape.neighbors, expected.neighbors
+            ):
+                assert np.array_equal(neighbors, expected_neighbors)
+            assert np.allclose(shape.normals, expected.normals)
+            assert np.isclose(shape.volume, expected.volume)
+
+    family = TabulatedGSDShapeFamily.from_json_file(filename, binary_cache=True)
+    check_family(family)
+    (entry,) = os.listdir(cache_dir)
+    assert len(family._get_packed_table()) == len(data) - 1
+
+    # A new family reads the cache, and returned shapes do not share memory
+    # with it.
+    family = TabulatedGSDShapeFamily.from_json_file(filename, binary_cache=True)
+    arrays = family._get_packed_table().shapes._arrays
+    assert isinstance(arrays["vertices"], np.memmap)
+    check_family(family)
+    shape = family.get_shape(next(iter(data)))
+    shape.volume = 5
+    assert not np.shares_memory(shape.vertices, arrays["vertices"])
+
+    # Modifying the file invalidates the cache.
+    del data["sphere"]
+    with open(filename, "w") as f:
+        json.dump(data, f)
+    family = TabulatedGSDShapeFamily.from_json_file(filename, binary_cache=True)
+    check_family(family)
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_binary_cache_opt_in(tmp_path, monkeypatch):
+    """The bundled datasets only use the binary cache if requested."""
+    monkeypatch.setenv("COXETER_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("COXETER_BINARY_CACHE", raising=False)
+    family = common._make_platonic_family()
+    assert family._get_packed_table() is None
+    family.get_shape("Cube")
+    assert os.listdir(tmp_path) == []
+
+    monkeypatch.setenv("COXETER_BINARY_CACHE", "1")
+    family = common._make_platonic_family()
+    assert np.isclose(family.get_shape("Cube").volume, 1)
+    assert len(family._get_packed_table()) == len(family.data)
+    (entry,) = os.listdir(tmp_path)
+    assert coxeter.__version__ in entry
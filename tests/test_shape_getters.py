@@ -1,6 +1,8 @@
 import numpy as np
+import pytest
 
-from coxeter import from_gsd_type_shapes
+from coxeter import from_gsd_type_shapes, from_gsd_type_shapes_batch
+from coxeter.families import RegularNGonFamily
 
 
 def test_gsd_shape_getter():
@@ -90,3 +92,58 @@ def test_gsd_shape_getter():
 
         # Now convert back and make sure the conversion is lossless.
         assert shape.gsd_shape_spec == shape_spec
+
+
+def test_gsd_shape_getter_batch():
+    square = [[0, 0, 0], [0, 1, 0], [1, 1, 0], [1, 0, 0]]
+    nonconvex = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0.5, 0.5, 0], [0, 1, 0]]
+    specs = [
+        {"type": "Polygon", "vertices": square},
+        {"type": "Sphere", "diameter": 1},
+        {"type": "Polygon", "vertices": nonconvex},
+        {"type": "Polygon", "vertices": np.array(square)},
+        {"type": "Ellipsoid", "a": 1, "b": 2, "c": 2},
+        {"type": "Polygon", "vertices": square, "rounding_radius": 1},
+        {"type": "Sphere", "diameter": 1},
+        {"type": "Polygon", "vertices": nonconvex},
+    ]
+    for n in range(3, 10):
+        specs.append(RegularNGonFamily.get_shape(n).gsd_shape_spec)
+    specs.append({"type": "ConvexPolyhedron", "vertices": np.random.rand(20, 3)})
+
+    cache = {}
+    shapes = from_gsd_type_shapes_batch(specs, cache=cache)
+    assert len(shapes) == len(specs)
+    for spec, shape in zip(specs, shapes):
+        expected = from_gsd_type_shapes(spec)
+        assert type(shape) is type(expected)
+        assert shape.gsd_shape_spec == expected.gsd_shape_spec
+
+    # Identical specs map to the same shape, including across calls.
+    assert shapes[0] is shapes[3]
+    assert shapes[1] is shapes[6]
+    assert shapes[2] is shapes[7]
+    assert len(cache) == len(specs) - 3
+    assert from_gsd_type_shapes_batch(specs[:2], cache=cache) == shapes[:2]
+
+    # Circles and spheres are distinguished by the dimensions.
+    circle, sphere = from_gsd_type_shapes_batch(
+        specs[1:2], dimensions=2, cache=cache
+    ) + from_gsd_type_shapes_batch(specs[1:2], cache=cache)
+    assert type(circle).__name__ == "Circle"
+    assert sphere is shapes[1]
+
+
+def test_gsd_shape_getter_batch_invalid():
+    # A self-intersecting polygon whose vertices do not all lie on the hull.
+    bowtie = {
+        "type": "Polygon",
+        "vertices": [[0, 0], [1, 1], [1, 0], [0, 1], [0.5, 0.2]],
+    }
+    square = {"type": "Polygon", "vertices": [[0, 0], [1, 0], [1, 1], [0, 1]]}
+    cache = {}
+    with pytest.raises(ValueError):
+        from_gsd_type_shapes(bowtie)
+    with pytest.raises(ValueError):
+        from_gsd_type_shapes_batch([square, bowtie], cache=cache)
+    assert len(cache) == 0
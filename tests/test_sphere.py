@@ -165,3 +165,23 @@ def test_form_factor():
         ],
         atol=1e-7,
     )
+
+
+def test_sample():
+    sphere = Sphere(2, center=(1, 2, 3))
+    points = sphere.sample_volume(100000, rng=0)
+    assert points.shape == (100000, 3)
+    assert np.all(sphere.is_inside(points))
+    distances = np.linalg.norm(points - sphere.center, axis=1)
+    assert np.mean(distances < 1) == approx(1 / 8, abs=0.01)
+    assert np.allclose(np.mean(points, axis=0), sphere.center, atol=0.02)
+    assert np.array_equal(points, sphere.sample_volume(100000, rng=0))
+
+    points = sphere.sample_surface(100000, rng=np.random.default_rng(1))
+    assert np.allclose(np.linalg.norm(points - sphere.center, axis=1), 2)
+    assert np.allclose(np.mean(points, axis=0), sphere.center, atol=0.02)
+
+
+@given(floats(0.1, 1000))
+def test_mean_curvature(r):
+    assert Sphere(r).mean_curvature == r
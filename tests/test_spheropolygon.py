@@ -209,3 +209,27 @@ def test_perimeter_setter(unit_rounded_square, perimeter):
     unit_rounded_square.perimeter = original_perimeter
     assert unit_rounded_square.perimeter == approx(original_perimeter)
     assert unit_rounded_square.radius == approx(1.0)
+
+
+@pytest.mark.parametrize("clockwise", [False, True])
+def test_sample(clockwise):
+    vertices = np.array([[0, 0], [1, 0], [1, 1], [0, 1]])
+    if clockwise:
+        vertices = vertices[::-1]
+    shape = ConvexSpheropolygon(vertices, radius=0.5)
+
+    def distances(points):
+        assert np.allclose(points[:, 2], 0)
+        return np.linalg.norm(np.maximum(np.abs(points[:, :2] - 0.5) - 0.5, 0), axis=1)
+
+    points = shape.sample_volume(100000, rng=0)
+    assert np.all(distances(points) <= 0.5 + 1e-12)
+    rounded_fraction = (4 * 0.5 + np.pi * 0.25) / shape.area
+    assert np.mean(distances(points) > 0) == approx(rounded_fraction, abs=0.01)
+    assert np.allclose(np.mean(points, axis=0), [0.5, 0.5, 0], atol=0.01)
+
+    points = shape.sample_surface(100000, rng=0)
+    assert np.allclose(distances(points), 0.5)
+    corner_fraction = np.pi / shape.perimeter
+    in_corners = np.all(np.abs(points[:, :2] - 0.5) > 0.5, axis=1)
+    assert np.mean(in_corners) == approx(corner_fraction, abs=0.01)
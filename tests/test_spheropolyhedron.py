@@ -4,6 +4,8 @@ from hypothesis import given
 from hypothesis.strategies import floats
 
 from conftest import make_sphero_cube
+from coxeter.families import PlatonicFamily
+from coxeter.shapes import ConvexSpheropolyhedron
 
 
 @given(radius=floats(0.1, 1))
@@ -104,3 +106,51 @@ def test_inside_boundaries():
     assert np.all(sphero_cube.is_inside(verts * (1 + 2 * np.sqrt(1 / 3))))
     # Points are just outside the very corners of the spherical caps
     assert np.all(~sphero_cube.is_inside(verts * (1 + 2 * np.sqrt(1 / 3) + 1e-6)))
+
+
+def test_sample():
+    shape = make_sphero_cube(radius=0.5)
+    shape.center = (0, 0, 0)
+    half = np.max(shape.vertices)
+
+    def distances(points):
+        return np.linalg.norm(np.maximum(np.abs(points) - half, 0), axis=1)
+
+    points = shape.sample_volume(100000, rng=0)
+    assert np.all(distances(points) <= 0.5 + 1e-12)
+    assert np.all(shape.is_inside(points))
+    corner_fraction = 4 / 3 * np.pi * 0.5 ** 3 / shape.volume
+    in_corners = np.all(np.abs(points) > half, axis=1)
+    assert np.mean(in_corners) == pytest.approx(corner_fraction, abs=0.01)
+    assert np.allclose(np.mean(points, axis=0), 0, atol=0.02)
+
+    points = shape.sample_surface(100000, rng=0)
+    assert np.allclose(distances(points), 0.5)
+    corner_fraction = 4 * np.pi * 0.5 ** 2 / shape.surface_area
+    in_corners = np.all(np.abs(points) > half, axis=1)
+    assert np.mean(in_corners) == pytest.approx(corner_fraction, abs=0.01)
+
+
+@given(radius=floats(0.1, 1))
+def test_volume_surface_area_tetrahedron(radius):
+    """The rounded edges of a tetrahedron span its exterior angles."""
+    tetrahedron = PlatonicFamily.get_shape("Tetrahedron")
+    shape = ConvexSpheropolyhedron(tetrahedron.vertices, radius)
+    # The rounded edges sum up to a cylinder of length 6 times the edge length
+    # times the fraction of the exterior angle in a full circle.
+    edge_length = np.linalg.norm(tetrahedron.vertices[0] - tetrahedron.vertices[1])
+    fraction = 6 * edge_length * (np.pi - np.arccos(1 / 3)) / (2 * np.pi)
+    volume = (
+        tetrahedron.volume
+        + tetrahedron.surface_area * radius
+        + fraction * np.pi * radius ** 2
+        + 4 / 3 * np.pi * radius ** 3
+    )
+    area = (
+        tetrahedron.surface_area
+        + fraction * 2 * np.pi * radius
+        + 4 * np.pi * radius ** 2
+    )
+    assert np.isclose(shape.volume, volume)
+    assert np.isclose(shape.surface_area, area)
+    assert np.isclose(shape.mean_curvature, tetrahedron.mean_curvature + radius)
@@ -0,0 +1,154 @@
+import numpy as np
+import pytest
+import rowan
+from hypothesis import given, settings
+from hypothesis.strategies import floats, integers
+from scipy.spatial import ConvexHull
+
+from coxeter.families import PlatonicFamily
+from coxeter.shapes import (
+    ConvexPolyhedron,
+    ConvexSpheropolyhedron,
+    Ellipsoid,
+    Polyhedron,
+    Sphere,
+    excluded_volume,
+    sample_excluded_volume,
+    second_virial_coefficient,
+)
+
+
+def minkowski_difference(first, second, orientation):
+    """Get the vertices of the sum of a polyhedron and a rotated, reflected one."""
+    rotated = rowan.rotate(orientation, second.vertices - second.center)
+    return (first.vertices[:, np.newaxis] - rotated[np.newaxis]).reshape(-1, 3)
+
+
+@given(floats(0.1, 10), floats(0.1, 10))
+def test_spheres(r1, r2):
+    expected = 4 / 3 * np.pi * (r1 + r2) ** 3
+    first, second = Sphere(r1), Sphere(r2, center=(1, 2, 3))
+    assert np.isclose(excluded_volume(first, second), expected)
+    assert np.allclose(excluded_volume(first, second, rowan.random.rand(3)), expected)
+    assert np.isclose(second_virial_coefficient(first), 16 / 3 * np.pi * r1 ** 3)
+
+
+@settings(deadline=500)
+@given(integers(0, 2 ** 31))
+def test_polyhedra(seed):
+    rng = np.random.default_rng(seed)
+    first = ConvexPolyhedron(rng.normal(size=(10, 3)))
+    second = ConvexPolyhedron(rng.normal(size=(8, 3)) + 5)
+    orientations = rowan.normalize(rng.normal(size=(5, 4)))
+
+    expected = [
+        ConvexHull(minkowski_difference(first, second, orientation)).volume
+        for orientation in orientations
+    ]
+    assert np.allclose(excluded_volume(first, second, orientations), expected)
+
+
+@settings(deadline=500)
+@given(integers(0, 2 ** 31), floats(0, 1), floats(0.1, 1))
+def test_spheropolyhedra(seed, r1, r2):
+    rng = np.random.default_rng(seed)
+    first = ConvexPolyhedron(rng.normal(size=(10, 3)))
+    second = ConvexPolyhedron(rng.normal(size=(8, 3)))
+    orientations = rowan.normalize(rng.normal(size=(5, 4)))
+
+    # The excluded volume is the Minkowski sum rounded by both radii.
+    expected = [
+        ConvexSpheropolyhedron(
+            minkowski_difference(first, second, orientation), r1 + r2
+        ).volume
+        for orientation in orientations
+    ]
+    volumes = excluded_volume(
+        ConvexSpheropolyhedron(first.vertices, r1),
+        ConvexSpheropolyhedron(second.vertices, r2),
+        orientations,
+    )
+    assert np.allclose(volumes, expected)
+
+    expected = [ConvexSpheropolyhedron(first.vertices, r1 + r2).volume] * len(
+        orientations
+    )
+    volumes = excluded_volume(
+        ConvexSpheropolyhedron(first.vertices, r1), Sphere(r2), orientations
+    )
+    assert np.allclose(volumes, expected)
+
+
+@pytest.mark.parametrize("radius", [0, 0.5])
+def test_degenerate_orientations(radius):
+    """Test orientations at which faces and edges of the shapes are parallel."""
+    cube = PlatonicFamily.get_shape("Cube")
+    shape = ConvexSpheropolyhedron(cube.vertices, radius)
+    orientations = [
+        [1, 0, 0, 0],
+        rowan.from_axis_angle([0, 0, 1], np.pi / 2),
+        rowan.from_axis_angle([0, 0, 1], np.pi / 4),
+        rowan.from_axis_angle([1, 1, 1], 2 * np.pi / 3),
+    ]
+    expected = [
+        ConvexSpheropolyhedron(
+            minkowski_difference(cube, cube, orientation), 2 * radius
+        ).volume
+        for orientation in orientations
+    ]
+    assert np.allclose(excluded_volume(shape, orientations=orientations), expected)
+
+
+def test_ellipsoids():
+    ellipsoid = Ellipsoid(1, 2, 0.5)
+    # Aligned copies of an ellipsoid sum up to an ellipsoid twice its size.
+    assert np.isclose(
+        excluded_volume(ellipsoid, orientations=[[1, 0, 0, 0]]), 8 * ellipsoid.volume
+    )
+
+    # An ellipsoid with equal axes is a sphere.
+    cube = PlatonicFamily.get_shape("Cube")
+    shape = ConvexSpheropolyhedron(cube.vertices, 0.2)
+    orientations = rowan.random.rand(3)
+    expected = ConvexSpheropolyhedron(cube.vertices, 0.7).volume
+    volumes = excluded_volume(
+        Ellipsoid(0.5, 0.5, 0.5), shape, orientations, quadrature_order=64
+    )
+    assert np.allclose(volumes, expected, rtol=1e-4)
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        (PlatonicFamily.get_shape("Tetrahedron"), None),
+        (
+            PlatonicFamily.get_shape("Octahedron"),
+            ConvexSpheropolyhedron(PlatonicFamily.get_shape("Cube").vertices, 0.3),
+        ),
+        (Ellipsoid(1, 2, 0.5), Ellipsoid(0.3, 1.5, 1)),
+        (Ellipsoid(1, 2, 0.5), PlatonicFamily.get_shape("Cube")),
+    ],
+)
+def test_average(first, second):
+    """The closed form average agrees with sampled orientations."""
+    volume, error = sample_excluded_volume(
+        first, second, n=2000, rng=0, quadrature_order=16
+    )
+    assert excluded_volume(first, second) == pytest.approx(volume, abs=4 * error)
+
+
+def test_second_virial_coefficient():
+    # The unit cube has V = 1, S = 6, and R = 3 / 4.
+    cube = PlatonicFamily.get_shape("Cube")
+    assert np.isclose(second_virial_coefficient(cube), 5.5)
+    sphere = Sphere(1)
+    assert np.isclose(
+        second_virial_coefficient(cube, sphere),
+        excluded_volume(cube, sphere) / 2,
+    )
+
+
+def test_invalid_shape():
+    cube = PlatonicFamily.get_shape("Cube")
+    with pytest.raises(TypeError):
+        excluded_volume(cube, Polyhedron(cube.vertices, cube.faces))